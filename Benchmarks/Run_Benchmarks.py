@@ -0,0 +1,160 @@
+"""
+Benchmark suite for the race-weekend pipeline on seeded synthetic data (Synthetic_Data.py):
+lap-time parsing (scalar and vectorized), prepare_lap_features, the Plotly figure builders,
+the stint cost behind simulate_stint, the Monte Carlo engine, the Safety Car model and telemetry
+decimation. Each case is timed over several repeats; results are written as JSON and can be
+compared with an earlier run to flag regressions.
+
+Usage:
+    python Run_Benchmarks.py --scale race --json results.json
+    python Run_Benchmarks.py --scale season --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+for step in ("Step 2", "Step 3", "Step 4"):
+    sys.path.insert(0, str(ROOT / step))
+
+from Synthetic_Data import SCALES, synthetic_season, synthetic_telemetry  # noqa: E402
+
+REPEAT = 5
+TOLERANCE = 0.2   # slower by more than 20% than the baseline → regression
+
+
+# Function: Time a callable → {"best", "median", "repeat"} in seconds (one warm-up call first)
+def measure(func, repeat: int = REPEAT) -> dict:
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+# Function: Benchmark cases for a given number of races → {name: (callable, items, unit)}
+# items/unit give the throughput reported next to the time (e.g. laps per second)
+# out_dir → scratch directory for the processed CSVs (owned and cleaned up by the caller)
+def build_cases(races: int, out_dir: str | Path, seed: int = 0, sims: int = 100_000) -> dict:
+    from Data_Loader import prepare_lap_features
+    from Monte_Carlo_Engine import DEG_PARAMS, SOFT_MEDIUM, simulate_race_times
+    from Plotting_Prototypes import fuel_burn, stint_pace, tire_degradation
+    from Safety_Car import safety_car_masks, simulate_race_times_sc
+    from Stint_Cost_Table import stint_cost_table
+    from Telemetry_Decimation import decimate_telemetry
+    from Time_Conversions import convert_series_to_seconds, convert_to_seconds
+
+    season = synthetic_season(races, seed=seed)
+    laps = pd.concat(season, ignore_index=True)
+    processed = prepare_lap_features(season[0].drop(columns="GP"), Path(out_dir) / "fixtures")[0]
+    driver = processed["Driver"].iloc[0]
+    telemetry = synthetic_telemetry(laps=20 * races, seed=seed)
+    rng = np.random.default_rng(seed)
+    stint_laps = rng.integers(1, 40, 100_000)
+
+    # Every call writes into a fresh directory, so each repeat does the full processing and writes
+    runs = itertools.count()
+
+    def prepare_all():
+        run_dir = Path(out_dir) / f"prepare_{next(runs)}"
+        for race in season:
+            prepare_lap_features(race.drop(columns="GP"), run_dir, 2025, race["GP"].iloc[0], "R")
+
+    return {
+        "convert_to_seconds": (lambda: laps["LapTime"].map(convert_to_seconds), len(laps), "laps"),
+        "convert_series_to_seconds": (lambda: convert_series_to_seconds(laps["LapTime"]), len(laps), "laps"),
+        "prepare_lap_features": (prepare_all, len(laps), "laps"),
+        "stint_pace": (lambda: stint_pace(processed, driver), 1, "figures"),
+        "tire_degradation": (lambda: tire_degradation(processed, driver), 1, "figures"),
+        "fuel_burn": (lambda: fuel_burn(processed.copy(), driver), 1, "figures"),
+        "simulate_stint": (
+            lambda: stint_cost_table(DEG_PARAMS).stint_cost("Soft", stint_laps), len(stint_laps), "stints"
+        ),
+        "simulate_race_times": (
+            lambda: simulate_race_times(SOFT_MEDIUM, sims, np.random.default_rng(seed)), sims, "races"
+        ),
+        "safety_car_masks": (lambda: safety_car_masks(sims, np.random.default_rng(seed)), sims, "races"),
+        "simulate_race_times_sc": (lambda: simulate_race_times_sc(n=sims, rng=np.random.default_rng(seed)), sims, "races"),
+        "decimate_telemetry": (lambda: decimate_telemetry(telemetry), len(telemetry), "samples"),
+    }
+
+
+# Function: Run the suite → report dict (environment, scale and one entry per case)
+def run_suite(scale: str = "race", repeat: int = REPEAT, seed: int = 0, only=None, verbose: bool = True) -> dict:
+    races = SCALES[scale]
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as out_dir:
+        cases = build_cases(races, out_dir, seed)
+        for name, (func, items, unit) in cases.items():
+            if only and name not in only:
+                continue
+            timing = measure(func, repeat)
+            timing["throughput"] = items / timing["best"]
+            timing["unit"] = f"{unit}/s"
+            results[name] = timing
+            if verbose:
+                print(f"{name:<28} best {timing['best'] * 1000:10.2f} ms   {timing['throughput']:14,.0f} {unit}/s")
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "scale": scale,
+        "races": races,
+        "seed": seed,
+        "results": results,
+    }
+
+
+# Function: Compare two reports → {case: ratio of best times} for the cases slower than tolerance
+def regressions(report: dict, baseline: dict, tolerance: float = TOLERANCE) -> dict:
+    slower = {}
+    for name, result in report["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is not None and result["best"] > before["best"] * (1 + tolerance):
+            slower[name] = round(result["best"] / before["best"], 3)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race-weekend pipeline benchmarks on synthetic data")
+    parser.add_argument("--scale", choices=list(SCALES), default="race")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", help="run only these cases")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.scale, args.repeat, args.seed, args.only)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("scale") != report["scale"]:
+            print(f"Warning: baseline scale '{baseline.get('scale')}' differs from '{report['scale']}'")
+        slower = regressions(report, baseline, args.tolerance)
+        for name, ratio in slower.items():
+            print(f"REGRESSION {name}: {ratio:.2f}x the baseline time")
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Seeded generators of synthetic race data at realistic scale, for benchmarks: raw lap tables in the
+FastF1 CSV export layout (Driver, Stint, Compound, LapNumber, TyreLife, Team, LapTime as
+"0 days 00:01:38.693000" strings) for one race up to a full season, and distance-indexed car
+telemetry (Distance, Speed, Throttle, Brake, nGear, RPM, Time) for any number of laps.
+The same seed always gives the same data.
+"""
+import numpy as np
+import pandas as pd
+
+# Block: Season shape
+DRIVERS = [
+    "VER", "TSU", "LEC", "HAM", "NOR", "PIA", "RUS", "ANT", "ALO", "STR",
+    "GAS", "COL", "OCO", "BEA", "ALB", "SAI", "HUL", "BOR", "LAW", "HAD",
+]
+TEAMS = [
+    "Red Bull", "Red Bull", "Ferrari", "Ferrari", "McLaren", "McLaren", "Mercedes", "Mercedes", "Aston Martin",
+    "Aston Martin", "Alpine", "Alpine", "Haas", "Haas", "Williams", "Williams", "Sauber", "Sauber", "RB", "RB",
+]
+SEASON_RACES = 24
+RACE_LAPS = 57
+COMPOUNDS = ["SOFT", "MEDIUM", "HARD"]
+DEGRADATION = {"SOFT": (0.5, 0.08), "MEDIUM": (0.3, 0.05), "HARD": (0.2, 0.03)}  # a, b of a*sqrt(k) + b*k
+
+# Scales used by the benchmark suite (number of races)
+SCALES = {"race": 1, "quarter": 6, "season": SEASON_RACES}
+
+
+# Function: Format lap times (s) like FastF1's CSV export, "0 days 00:01:38.693000"
+def format_lap_times(seconds: np.ndarray) -> np.ndarray:
+    micros = np.round(np.asarray(seconds) * 1e6).astype(np.int64)
+    minutes, micros = np.divmod(micros, 60_000_000)
+    secs, micros = np.divmod(micros, 1_000_000)
+    return np.char.add(
+        np.char.add(np.char.add("0 days 00:", np.char.zfill(minutes.astype(str), 2)), ":"),
+        np.char.add(np.char.add(np.char.zfill(secs.astype(str), 2), "."), np.char.zfill(micros.astype(str), 6)),
+    )
+
+
+# Function: Raw laps of one race → DataFrame in the FastF1 CSV layout (+ GP column)
+# 1–3 stops per driver, tyre degradation + fuel burn + noise, slow in/out laps,
+# and ~0.5% of laps without a time (like deleted or incomplete laps)
+def synthetic_race(gp: str = "Synthetic", race_laps: int = RACE_LAPS, drivers=DRIVERS, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n_drivers = len(drivers)
+    lap = np.tile(np.arange(1, race_laps + 1), n_drivers)
+    driver = np.repeat(np.arange(n_drivers), race_laps)
+
+    # Stints: sorted pit laps per driver → stint number and lap in stint for every lap
+    stops = rng.integers(1, 4, n_drivers)
+    pit = np.full((n_drivers, 3), race_laps + 1)
+    for d in range(n_drivers):
+        pit[d, :stops[d]] = np.sort(rng.choice(np.arange(8, race_laps - 5), stops[d], replace=False))
+    stint = 1 + (lap[:, None] > pit[driver]).sum(axis=1)
+    stint_start = np.where(stint > 1, pit[driver, np.maximum(stint - 2, 0)] + 1, 1)
+    tyre_age = lap - stint_start
+    compound = rng.integers(0, 3, (n_drivers, 4))[driver, stint - 1]
+    a, b = np.array([DEGRADATION[c] for c in COMPOUNDS]).T
+
+    pace = 90 + rng.normal(0, 0.6, n_drivers)[driver] + 0.3 * compound   # softer compound, faster lap
+    seconds = (
+        pace + a[compound] * np.sqrt(tyre_age) + b[compound] * tyre_age
+        - (lap - 1) * (100 / race_laps) * 0.03
+        + rng.normal(0, 0.25, len(lap))
+    )
+    seconds += np.where(tyre_age == 0, 20.0, 0.0) + np.where(lap == 1, 6.0, 0.0)  # out laps, standing start
+    lap_time = format_lap_times(seconds).astype(object)
+    lap_time[rng.random(len(lap)) < 0.005] = np.nan
+
+    return pd.DataFrame({
+        "Driver": np.asarray(drivers)[driver],
+        "Stint": stint.astype(float),
+        "Compound": np.asarray(COMPOUNDS)[compound],
+        "LapNumber": lap.astype(float),
+        "TyreLife": (tyre_age + 1).astype(float),
+        "Team": np.asarray(TEAMS[:n_drivers])[driver],
+        "LapTime": lap_time,
+        "GP": gp,
+    })
+
+
+# Function: Raw laps of n races (one DataFrame per race, each with its own seed)
+def synthetic_season(races: int = SEASON_RACES, seed: int = 0, **kwargs):
+    return [synthetic_race(f"Race{i + 1:02d}", seed=seed * 1000 + i, **kwargs) for i in range(races)]
+
+
+# Function: Distance-indexed car telemetry of n consecutive laps (~4 Hz like FastF1 car data)
+def synthetic_telemetry(laps: int = 1, lap_length: float = 5412.0, hz: float = 4.0, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    samples = int(laps * 92 * hz)
+    # Speed profile: straights and corners along the lap, plus noise
+    time = np.arange(samples) / hz
+    phase = np.cumsum(np.full(samples, 1.0 / hz)) / 92 * 2 * np.pi * 7
+    speed = np.clip(205 + 95 * np.sin(phase) + rng.normal(0, 2.0, samples), 70, 340)
+    distance = np.r_[0.0, np.cumsum(speed[1:] / 3.6 / hz)]
+    distance *= laps * lap_length / distance[-1]
+    throttle = np.clip((speed - 120) * 0.6 + rng.normal(0, 3, samples), 0, 100)
+    brake = np.gradient(speed) < -4
+    gear = np.clip(np.digitize(speed, [90, 130, 165, 200, 235, 270, 300]) + 1, 1, 8)
+    return pd.DataFrame({
+        "Distance": distance,
+        "Speed": speed,
+        "Throttle": throttle,
+        "Brake": brake,
+        "nGear": gear,
+        "RPM": 7000 + (speed % 40) * 150,
+        "Time": pd.to_timedelta(time, unit="s"),
+    })
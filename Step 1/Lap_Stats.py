@@ -6,27 +6,16 @@ and a scatter plot of speed vs. lap time.
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from Lap_Stats_Engine import iter_deltas, lap_stats
 
 sns.set_theme(style="whitegrid") # pleasant-looking style
 
-# Load the CSV file
+# Note: The conversion to seconds, the "LapTimeSeconds" and "DeltaTime" columns and the
+# best lap time come from the streaming engine (Lap_Stats_Engine.py, also used by Pandas_Telemetry):
+# a first pass finds the best lap, a second pass adds the delta to every row.
 # Check "sample.csv" file
-df = pd.read_csv("sample.csv") 
-df.head()
-
-# Note: The function convert_to_seconds, along with the creation of the
-# "LapTimeSeconds" and "DeltaTime" columns, and the calculation of the
-# best lap time, were already introduced earlier in the Pandas_Telemetry file.
-def convert_to_seconds(time_str):
-    try:
-        minutes, seconds = time_str.split(":")
-        return int(minutes) * 60 + float(seconds)
-    except:
-        return np.nan
-
-df["LapTimeSeconds"] = df["LapTime"].apply(convert_to_seconds)
-best_time = df["LapTimeSeconds"].min()
-df["DeltaTime"] = df["LapTimeSeconds"] - best_time
+best_time = lap_stats("sample.csv").best_time
+df = pd.concat(iter_deltas("sample.csv", best_time, dropna=False))
 pd.concat([df.head(10), df.tail(10)])
 
 # Plot 1
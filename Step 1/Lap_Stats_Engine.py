@@ -0,0 +1,216 @@
+"""
+Streaming lap-statistics engine: reads lap tables (Driver, Lap, LapTime as 'mm:ss.s') in chunks,
+parses the lap times in bulk and keeps per-driver laps, mean, best and worst lap plus the
+session-best holder in one pass, in memory bounded by the chunk size. Partial results (one per
+file, season or worker) can be merged afterwards. DeltaTime to the session best is computed by
+a second streaming pass that writes the rows out chunk by chunk.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Rows per chunk when reading CSV files
+CHUNK_ROWS = 250_000
+# Powers of ten for the digit matrices (float64: exact for the integers below 2**53 used here)
+_POW10 = 10.0 ** np.arange(16)
+
+
+# Function: Convert 'minutes:seconds' format to total seconds (scalar, one string at a time)
+def convert_to_seconds(time_str):
+    try:
+        minutes, seconds = time_str.split(":")
+        return int(minutes) * 60 + float(seconds)
+    except Exception:
+        return np.nan
+
+
+# Function: Layout of a 'M…M:SS[.f…]' string → (colon index, dot index or None), None otherwise
+# At most 9 minute digits and 15 second digits, so every value stays exact in float64
+def _lap_time_layout(text: str):
+    minutes, sep, seconds = text.partition(":")
+    whole, dot, fraction = seconds.partition(".")
+    if not (sep and minutes.isascii() and minutes.isdigit() and len(minutes) <= 9):
+        return None
+    if not (whole + fraction).isascii() or not (whole + fraction).isdigit() or len(whole + fraction) > 15:
+        return None
+    return len(minutes), (len(minutes) + 1 + len(whole)) if dot else None
+
+
+# Function: Convert a whole Series of 'minutes:seconds' strings to seconds in bulk (invalid → NaN)
+# Rows are grouped by string length; each group is parsed as a (rows × characters) digit matrix
+# for the layout of its first row (e.g. 'MM:SS.f'); rows that do not share that layout (signs,
+# spaces, exponents, malformed) go through convert_to_seconds. Same results as the scalar function.
+def parse_lap_times(times: pd.Series) -> pd.Series:
+    times = pd.Series(times)
+    seconds = np.full(len(times), np.nan)
+    present = times.notna().to_numpy()
+    fast = np.zeros(len(times), dtype=bool)
+
+    if present.any():
+        text = times.to_numpy(dtype=str)
+        chars = text.view(np.uint32).reshape(len(text), text.itemsize // 4)
+        lengths = (chars != 0).sum(axis=1)
+        for length in np.unique(lengths[present]):
+            rows = np.flatnonzero(present & (lengths == length))
+            layout = _lap_time_layout(text[rows[0]])
+            if layout is None:
+                continue
+            colon, dot = layout
+            head = chars[rows, :length]
+            template = head[0]
+            digit_slots = (template >= ord("0")) & (template <= ord("9"))
+            is_digit = (head >= ord("0")) & (head <= ord("9"))
+            match = np.where(digit_slots, is_digit, head == template).all(axis=1)
+            rows, head = rows[match], head[match].astype(float) - ord("0")
+
+            minute_cols = np.arange(colon)
+            second_cols = np.array([c for c in range(colon + 1, length) if c != dot])
+            minutes = head[:, minute_cols] @ _POW10[minute_cols[::-1]]
+            # Seconds as an exact integer mantissa / 10**decimals: correctly rounded like float("SS.fff")
+            mantissa = head[:, second_cols] @ _POW10[np.arange(len(second_cols))[::-1]]
+            decimals = 0 if dot is None else length - 1 - dot
+            seconds[rows] = minutes * 60 + mantissa / _POW10[decimals]
+            fast[rows] = True
+
+    slow = present & ~fast
+    if slow.any():
+        seconds[slow] = times[slow].map(convert_to_seconds).to_numpy(dtype=float)
+    return pd.Series(seconds, index=times.index, name=times.name)
+
+
+# Function: Iterate over the rows of one or more sources in chunks
+# source → CSV path, DataFrame, or a list of them (e.g. one file per season)
+# columns → columns to keep (None = all); missing columns are simply not read
+def iter_chunks(source, sep: str = ",", chunksize: int = CHUNK_ROWS, columns=None):
+    sources = [source] if isinstance(source, (str, Path, pd.DataFrame)) else list(source)
+    for src in sources:
+        if isinstance(src, pd.DataFrame):
+            frame = src if columns is None else src[[c for c in src.columns if c in columns]]
+            for start in range(0, len(frame), chunksize):
+                yield frame.iloc[start:start + chunksize]
+        else:
+            usecols = None if columns is None else (lambda c: c in columns)
+            yield from pd.read_csv(src, sep=sep, chunksize=chunksize, usecols=usecols)
+
+
+# Class: Running per-driver lap statistics (update chunk by chunk, merge partial results)
+# by → grouping column(s), e.g. "Driver" or ["Season", "Driver"]
+# lap_column → lap number column reported with best/worst laps (optional in the input)
+class LapStats:
+    def __init__(self, by: str | list[str] = "Driver", lap_column: str = "Lap"):
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.lap_column = lap_column
+        self.rows = 0
+        self.invalid = 0
+        self.groups = pd.DataFrame(columns=["Laps", "Total", "Best", "BestLap", "Worst", "WorstLap"])
+        # Session best: (group key, lap, seconds); the first occurrence wins on ties
+        self.best = None
+
+    # Method: Add one chunk of raw laps (LapTime strings, or a LapTimeSeconds column)
+    def update(self, chunk: pd.DataFrame):
+        seconds = chunk["LapTimeSeconds"] if "LapTimeSeconds" in chunk else parse_lap_times(chunk["LapTime"])
+        valid = seconds.notna().to_numpy()
+        self.rows += len(chunk)
+        self.invalid += int((~valid).sum())
+        if not valid.any():
+            return self
+
+        laps = chunk.loc[valid, self.by].assign(
+            Lap=chunk.loc[valid, self.lap_column] if self.lap_column in chunk else np.nan,
+            Seconds=seconds[valid],
+        ).reset_index(drop=True)
+
+        # One groupby over the chunk: count, sum, min/max and the rows holding them
+        stats = laps.groupby(self.by, sort=False)["Seconds"].agg(["count", "sum", "min", "max", "idxmin", "idxmax"])
+        part = pd.DataFrame({
+            "Laps": stats["count"],
+            "Total": stats["sum"],
+            "Best": stats["min"],
+            "BestLap": laps["Lap"].to_numpy()[stats["idxmin"]],
+            "Worst": stats["max"],
+            "WorstLap": laps["Lap"].to_numpy()[stats["idxmax"]],
+        })
+        self._merge_groups(part)
+
+        first = int(laps["Seconds"].to_numpy().argmin())
+        key = laps.loc[first, self.by[0]] if len(self.by) == 1 else tuple(laps.loc[first, self.by])
+        self._merge_best((key, laps.loc[first, "Lap"], float(laps.loc[first, "Seconds"])))
+        return self
+
+    # Method: Add a partial result computed on later rows (another file, season or worker)
+    def merge(self, other: "LapStats"):
+        self.rows += other.rows
+        self.invalid += other.invalid
+        if len(other.groups):
+            self._merge_groups(other.groups)
+        if other.best is not None:
+            self._merge_best(other.best)
+        return self
+
+    def _merge_groups(self, part: pd.DataFrame):
+        if not len(self.groups):
+            self.groups = part.copy()
+            return
+        # Earlier rows come first, so ties keep the earlier best/worst lap
+        both = pd.concat([self.groups, part]).reset_index()
+        grouped = both.groupby(self.by, sort=False)
+        best = both.loc[grouped["Best"].idxmin(), ["Best", "BestLap"]]
+        worst = both.loc[grouped["Worst"].idxmax(), ["Worst", "WorstLap"]]
+        self.groups = grouped[["Laps", "Total"]].sum().assign(
+            Best=best["Best"].to_numpy(), BestLap=best["BestLap"].to_numpy(),
+            Worst=worst["Worst"].to_numpy(), WorstLap=worst["WorstLap"].to_numpy(),
+        )
+
+    def _merge_best(self, best: tuple):
+        if self.best is None or best[2] < self.best[2]:
+            self.best = best
+
+    # Property: Session-best lap time in seconds (NaN before any valid lap)
+    @property
+    def best_time(self) -> float:
+        return np.nan if self.best is None else float(self.best[2])
+
+    # Method: Per-group table sorted by key: Laps, AverageLapTime, BestLapTime, BestLap, WorstLapTime, WorstLap
+    def summary(self) -> pd.DataFrame:
+        groups = self.groups
+        table = pd.DataFrame({
+            "Laps": groups["Laps"].astype(int),
+            "AverageLapTime": groups["Total"] / groups["Laps"],
+            "BestLapTime": groups["Best"],
+            "BestLap": groups["BestLap"],
+            "WorstLapTime": groups["Worst"],
+            "WorstLap": groups["WorstLap"],
+        })
+        table.index.names = self.by
+        return table.sort_index()
+
+
+# Function: First pass: statistics of one or more sources, read in chunks
+def lap_stats(source, sep: str = ",", chunksize: int = CHUNK_ROWS, by="Driver", lap_column: str = "Lap") -> LapStats:
+    stats = LapStats(by, lap_column)
+    columns = set(stats.by) | {"LapTime", "LapTimeSeconds", lap_column}
+    for chunk in iter_chunks(source, sep, chunksize, columns):
+        stats.update(chunk)
+    return stats
+
+
+# Function: Second pass: chunks with LapTimeSeconds and DeltaTime (gap to best_time) added
+# Rows without a valid lap time are dropped unless dropna=False
+def iter_deltas(source, best_time: float, sep: str = ",", chunksize: int = CHUNK_ROWS, dropna: bool = True):
+    for chunk in iter_chunks(source, sep, chunksize):
+        seconds = parse_lap_times(chunk["LapTime"])
+        chunk = chunk.assign(LapTimeSeconds=seconds, DeltaTime=seconds - best_time)
+        yield chunk[seconds.notna()] if dropna else chunk
+
+
+# Function: Both passes over large inputs: stats first, then the rows with DeltaTime written to
+# output_file chunk by chunk; returns the LapStats of the first pass
+def write_deltas(source, output_file: str | Path, sep: str = ",", chunksize: int = CHUNK_ROWS, by="Driver",
+                 lap_column: str = "Lap") -> LapStats:
+    stats = lap_stats(source, sep, chunksize, by, lap_column)
+    header = True
+    for chunk in iter_deltas(source, stats.best_time, sep, chunksize):
+        chunk.to_csv(output_file, sep=sep, index=False, header=header, mode="w" if header else "a")
+        header = False
+    return stats
@@ -1,9 +1,11 @@
 """
 This script simulates lap speeds, checks which are above or below 
 the average, computes lap-to-lap differences, and identifies the 
-longest sequence of consecutive speed increases.
+longest sequence of consecutive speed increases (vectorized run-length 
+segmentation from Run_Segments.py).
 """
 import numpy as np
+from Run_Segments import monotone_runs
 
 # FUNCTION: search for laps with speed > average speed
 def laps_above_average(speed_vector):
@@ -24,28 +26,17 @@ def laps_above_average(speed_vector):
     )
 
 # FUNCTION: comparison between successive lap speeds
+# Vectorized: lap-to-lap differences with np.diff and the runs of increases from Run_Segments
 def analyze_speed(speed_vector):
-    deltas = []           # list to store lap-to-lap speed differences
-    currnt_run = 0        # current run length of consecutive increases
-    max_run = 0           # maximum length of a strictly increasing run
-    start = 0             # starting index of the current run
-
-    for i in range(len(speed_vector) - 1):
-        diff = np.round(speed_vector[i+1] - speed_vector[i], 3)  # lap-to-lap difference
-        deltas.append(diff)
-
-        if diff > 0:  # speed increased
-            if currnt_run == 0:  # start of a new run
-                start = i
-            currnt_run += 1
-            if currnt_run > max_run:  # update maximum run
-                max_run = currnt_run
-                subsequence = speed_vector[start:start+currnt_run+1]
-        else:  # no increase so reset the counter
-            currnt_run = 0
+    deltas = np.round(np.diff(speed_vector), 3).tolist()   # list of lap-to-lap speed differences
+    runs = monotone_runs(speed_vector)                      # strictly increasing runs (start/end/length)
+    longest = runs.longest()                                # first longest run (-1 if speed never increases)
+    if longest < 0:
+        return (deltas, 0, speed_vector[:0])
+    subsequence = speed_vector[runs.start[longest]:runs.end[longest]]
 
     # returns: list of deltas, max length of increasing subsequence, and the subsequence itself
-    return (deltas, max_run, subsequence)
+    return (deltas, int(runs.length[longest]) - 1, subsequence)
 
 # Array generation
 np.random.seed(42) # ensures reproducibility of the random generation
@@ -63,7 +54,8 @@ bool_array = rounded_speeds > avg_speed
 print(f"Boolean array for speeds above average: {bool_array}")
 
 # Print lap-to-lap deltas and the longest strictly increasing subsequence
-print(f"Lap-to-lap speed deltas: {analyze_speed(rounded_speeds)[0]} km/h")
-print(f"Longest increasing subsequence length = {analyze_speed(rounded_speeds)[1]}, " f"subsequence = {analyze_speed(rounded_speeds)[2]} km/h")
+deltas, max_run, subsequence = analyze_speed(rounded_speeds)   # computed once, unpacked
+print(f"Lap-to-lap speed deltas: {deltas} km/h")
+print(f"Longest increasing subsequence length = {max_run}, " f"subsequence = {subsequence} km/h")
 
       
@@ -1,46 +1,30 @@
 """
 This script loads lap-time data, converts 'mm:ss' to seconds, cleans invalid 
 rows, computes per-driver averages and worst laps, finds the overall fastest 
-lap, and adds a delta column vs. the session best.
+lap, and adds a delta column vs. the session best (streaming engine in Lap_Stats_Engine.py).
 """
 import pandas as pd
-import numpy as np
+from Lap_Stats_Engine import iter_deltas, lap_stats
 
-# FUNCTION: Convert 'minutes:seconds' format to total seconds
-def convert_to_seconds(time_str):
-    try:
-        minutes, seconds = time_str.split(":")
-        return int(minutes) * 60 + float(seconds)
-    except Exception:
-        return np.nan
- 
-# Load CSV data
-# Check "sample2.csv" file 
-df = pd.read_csv("sample2.csv", sep=";") 
-
-# Converting lap times from minutes to seconds to enable calculations
-df["LapTimeSeconds"] = df["LapTime"].apply(convert_to_seconds)
-
-# Drop rows with invalid/missing lap times to avoid contaminating stats
-df = df.dropna(subset=["LapTimeSeconds"])
-
-# Quick sanity check: preview the transformed table
-print(pd.concat([df.head(10), df.tail(10)]))
+# Block: First pass - per-driver stats and session best in a single pass over the file
+# Lap times are converted from 'mm:ss' to seconds in bulk and invalid/missing ones are left out
+# of the stats; the file is read in chunks, so multi-season lap dumps fit in bounded memory
+# Check "sample2.csv" file
+stats = lap_stats("sample2.csv", sep=";")
+summary = stats.summary()
+print(f"Valid laps: {stats.rows - stats.invalid} of {stats.rows}")
 
 # Per-driver mean lap time (in seconds)
-average = df.groupby("Driver").agg(AverageLapTime=("LapTimeSeconds", "mean"))
-print(average)
+print(summary[["AverageLapTime"]])
 
 # Block: Global best lap - time, driver, and lap number
-best_time = df["LapTimeSeconds"].min() # fastest lap time overall
-best_driver = df[df["LapTimeSeconds"] == best_time]["Driver"].values[0]   # corresponding driver
-best_lap = df[df["LapTimeSeconds"] == best_time]["Lap"].values[0]         # corresponding lap number
+best_driver, best_lap, best_time = stats.best
 print(f"The overall best time is by {best_driver}: {best_time:.3f}s on lap {best_lap}")
 
 # Per-driver worst (slowest) lap time
-worst_time_per_driver = df.groupby("Driver").agg(WorstLapTime=("LapTimeSeconds", "max"))
-print(worst_time_per_driver)
+print(summary[["WorstLapTime"]])
 
-# Add a delta column: gap to the session's best lap
-df["Delta"] = df["LapTimeSeconds"] - best_time
+# Block: Second pass - add a delta column: gap to the session's best lap
+# (rows with invalid lap times dropped, as they would contaminate the stats)
+df = pd.concat(iter_deltas("sample2.csv", best_time, sep=";"))
 print(pd.concat([df.head(10), df.tail(10)]))
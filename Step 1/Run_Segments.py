@@ -0,0 +1,103 @@
+"""
+Vectorized run-length segmentation of telemetry channels (built on np.diff / run-length encoding,
+no per-sample Python loop): runs of equal values, runs of True in a mask, monotone runs, and the
+telemetry zones built on them (full throttle, braking, gear holds). Every result is a Segments
+object of compact start/end/length arrays, with end exclusive like a slice, so
+values[start[i]:end[i]] is segment i.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+# Throttle (%) counted as full throttle
+FULL_THROTTLE = 98
+
+
+# Class: Segments of a 1-D channel (start inclusive, end exclusive, length = end - start, in samples)
+# value → channel value held over each segment (run_lengths / gear_segments), None otherwise
+@dataclass(frozen=True, eq=False)
+class Segments:
+    start: np.ndarray
+    end: np.ndarray
+    length: np.ndarray
+    value: np.ndarray | None = None
+
+    def __len__(self):
+        return len(self.start)
+
+    # Method: Segments selected by a boolean mask or index array
+    def take(self, rows) -> "Segments":
+        return Segments(self.start[rows], self.end[rows], self.length[rows],
+                        None if self.value is None else self.value[rows])
+
+    # Method: Segments with at least min_length samples
+    def at_least(self, min_length: int) -> "Segments":
+        return self.take(self.length >= min_length)
+
+    # Method: Index of the longest segment (the first one on ties), -1 if there is none
+    def longest(self) -> int:
+        return int(self.length.argmax()) if len(self) else -1
+
+    # Method: (first, last) value of x (e.g. Distance or Time) covered by every segment
+    def extent(self, x):
+        x = np.asarray(x)
+        return x[self.start], x[self.end - 1]
+
+
+# Function: Run-length encoding: runs of equal consecutive values (NaN runs count as equal)
+def run_lengths(values) -> Segments:
+    values = np.asarray(values)
+    if values.size == 0:
+        empty = np.array([], dtype=np.int64)
+        return Segments(empty, empty, empty, values[:0])
+    changed = values[1:] != values[:-1]
+    if values.dtype.kind == "f":
+        changed &= ~(np.isnan(values[1:]) & np.isnan(values[:-1]))
+    start = np.r_[0, np.flatnonzero(changed) + 1]
+    end = np.r_[start[1:], values.size]
+    return Segments(start, end, end - start, values[start])
+
+
+# Function: Runs of True in a boolean mask (e.g. throttle >= 98)
+def mask_runs(mask) -> Segments:
+    edges = np.diff(np.r_[0, np.asarray(mask, dtype=np.int8), 0])
+    start = np.flatnonzero(edges == 1)
+    end = np.flatnonzero(edges == -1)
+    return Segments(start, end, end - start)
+
+
+# Function: Join segments separated by gaps of at most max_gap samples (e.g. one-sample dropouts)
+def merge_gaps(segments: Segments, max_gap: int) -> Segments:
+    if len(segments) < 2:
+        return segments
+    new_group = np.r_[True, segments.start[1:] - segments.end[:-1] > max_gap]
+    first = np.flatnonzero(new_group)
+    last = np.r_[first[1:], len(segments)] - 1
+    start, end = segments.start[first], segments.end[last]
+    return Segments(start, end, end - start, None if segments.value is None else segments.value[first])
+
+
+# Function: Monotone runs: consecutive samples that keep increasing (or decreasing)
+# Each segment covers the samples of the run, so a run of k steps has length k + 1;
+# strict=False also accepts equal consecutive samples
+def monotone_runs(values, increasing: bool = True, strict: bool = True) -> Segments:
+    steps = np.diff(np.asarray(values, dtype=float))
+    if not increasing:
+        steps = -steps
+    runs = mask_runs(steps > 0 if strict else steps >= 0)
+    return Segments(runs.start, runs.end + 1, runs.length + 1)
+
+
+# Function: Full-throttle zones (throttle at or above 'threshold' %)
+def full_throttle_zones(throttle, threshold: float = FULL_THROTTLE, min_samples: int = 1, max_gap: int = 0) -> Segments:
+    return merge_gaps(mask_runs(np.asarray(throttle) >= threshold), max_gap).at_least(min_samples)
+
+
+# Function: Braking zones (FastF1 Brake flag, or any brake pressure above 0)
+def braking_zones(brake, min_samples: int = 1, max_gap: int = 0) -> Segments:
+    return merge_gaps(mask_runs(np.asarray(brake) > 0), max_gap).at_least(min_samples)
+
+
+# Function: Gear-hold segments (runs of the same nGear); value holds the gear
+def gear_segments(gear, min_samples: int = 1) -> Segments:
+    return run_lengths(np.asarray(gear)).at_least(min_samples)
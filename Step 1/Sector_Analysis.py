@@ -0,0 +1,133 @@
+"""
+Vectorized sector analysis over (drivers × laps × sectors) arrays of sector times in seconds, with
+any number of leading axes (e.g. sessions × drivers × laps × sectors for a whole season): sector
+means, lap times, fastest lap, most influential sector of the fastest lap, theoretical best lap
+and sector dominance against the field. Missing sectors are NaN; a lap with a missing sector has
+no lap time. Also builds the arrays from lap tables (FastF1 Sector1Time…Sector3Time columns).
+"""
+import numpy as np
+import pandas as pd
+
+# Axes of the sector-time array (counted from the end, so leading axes are free)
+DRIVER_AXIS, LAP_AXIS, SECTOR_AXIS = -3, -2, -1
+SECTOR_COLUMNS = ["Sector1Time", "Sector2Time", "Sector3Time"]
+
+
+# Function: nanmin/argmin along an axis without warnings: (values, index); all-NaN → (NaN, -1)
+def _nanargmin(values: np.ndarray, axis: int):
+    missing = np.isnan(values)
+    index = np.where(missing, np.inf, values).argmin(axis=axis)
+    empty = missing.all(axis=axis)
+    best = np.take_along_axis(values, np.expand_dims(index, axis), axis).squeeze(axis)
+    return np.where(empty, np.nan, best), np.where(empty, -1, index)
+
+
+# Function: Mean along an axis ignoring NaN, without warnings (all-NaN → NaN)
+def _nanmean(values: np.ndarray, axis: int):
+    count = (~np.isnan(values)).sum(axis=axis)
+    total = np.where(np.isnan(values), 0.0, values).sum(axis=axis)
+    return np.divide(total, count, out=np.full(total.shape, np.nan), where=count > 0)
+
+
+# Function: Per-sector mean over the laps → (..., drivers, sectors)
+def sector_means(times: np.ndarray) -> np.ndarray:
+    return _nanmean(np.asarray(times, dtype=float), LAP_AXIS)
+
+
+# Function: Lap times (sum of the sectors; NaN if any sector is missing) → (..., drivers, laps)
+def lap_times(times: np.ndarray) -> np.ndarray:
+    return np.asarray(times, dtype=float).sum(axis=SECTOR_AXIS)
+
+
+# Function: Fastest lap of every driver → (lap index, lap time), each (..., drivers)
+# Drivers without a complete lap get index -1 and time NaN
+def fastest_lap(times: np.ndarray):
+    best_time, best_lap = _nanargmin(lap_times(times), -1)   # (..., drivers, laps): laps are axis -1
+    return best_lap, best_time
+
+
+# Function: Most influential sectors of the fastest lap: delta of its sector times to the mean of
+# the driver's other laps → (delta (..., drivers, sectors), mask of the largest gain, ties included)
+def influential_sectors(times: np.ndarray):
+    times = np.asarray(times, dtype=float)
+    best_lap, _ = fastest_lap(times)
+    lap_index = np.maximum(best_lap, 0)[..., None, None]
+    best_sectors = np.take_along_axis(times, lap_index, LAP_AXIS).squeeze(LAP_AXIS)
+
+    # Mean of the other laps: remove the fastest lap from the NaN-aware sum and count
+    valid = ~np.isnan(times)
+    total = np.where(valid, times, 0.0).sum(axis=LAP_AXIS) - best_sectors
+    count = valid.sum(axis=LAP_AXIS) - 1
+    others = np.divide(total, count, out=np.full(total.shape, np.nan), where=count > 0)
+
+    delta = np.where((best_lap >= 0)[..., None], best_sectors - others, np.nan)
+    gain = np.where(np.isnan(delta), np.inf, delta)
+    influential = (gain == gain.min(axis=SECTOR_AXIS, keepdims=True)) & ~np.isnan(delta)
+    return delta, influential
+
+
+# Function: Theoretical best lap (sum of each driver's best sectors) → (best sectors, lap time)
+# Drivers without a time in some sector get NaN
+def theoretical_best(times: np.ndarray):
+    best_sectors, _ = _nanargmin(np.asarray(times, dtype=float), LAP_AXIS)
+    return best_sectors, best_sectors.sum(axis=SECTOR_AXIS)
+
+
+# Function: Sector dominance against the field: gap of each driver's best sector to the field's best
+# → (gap (..., drivers, sectors), owner index of every sector (..., sectors), sectors owned (..., drivers))
+def sector_dominance(times: np.ndarray):
+    best_sectors, _ = theoretical_best(times)   # (..., drivers, sectors): drivers are axis -2 here
+    field_best, owner = _nanargmin(best_sectors, -2)
+    gap = best_sectors - field_best[..., None, :]
+    drivers = np.arange(best_sectors.shape[-2])
+    owned = (owner[..., None, :] == drivers[:, None]).sum(axis=SECTOR_AXIS)
+    return gap, owner, owned
+
+
+# Function: Every analysis in one call → dict of arrays (keys named after the functions above)
+def analyze_sectors(times: np.ndarray) -> dict:
+    times = np.asarray(times, dtype=float)
+    fastest, fastest_time = fastest_lap(times)
+    delta, influential = influential_sectors(times)
+    best_sectors, best_lap_time = theoretical_best(times)
+    gap, owner, owned = sector_dominance(times)
+    return {
+        "sector_means": sector_means(times),
+        "lap_times": lap_times(times),
+        "fastest_lap": fastest,
+        "fastest_lap_time": fastest_time,
+        "influential_delta": delta,
+        "influential_sectors": influential,
+        "best_sectors": best_sectors,
+        "theoretical_best": best_lap_time,
+        "gap_to_field": gap,
+        "sector_owner": owner,
+        "sectors_owned": owned,
+    }
+
+
+# Function: Lap table (one row per lap) → (sector array (drivers × laps × sectors), drivers, laps)
+# Sector columns may be seconds or timedeltas / FastF1 timedelta strings; missing laps stay NaN
+def sector_tensor(df: pd.DataFrame, sector_columns=SECTOR_COLUMNS, driver: str = "Driver", lap: str = "LapNumber"):
+    seconds = np.column_stack([
+        pd.to_timedelta(df[c]).dt.total_seconds().to_numpy() if not pd.api.types.is_numeric_dtype(df[c])
+        else df[c].to_numpy(dtype=float)
+        for c in sector_columns
+    ])
+    driver_codes, drivers = pd.factorize(df[driver], sort=True)
+    lap_codes, laps = pd.factorize(df[lap], sort=True)
+    tensor = np.full((len(drivers), len(laps), len(sector_columns)), np.nan)
+    keep = (driver_codes >= 0) & (lap_codes >= 0)
+    tensor[driver_codes[keep], lap_codes[keep]] = seconds[keep]
+    return tensor, np.asarray(drivers), np.asarray(laps)
+
+
+# Function: Stack arrays of different sizes (e.g. one per session) → (sessions × drivers × laps × sectors),
+# padded with NaN
+def stack_sessions(tensors) -> np.ndarray:
+    tensors = [np.asarray(t, dtype=float) for t in tensors]
+    shape = np.max([t.shape for t in tensors], axis=0)
+    stacked = np.full((len(tensors), *shape), np.nan)
+    for i, t in enumerate(tensors):
+        stacked[(i, *(slice(0, n) for n in t.shape))] = t
+    return stacked
@@ -0,0 +1,67 @@
+"""
+Whole-field delta time in one pass: with every driver's lap resampled on the same distance grid
+(Telemetry_Store), the cumulative gap of all drivers to a reference is a single (drivers × distance)
+array subtraction instead of one delta_time interpolation per pair. On top of it, the time lost per
+mini-sector (to the reference or to the best driver of each mini-sector) gives a "where is everybody
+losing time" heatmap.
+"""
+import numpy as np
+import pandas as pd
+
+from Telemetry_Store import CHANNELS, resample_lap
+
+N_MINI_SECTORS = 25
+
+
+# Function: Cumulative gap to a reference row → (drivers × points), positive = behind the reference
+# times → elapsed lap time of every driver on a common distance grid (drivers × points)
+def delta_matrix(times: np.ndarray, reference: int) -> np.ndarray:
+    times = np.asarray(times, dtype=float)
+    return times - times[reference]
+
+
+# Function: Elapsed-time matrix for laps that are not in the store
+# laps → {driver: car data with Distance and Time}; grid → distances (m) → (drivers, times)
+def time_matrix(laps: dict, grid: np.ndarray):
+    drivers = sorted(laps)
+    fraction = np.asarray(grid, dtype=float) / grid[-1]
+    row = CHANNELS.index("Time")
+    return drivers, np.stack([resample_lap(laps[driver], fraction)[row] for driver in drivers]).astype(float)
+
+
+# Function: Delta of the whole field of a stored session (SessionTelemetry) to a reference driver
+# (default: the driver with the fastest stored lap) → DataFrame drivers × distance
+def session_deltas(session, reference: str | None = None) -> pd.DataFrame:
+    reference = reference or min(session.laps, key=lambda d: session.laps[d]["LapTime"])
+    deltas = delta_matrix(session.channel("Time"), session.index[reference])
+    return pd.DataFrame(deltas, index=pd.Index(session.drivers, name="Driver"), columns=session.grid)
+
+
+# Function: Time spent in each of n equal-distance mini-sectors → (drivers × n_sectors)
+def mini_sector_times(times: np.ndarray, n_sectors: int = N_MINI_SECTORS) -> np.ndarray:
+    times = np.asarray(times, dtype=float)
+    bounds = np.linspace(0, times.shape[1] - 1, n_sectors + 1).round().astype(int)
+    return np.diff(times[:, bounds], axis=1)
+
+
+# Function: Time lost per mini-sector → DataFrame drivers × mini-sectors (s)
+# reference=None compares with the fastest driver of every mini-sector (theoretical best lap),
+# a driver name compares with that driver
+def mini_sector_losses(session, n_sectors: int = N_MINI_SECTORS, reference: str | None = None) -> pd.DataFrame:
+    sectors = mini_sector_times(session.channel("Time"), n_sectors)
+    best = sectors.min(axis=0) if reference is None else sectors[session.index[reference]]
+    bounds = np.linspace(0, len(session.grid) - 1, n_sectors + 1).round().astype(int)
+    columns = pd.Index(session.grid[bounds[1:]].round(), name="SectorEnd")
+    return pd.DataFrame(sectors - best, index=pd.Index(session.drivers, name="Driver"), columns=columns)
+
+
+# Function: Heatmap of mini-sector losses (drivers sorted by total loss) on a Matplotlib axis
+def plot_mini_sector_losses(losses: pd.DataFrame, ax, cmap: str = "magma_r"):
+    losses = losses.loc[losses.sum(axis=1).sort_values().index]
+    image = ax.imshow(losses.to_numpy(), aspect="auto", cmap=cmap, vmin=0)
+    ax.set_yticks(range(len(losses)), losses.index)
+    ax.set_xticks(range(len(losses.columns)), [f"{int(d)}" for d in losses.columns], rotation=90)
+    ax.set_xlabel("Mini-sector end (m)")
+    ax.set_ylabel("Driver")
+    ax.figure.colorbar(image, ax=ax, label="Time lost (s)")
+    return image
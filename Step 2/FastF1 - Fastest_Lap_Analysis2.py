@@ -6,6 +6,7 @@ and distance vs gear.
 from matplotlib import pyplot as plt
 import fastf1 
 import fastf1.plotting
+from Telemetry_Decimation import decimate_telemetry
 
 fastf1.Cache.enable_cache('cache')
 
@@ -18,8 +19,9 @@ session = fastf1.get_session(2025, "Bahrain", "Q")
 session.load()
 
 # Block: Extract Leclerc's fastest lap telemetry
+# (downsampled for plotting: shape-preserving, brake points and gear steps kept)
 fast_leclerc = session.laps.pick_driver("LEC").pick_fastest()
-leclerc_car_data = fast_leclerc.get_car_data().add_distance()
+leclerc_car_data = decimate_telemetry(fast_leclerc.get_car_data().add_distance())
 
 # Plot Telemetry
 fig, ax = plt.subplots(3, 1, figsize=(22, 20))
@@ -5,30 +5,25 @@ for Bahrain, Monaco, and Silverstone race, and visualizes them in comparative pl
 from matplotlib import pyplot as plt
 import fastf1
 import fastf1.plotting
-
-fastf1.Cache.enable_cache('cache')
+from Telemetry_Decimation import decimate_telemetry
+from Telemetry_Store import TelemetryStore
 
 # Configure FastF1 plotting
 fastf1.plotting.setup_mpl(misc_mpl_mods=False, color_scheme="fastf1")
 
-# Block: Load three race sessions
-# 'R' = Race session type
-session_bah = fastf1.get_session(2025, 'Bahrain', 'R')
-session_bah.load()
-session_mon = fastf1.get_session(2025, 'Monaco', 'R')
-session_mon.load()
-session_sil = fastf1.get_session(2025, 'Silverstone', 'R')
-session_sil.load()
-
-# Block: Extract LEC's fastest lap and car telemetry for each GP
-fast_leclerc_bah = session_bah.laps.pick_driver("LEC").pick_fastest()
-lec_car_data_bah = fast_leclerc_bah.get_car_data().add_distance()
-
-fast_leclerc_mon = session_mon.laps.pick_driver("LEC").pick_fastest()
-lec_car_data_mon = fast_leclerc_mon.get_car_data().add_distance()
-
-fast_leclerc_sil = session_sil.laps.pick_driver("LEC").pick_fastest()
-lec_car_data_sil = fast_leclerc_sil.get_car_data().add_distance()
+# Block: Fastest-lap telemetry of three race sessions from the telemetry store
+# 'R' = Race session type. Sessions are loaded with FastF1 (cache in 'cache') only the first time;
+# afterwards every driver's fastest lap is read memory-mapped, resampled on a 5 m distance grid.
+store = TelemetryStore()
+tel_bah = store.session(2025, 'Bahrain', 'R', build=True)
+tel_mon = store.session(2025, 'Monaco', 'R', build=True)
+tel_sil = store.session(2025, 'Silverstone', 'R', build=True)
+
+# Block: LEC's fastest lap of each GP
+# (downsampled for plotting: shape-preserving, brake points and gear steps kept)
+lec_car_data_bah = decimate_telemetry(tel_bah.driver("LEC"))
+lec_car_data_mon = decimate_telemetry(tel_mon.driver("LEC"))
+lec_car_data_sil = decimate_telemetry(tel_sil.driver("LEC"))
 
 # Block: Select telemetry series – Distance and Speed
 d_bah = lec_car_data_bah["Distance"]  # Bahrain distance
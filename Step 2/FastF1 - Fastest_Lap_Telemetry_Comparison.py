@@ -1,12 +1,15 @@
 """
 This script compares Leclerc vs. Verstappen in Bahrain qualifying: loads fastest laps, 
 computes delta-time along distance, and plots both the gap trace and speed traces with 
-team colors.
+team colors. The delta comes from the whole-field delta matrix, which also gives a heatmap
+of the time every driver loses per mini-sector.
 """
 from matplotlib import pyplot as plt
 import fastf1
 import fastf1.plotting
-from fastf1 import utils
+from Delta_Matrix import mini_sector_losses, plot_mini_sector_losses, session_deltas
+from Telemetry_Decimation import decimate_telemetry
+from Telemetry_Store import TelemetryStore
 
 fastf1.Cache.enable_cache('cache')
 
@@ -19,24 +22,35 @@ session = fastf1.get_session(2025, 'Bahrain', 'Q')
 session.load()
 
 # Block: Extract fastest laps and telemetry for Leclerc and Verstappen
+# (downsampled for plotting: shape-preserving, brake points and gear steps kept)
 fast_leclerc = session.laps.pick_driver("LEC").pick_fastest()
-leclerc_car_data = fast_leclerc.get_car_data().add_distance()
+leclerc_car_data = decimate_telemetry(fast_leclerc.get_car_data().add_distance())
 
 fast_verstappen = session.laps.pick_driver("VER").pick_fastest()
-verstappen_car_data = fast_verstappen.get_car_data().add_distance()
+verstappen_car_data = decimate_telemetry(fast_verstappen.get_car_data().add_distance())
 
 # Block: Team colors for plot styling
 fer_color = fastf1.plotting.get_team_color(fast_leclerc['Team'], session=session)  # Ferrari
 rbr_color = fastf1.plotting.get_team_color(fast_verstappen['Team'], session=session)  # Red Bull
 
-# Delta time calculation
-delta_time, ref_tel, compare_tel = utils.delta_time(fast_leclerc, fast_verstappen)
+# Block: Corner markers from the circuit info
+circuit_info = session.get_circuit_info()
+corner_positions = circuit_info.corners["Distance"]
+corner_labels = circuit_info.corners["Number"].astype(str) + circuit_info.corners["Letter"]
+
+# Block: Delta time of the whole field to Leclerc (one array subtraction on the telemetry store)
+# On a cold store the session loaded above is stored as is (no second FastF1 load)
+field = TelemetryStore().session(2025, 'Bahrain', 'Q', build=True, session=session)
+deltas = session_deltas(field, reference="LEC")
+# (downsampled for plotting like the speed traces)
+delta_trace = decimate_telemetry(deltas.loc["VER"].rename_axis("Distance").reset_index(name="Delta"),
+                                 continuous=["Delta"], steps=[])
 
 # Block: Plot telemetry — Delta and Distance vs Speed comparison
 fig, ax = plt.subplots(2, 1, figsize=(18, 16))  # 2 rows, 1 column
 
 # 1) Delta line (gap vs distance)
-ax[0].plot(ref_tel['Distance'], delta_time, color=rbr_color, label="Delta to LEC")
+ax[0].plot(delta_trace['Distance'], delta_trace['Delta'], color=rbr_color, label="Delta to LEC")
 ax[0].set_xlabel("Distance (m)")
 ax[0].set_ylabel("Delta (s)")
 ax[0].set_title("Delta Verstappen vs Leclerc Bahrain GP - Qualifying")
@@ -62,3 +76,11 @@ ax[1].legend()
 plt.subplots_adjust(hspace=0.4)
 plt.savefig("Telemetry_Comparison.png", dpi=300)
 plt.show()
+
+# Block: Time lost per mini-sector by every driver (vs the best driver of each mini-sector)
+fig, ax = plt.subplots(figsize=(18, 10))
+plot_mini_sector_losses(mini_sector_losses(field, n_sectors=25), ax)
+ax.set_title("Time lost per mini-sector Bahrain GP - Qualifying")
+plt.tight_layout()
+plt.savefig("Mini_Sector_Losses.png", dpi=300)
+plt.show()
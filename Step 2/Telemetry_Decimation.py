@@ -0,0 +1,114 @@
+"""
+Shape-preserving downsampling of distance-indexed telemetry (e.g. get_car_data().add_distance()).
+Continuous channels (Speed, Throttle, RPM) are reduced with LTTB (Largest-Triangle-Three-Buckets)
+or min/max per distance bucket, while every sample where a step channel changes (Brake on/off,
+gear shifts, DRS) is kept, so braking points and gear steps stay exact. The result is a subset of
+the original rows and can be plotted as-is with Matplotlib, Plotly or Streamlit.
+"""
+import numpy as np
+import pandas as pd
+
+# Default number of points per continuous channel
+N_POINTS = 1000
+CONTINUOUS_CHANNELS = ["Speed", "Throttle", "RPM"]
+STEP_CHANNELS = ["Brake", "nGear", "DRS"]
+
+
+# Function: LTTB → indices of n_out samples that preserve the visual shape of y(x)
+# First and last samples are always kept; x must be sorted (e.g. Distance)
+def lttb_indices(x, y, n_out: int = N_POINTS) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last samples
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Average point of the next bucket (the last sample for the final bucket)
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[stop:next_stop].mean() if next_stop > stop else x[-1]
+        next_y = y[stop:next_stop].mean() if next_stop > stop else y[-1]
+        # Keep the point forming the largest triangle with the previous choice and the next average
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+# Function: Min/max per distance bucket → indices of the lowest and highest sample of every
+# bucket (at most 2 * n_buckets samples, plus first and last); keeps every peak and trough
+def minmax_indices(x, y, n_buckets: int = N_POINTS // 2) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+
+    # Equal-distance buckets (not equal-count): straights and corners get the same resolution
+    bucket = np.minimum(((x - x[0]) / (x[-1] - x[0] or 1) * n_buckets).astype(int), n_buckets - 1)
+    order = np.lexsort((y, bucket))                        # by bucket, then by value
+    first = np.flatnonzero(np.r_[True, bucket[order][1:] != bucket[order][:-1]])
+    last = np.r_[first[1:] - 1, n - 1]
+    return np.unique(np.r_[0, order[first], order[last], n - 1])
+
+
+# Function: Indices around every change of a step signal (the last sample before and the first
+# sample after each change), so steps are drawn at the right distance
+def change_indices(values) -> np.ndarray:
+    values = np.asarray(values)
+    changes = np.flatnonzero(values[1:] != values[:-1])
+    return np.unique(np.r_[changes, changes + 1])
+
+
+# Function: Downsample a telemetry DataFrame for plotting
+# n_points   → target samples per continuous channel (method="minmax": 2 samples per bucket)
+# continuous → channels reduced with LTTB/min-max (missing ones are skipped)
+# steps      → channels whose change points are always kept
+# Returns the selected rows in distance order (the union over all channels)
+def decimate_telemetry(
+    df: pd.DataFrame,
+    n_points: int = N_POINTS,
+    x: str = "Distance",
+    continuous: list[str] | None = None,
+    steps: list[str] | None = None,
+    method: str = "lttb",
+) -> pd.DataFrame:
+    if len(df) <= n_points:
+        return df
+    continuous = CONTINUOUS_CHANNELS if continuous is None else continuous
+    steps = STEP_CHANNELS if steps is None else steps
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"Unknown decimation method: {method}")
+
+    xs = df[x].to_numpy()
+    keep = [np.array([0, len(df) - 1])]
+    for column in continuous:
+        if column in df.columns:
+            y = df[column].to_numpy(dtype=float)
+            keep.append(lttb_indices(xs, y, n_points) if method == "lttb" else minmax_indices(xs, y, n_points // 2))
+    for column in steps:
+        if column in df.columns:
+            keep.append(change_indices(df[column].to_numpy()))
+    return df.iloc[np.unique(np.concatenate(keep))]
+
+
+# Function: Downsample a single trace → (x, y) arrays, e.g. for one Plotly line
+def decimate_trace(x, y, n_points: int = N_POINTS, method: str = "lttb"):
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == "lttb":
+        rows = lttb_indices(x, y, n_points)
+    elif method == "minmax":
+        rows = minmax_indices(x, y, n_points // 2)
+    else:
+        raise ValueError(f"Unknown decimation method: {method}")
+    return x[rows], y[rows]
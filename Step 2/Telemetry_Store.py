@@ -0,0 +1,184 @@
+"""
+Persistent telemetry store for fastest laps: every driver's fastest lap (Speed, Throttle, Brake,
+nGear, RPM and elapsed Time) is resampled onto a common distance grid per circuit and saved as one
+fixed-layout NumPy array per session (drivers × channels × grid points). Arrays are opened
+memory-mapped, so readers share pages and get zero-copy views, and cross-driver or cross-session
+comparisons become array slicing instead of reloading FastF1 sessions.
+Sessions are built from FastF1 (optionally offline, from the local FastF1 cache) or from
+per-driver telemetry CSV fixtures.
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+TELEMETRY_DIR = Path("telemetry_store")
+FIXTURE_DIR = Path("fixtures")
+FASTF1_CACHE = "cache"
+
+# Grid spacing along the lap (metres) and stored channels, in array order
+DISTANCE_STEP = 5.0
+CHANNELS = ["Speed", "Throttle", "Brake", "nGear", "RPM", "Time"]
+# Channels resampled with the last value (no interpolated gears or half-pressed brake flags)
+STEP_CHANNELS = ["Brake", "nGear"]
+
+
+# Function: Resample one lap's telemetry onto a distance grid
+# Each lap is mapped onto its own length (fraction of lap) first, so laps of slightly different
+# integrated length line up corner by corner; grid_fraction → grid positions as fractions of the lap
+def resample_lap(car_data: pd.DataFrame, grid_fraction: np.ndarray) -> np.ndarray:
+    distance = car_data["Distance"].to_numpy(dtype=float)
+    fraction = (distance - distance[0]) / (distance[-1] - distance[0])
+    out = np.empty((len(CHANNELS), len(grid_fraction)), dtype=np.float32)
+    for i, channel in enumerate(CHANNELS):
+        values = car_data[channel]
+        if channel == "Time" and pd.api.types.is_timedelta64_dtype(values):
+            values = values.dt.total_seconds()
+        values = values.to_numpy(dtype=float)
+        if channel in STEP_CHANNELS:
+            rows = np.clip(np.searchsorted(fraction, grid_fraction, side="right") - 1, 0, len(values) - 1)
+            out[i] = values[rows]
+        else:
+            out[i] = np.interp(grid_fraction, fraction, values)
+    return out
+
+
+# Function: Write an array/JSON atomically (temporary file + rename)
+def _save_array(array: np.ndarray, path: Path):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def _save_json(data: dict, path: Path):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+# Class: Read-only view of one stored session
+# data  → memory-mapped array (drivers × channels × points), float32
+# grid  → distance of every grid point (m)
+# laps  → {driver: {"LapNumber", "LapTime"}} of the stored fastest laps
+class SessionTelemetry:
+    def __init__(self, data: np.ndarray, grid: np.ndarray, meta: dict):
+        self.data = data
+        self.grid = grid
+        self.drivers = meta["drivers"]
+        self.laps = meta["laps"]
+        self.index = {driver: i for i, driver in enumerate(self.drivers)}
+
+    # Method: One channel → (drivers × points) view, or (points,) for a single driver
+    def channel(self, name: str, driver: str | None = None) -> np.ndarray:
+        values = self.data[:, CHANNELS.index(name)]
+        return values if driver is None else values[self.index[driver]]
+
+    # Method: One driver's resampled lap as a DataFrame (Distance + channels)
+    def driver(self, driver: str) -> pd.DataFrame:
+        df = pd.DataFrame(self.data[self.index[driver]].T, columns=CHANNELS)
+        df.insert(0, "Distance", self.grid)
+        return df
+
+
+# Class: Telemetry store rooted at a directory
+# Layout: root/{gp}/grid.npy (shared by every session at the circuit),
+#         root/{gp}/{year}_{sess}.npy (drivers × channels × points) and {year}_{sess}.json (drivers, laps)
+class TelemetryStore:
+    def __init__(self, root: str | Path = TELEMETRY_DIR, step: float = DISTANCE_STEP):
+        self.root = Path(root)
+        self.step = step
+
+    def _paths(self, year: int, gp: str, sess: str):
+        folder = self.root / gp.replace(" ", "_")
+        return folder / "grid.npy", folder / f"{year}_{sess}.npy", folder / f"{year}_{sess}.json"
+
+    # Method: Is the session already stored?
+    def has_session(self, year: int, gp: str, sess: str) -> bool:
+        _, data_file, meta_file = self._paths(year, gp, sess)
+        return data_file.exists() and meta_file.exists()
+
+    # Method: Store already-extracted laps {driver: (car data with Distance, LapNumber, LapTime s)}
+    def write_session(self, year: int, gp: str, sess: str, laps: dict):
+        if not laps:
+            raise ValueError(f"No telemetry to store for {gp} {year} {sess}")
+        grid_file, data_file, meta_file = self._paths(year, gp, sess)
+        grid_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Circuit grid: fixed by the first stored session (median lap length), reused afterwards
+        if grid_file.exists():
+            grid = np.load(grid_file)
+        else:
+            length = np.median([car["Distance"].iloc[-1] - car["Distance"].iloc[0] for car, _, _ in laps.values()])
+            grid = np.linspace(0.0, length, int(round(length / self.step)) + 1)
+            _save_array(grid, grid_file)
+
+        drivers = sorted(laps)
+        data = np.stack([resample_lap(laps[driver][0], grid / grid[-1]) for driver in drivers])
+        _save_array(data, data_file)
+        _save_json({
+            "drivers": drivers,
+            "channels": CHANNELS,
+            "laps": {d: {"LapNumber": laps[d][1], "LapTime": laps[d][2]} for d in drivers},
+        }, meta_file)
+
+    # Method: Load a session with FastF1 and store the fastest lap of every driver (or of drivers)
+    # offline=True uses only the local FastF1 cache (no network); source → fastf1-like module
+    # (e.g. a stand-in exposing get_session); session → a session the caller already loaded (with
+    # telemetry), stored as is instead of being loaded again; refresh=True rebuilds an existing session
+    def build_session(self, year: int, gp: str, sess: str, drivers: list[str] | None = None,
+                      offline: bool = False, source=None, refresh: bool = False, session=None):
+        if self.has_session(year, gp, sess) and not refresh:
+            return
+        if session is None:
+            if source is None:
+                import fastf1
+                fastf1.Cache.enable_cache(FASTF1_CACHE)
+                fastf1.Cache.offline_mode(offline)
+                source = fastf1
+            session = source.get_session(year, gp, sess)
+            session.load(weather=False, messages=False)
+
+        laps = {}
+        for driver in drivers or sorted(session.laps["Driver"].dropna().unique()):
+            fastest = session.laps.pick_drivers(driver).pick_fastest()
+            if fastest is None or pd.isna(fastest["LapTime"]):
+                continue
+            laps[driver] = (
+                fastest.get_car_data().add_distance(),
+                int(fastest["LapNumber"]),
+                fastest["LapTime"].total_seconds(),
+            )
+        self.write_session(year, gp, sess, laps)
+
+    # Method: Store a session from telemetry CSV fixtures "{gp}_{year}_{sess}_{driver}_telemetry.csv"
+    # (car data with Distance; Time in seconds or as a timedelta string), no FastF1 needed
+    def import_fixtures(self, year: int, gp: str, sess: str, fixture_dir: str | Path = FIXTURE_DIR):
+        laps = {}
+        for file in sorted(Path(fixture_dir).glob(f"{gp}_{year}_{sess}_*_telemetry.csv")):
+            driver = file.name[len(f"{gp}_{year}_{sess}_"):-len("_telemetry.csv")]
+            car = pd.read_csv(file)
+            if car["Time"].dtype == object:
+                car["Time"] = pd.to_timedelta(car["Time"])
+            time = car["Time"].dt.total_seconds() if pd.api.types.is_timedelta64_dtype(car["Time"]) else car["Time"]
+            laps[driver] = (car, int(car["LapNumber"].iloc[0]) if "LapNumber" in car else 0, float(time.iloc[-1]))
+        self.write_session(year, gp, sess, laps)
+
+    # Method: Open a stored session memory-mapped (build=True loads it with FastF1 first if missing)
+    def session(self, year: int, gp: str, sess: str, build: bool = False, **build_kwargs) -> SessionTelemetry:
+        if build:
+            self.build_session(year, gp, sess, **build_kwargs)
+        grid_file, data_file, meta_file = self._paths(year, gp, sess)
+        with open(meta_file) as f:
+            meta = json.load(f)
+        return SessionTelemetry(np.load(data_file, mmap_mode="r"), np.load(grid_file), meta)
+
+    # Method: Stored sessions at a circuit → list of (year, sess)
+    def sessions(self, gp: str):
+        folder = self.root / gp.replace(" ", "_")
+        return sorted(
+            (int(year), sess) for year, sess in (f.stem.split("_", 1) for f in folder.glob("*_*.json"))
+        )
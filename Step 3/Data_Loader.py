@@ -1,87 +1,101 @@
 """
 Loads FastF1 sessions, exports raw laps, converts lap-time strings to seconds, 
 builds stint-level features (lap index, average pace, delta), and saves a 
-processed CSV with a dynamic filename.
+processed CSV with a dynamic filename (optionally also to the Parquet lap store).
 """
-import numpy as np
+import hashlib
 import pandas as pd
-import fastf1 as f1
 from pathlib import Path
+from Degradation_Fits import degradation_fits
+from Lap_Schema import compact_laps, with_display_columns
+from Lap_Store import PARTITIONS, STORE_AVAILABLE, has_laps, read_laps, write_laps
+from Stage_Timing import span
+from Time_Conversions import convert_series_to_seconds
 
 # Block: Project paths
 DATA_RAW       = Path("data/raw")
 CACHE_DIR      = Path("data/cache")
 DATA_PROCESSED = Path("data/processed")
 
-# Enable FastF1 on-disk cache (speeds up repeated loads)
-f1.Cache.enable_cache(str(CACHE_DIR))
+# Function: FastF1, imported on first use (keeps it off the dashboard's cold start)
+# with its on-disk cache enabled (speeds up repeated loads)
+_FASTF1 = None
+
+def fastf1_module():
+    global _FASTF1
+    if _FASTF1 is None:
+        import fastf1
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fastf1.Cache.enable_cache(str(CACHE_DIR))
+        _FASTF1 = fastf1
+    return _FASTF1
+
+# Function: SHA-256 of a file's content (read in 1 MB blocks)
+def file_sha256(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Function: Write a DataFrame as CSV only if the content differs from the file on disk
+# Returns (sha256 of the CSV content, whether the file was written)
+def write_csv_if_changed(df: pd.DataFrame, out: str | Path):
+    out = Path(out)
+    content = df.to_csv(index=False).encode()
+    digest = hashlib.sha256(content).hexdigest()
+    if out.exists() and file_sha256(out) == digest:
+        return digest, False
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(content)
+    return digest, True
 
 # Function: Session loader (Download & load a FastF1 session, return laps + session, and save raw laps as CSV)
-def load_session(year: int, gp: str, sess: str):
-    session = f1.get_session(year, gp, sess)
-    session.load()
-    laps = session.laps.copy()
+# The raw CSV is rewritten only when its content changed;
+# store=True also writes the typed laps to the Parquet lap store (keeps timedelta dtypes);
+# source → anything with FastF1's get_session (default: fastf1 itself, e.g. Local_FastF1 offline)
+def load_session(year: int, gp: str, sess: str, store: bool = False, source=None):
+    with span("fastf1.load", session=f"{gp} {year} {sess}"):
+        session = (source or fastf1_module()).get_session(year, gp, sess)
+        session.load()
+        laps = session.laps.copy()
     out  = DATA_RAW / f"{gp}_{year}_{sess}_laps.csv"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    laps.to_csv(out, index=False)
+    with span("io.write_raw_csv", rows=len(laps)):
+        _, written = write_csv_if_changed(laps, out)
+    if store and (written or not has_laps("raw", year, gp, sess)):
+        with span("io.write_raw_store", rows=len(laps)):
+            write_laps(laps, "raw", year, gp, sess)
     return laps, session
 
 
-# Block: Time conversions
-# Function: Convert a time string like '0 days 00:01:38.693000' to seconds
-def convert_to_seconds(time_str):
-    # Treat missing values up front
-    if pd.isna(time_str):
-        return np.nan
-    try:
-        # Expected shape: "0 days 00:01:38.693000"
-        # Split into days and the HH:MM:SS.uuuuuu part
-        days, time = str(time_str).split(" days ")
-
-        # Split time into hours, minutes, seconds.decimals
-        h, m, s = time.split(":")
-
-        # Compute total seconds
-        # 1 day = 86400 s, 1 hour = 3600 s, 1 minute = 60 s
-        return int(days) * 86400 + int(h) * 3600 + int(m) * 60 + float(s)
-
-    except (ValueError, AttributeError):
-        # Any parsing issue falls back to NaN
-        return np.nan
-
-# Function: Convert seconds to a 'M:SS.mmm' string
-def convert_to_minutes(seconds):
-    if pd.isna(seconds):
-        return np.nan
-    minutes = int(seconds // 60)
-    rem     = float(seconds % 60)
-    return f"{minutes}:{rem:06.3f}"
-
 # Function: Feature engineering (Build lap-level features and save a processed CSV)
+# input_file can also be a laps DataFrame (e.g. read from the lap store with its dtypes);
+# store=True also writes the processed laps to the Parquet lap store
 def prepare_lap_features(
-    input_file: str | Path,
+    input_file: str | Path | pd.DataFrame,
     output_dir: str | Path = "data/processed",
     year: int | None = None,
     gp: str | None   = None,
     sess: str | None = None,
+    store: bool      = False,
 ):
     # Load raw laps
-    df = pd.read_csv(input_file)
+    with span("io.read_raw", source="DataFrame" if isinstance(input_file, pd.DataFrame) else "csv"):
+        df = input_file.copy() if isinstance(input_file, pd.DataFrame) else pd.read_csv(input_file)
 
     # Core numeric features (seconds)
-    df["LapTimeSeconds"] = df["LapTime"].apply(convert_to_seconds)
+    with span("parse.lap_times", rows=len(df)):
+        df["LapTimeSeconds"] = convert_series_to_seconds(df["LapTime"])
 
-    # Lap index (per Driver, Stint)
-    df["LapInStint"] = df.groupby(["Driver", "Stint"]).cumcount() + 1
+    with span("features.stints", rows=len(df)):
+        # Lap index (per Driver, Stint)
+        df["LapInStint"] = df.groupby(["Driver", "Stint"], observed=True).cumcount() + 1
 
-    # Average pace (seconds) per (Driver, Stint)
-    df["StintAvgPaceSeconds"] = df.groupby(["Driver", "Stint"])["LapTimeSeconds"].transform("mean")
+        # Average pace (seconds) per (Driver, Stint)
+        df["StintAvgPaceSeconds"] = df.groupby(["Driver", "Stint"], observed=True)["LapTimeSeconds"].transform("mean")
 
-    # Average pace string (m:ss.mmm) per (Driver, Stint)
-    df["StintAvgPace"] = df["StintAvgPaceSeconds"].apply(convert_to_minutes)
-
-    # Delta vs stint average (in seconds)
-    df["DeltaToStintAvgSeconds"] = df["LapTimeSeconds"] - df["StintAvgPaceSeconds"]
+        # Delta vs stint average (in seconds)
+        df["DeltaToStintAvgSeconds"] = df["LapTimeSeconds"] - df["StintAvgPaceSeconds"]
 
     # Persist results (dynamic name if metadata is provided)
     out_dir = Path(output_dir)
@@ -92,5 +106,49 @@ def prepare_lap_features(
         else out_dir / "processed_laps.csv"
     )
 
-    df.to_csv(out_file, index=False)
+    # The CSV keeps its original layout, with the StintAvgPace string (m:ss.mmm) derived here only
+    with span("io.write_processed_csv", rows=len(df)):
+        with_display_columns(df).to_csv(out_file, index=False)
+
+    # Degradation regressions (one closed-form fit per Driver/Stint/Compound), saved beside the laps
+    with span("features.degradation_fits"):
+        fits = degradation_fits(df)
+    with span("io.write_fits_csv", rows=len(fits)):
+        fits.to_csv(out_file.with_name(out_file.stem + "_degradation_fits.csv"), index=False)
+
+    # In memory and in the lap store: compact schema (categoricals, small ints, float32)
+    with span("features.compact", rows=len(df)):
+        df = compact_laps(df)
+    if store and (year and gp and sess):
+        with span("io.write_processed_store", rows=len(df)):
+            write_laps(df, "processed", year, gp, sess)
     return df, out_file
+
+# Function: Re-open processed laps, from the lap store when available (typed, projected, filtered)
+# and from the processed CSV otherwise, in the compact schema (Lap_Schema.py); returns None if the
+# session was never processed
+def load_processed_laps(
+    year: int,
+    gp: str,
+    sess: str,
+    columns: list[str] | None = None,
+    drivers: list[str] | None = None,
+    compounds: list[str] | None = None,
+):
+    if has_laps("processed", year, gp, sess):
+        df = read_laps("processed", year, gp, sess, columns=columns, drivers=drivers, compounds=compounds)
+        # Single session: the partition columns carry no information
+        return compact_laps(df if columns is not None else df.drop(columns=PARTITIONS))
+
+    csv_file = DATA_PROCESSED / f"{gp}_{year}_{sess}_processed.csv"
+    if not csv_file.exists():
+        return None
+    needed = None if columns is None else list(dict.fromkeys(
+        columns + (["Driver"] if drivers is not None else []) + (["Compound"] if compounds is not None else [])
+    ))
+    df = compact_laps(pd.read_csv(csv_file, usecols=needed))
+    if drivers is not None:
+        df = df[df["Driver"].isin(drivers)]
+    if compounds is not None:
+        df = df[df["Compound"].isin(compounds)]
+    return df if columns is None else df[columns]
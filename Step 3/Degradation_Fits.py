@@ -0,0 +1,83 @@
+"""
+Closed-form least-squares fits for every group of laps in one vectorized pass: tyre degradation
+per (Driver, Stint, Compound) (lap time vs lap in stint) and lap-time trend per driver (lap time vs
+lap number, used for the fuel-burn view). Fits are stored as a table of slope, intercept and R²
+that the plots draw as line overlays and that can be ranked across the whole field.
+"""
+import numpy as np
+import pandas as pd
+
+DEGRADATION_GROUPS = ["Driver", "Stint", "Compound"]
+
+
+# Function: Least-squares fit y = intercept + slope * x for every group
+# Returns one row per group with N, XMin, XMax, the centred sums (Sxx, Sxy, Syy), the means and
+# Slope, Intercept, R2. Rows with a missing x or y are ignored (like the plotly OLS trendline).
+def group_fits(df: pd.DataFrame, by: list[str], x: str, y: str) -> pd.DataFrame:
+    data = df[by + [x, y]].dropna(subset=[x, y]).rename(columns={x: "x", y: "y"})
+    data["x"] = data["x"].astype(float)
+    data["y"] = data["y"].astype(float)
+
+    # Pass 1: group means; pass 2: centred sums of squares/products (numerically stable)
+    grouped = data.groupby(by, observed=True, sort=True)
+    data["dx"] = data["x"] - grouped["x"].transform("mean")
+    data["dy"] = data["y"] - grouped["y"].transform("mean")
+    data["dxx"] = data["dx"] * data["dx"]
+    data["dxy"] = data["dx"] * data["dy"]
+    data["dyy"] = data["dy"] * data["dy"]
+
+    fits = data.groupby(by, observed=True, sort=True).agg(
+        N=("x", "size"),
+        XMin=("x", "min"),
+        XMax=("x", "max"),
+        MeanX=("x", "mean"),
+        MeanY=("y", "mean"),
+        Sxx=("dxx", "sum"),
+        Sxy=("dxy", "sum"),
+        Syy=("dyy", "sum"),
+    ).reset_index()
+    return add_fit_columns(fits)
+
+
+# Function: Slope, intercept and R² from the stored means and centred sums
+def add_fit_columns(fits: pd.DataFrame) -> pd.DataFrame:
+    sxx = fits["Sxx"].where(fits["Sxx"] > 0)
+    fits["Slope"] = fits["Sxy"] / sxx
+    fits["Intercept"] = fits["MeanY"] - fits["Slope"] * fits["MeanX"]
+    fits["R2"] = fits["Sxy"] ** 2 / (sxx * fits["Syy"].where(fits["Syy"] > 0))  # NaN if degenerate
+    return fits
+
+
+# Function: Fits of y' = y - c * (x - 1) derived from the fits of y, without touching the laps
+# (fuel correction: c = fuel burned per lap × lap-time effect per kg)
+def corrected_fits(fits: pd.DataFrame, c: float) -> pd.DataFrame:
+    out = fits.copy()
+    out["MeanY"] = fits["MeanY"] - c * (fits["MeanX"] - 1)
+    out["Sxy"] = fits["Sxy"] - c * fits["Sxx"]
+    out["Syy"] = fits["Syy"] - 2 * c * fits["Sxy"] + c * c * fits["Sxx"]
+    return add_fit_columns(out)
+
+
+# Function: Tyre degradation fits, LapTimeSeconds vs LapInStint per (Driver, Stint, Compound)
+def degradation_fits(df: pd.DataFrame) -> pd.DataFrame:
+    return group_fits(df, DEGRADATION_GROUPS, "LapInStint", "LapTimeSeconds")
+
+
+# Function: Lap-time trend fits, LapTimeSeconds vs LapNumber per Driver (fuel-burn view)
+def lap_trend_fits(df: pd.DataFrame) -> pd.DataFrame:
+    return group_fits(df, ["Driver"], "LapNumber", "LapTimeSeconds")
+
+
+# Function: Rank stints by degradation slope (s/lap), optionally for one compound,
+# ignoring stints shorter than min_laps
+def rank_degradation(fits: pd.DataFrame, compound: str | None = None, min_laps: int = 5) -> pd.DataFrame:
+    ranked = fits[fits["N"] >= min_laps]
+    if compound is not None:
+        ranked = ranked[ranked["Compound"] == compound]
+    return ranked.sort_values("Slope", ignore_index=True)[DEGRADATION_GROUPS + ["N", "Slope", "Intercept", "R2"]]
+
+
+# Function: Line segment (x, y) of one fit row over its x range
+def fit_line(fit: pd.Series):
+    x = np.array([fit["XMin"], fit["XMax"]])
+    return x, fit["Intercept"] + fit["Slope"] * x
@@ -0,0 +1,71 @@
+"""
+Compact in-memory schema for lap DataFrames (FastF1 laps and the processed features): identifiers
+become categoricals, the FastF1 timedelta strings real timedeltas, lap/stint counters small
+integers and measured values float32. Display-only strings (StintAvgPace "m:ss.mmm") are not
+kept in memory and are derived only when a table is shown or exported.
+"""
+import pandas as pd
+
+from Time_Conversions import convert_series_to_minutes
+
+# Block: Column groups (columns missing from a frame are skipped)
+CATEGORY_COLUMNS = ["Driver", "DriverNumber", "Team", "Compound", "TrackStatus", "DeletedReason"]
+TIMEDELTA_COLUMNS = [
+    "Time", "LapTime", "PitOutTime", "PitInTime",
+    "Sector1Time", "Sector2Time", "Sector3Time",
+    "Sector1SessionTime", "Sector2SessionTime", "Sector3SessionTime", "LapStartTime",
+]
+# Counters: numpy integer when complete, nullable integer when some values are missing
+INTEGER_COLUMNS = {"LapNumber": "int16", "Stint": "int8", "TyreLife": "int16", "LapInStint": "int16", "Position": "int8"}
+FLOAT32_COLUMNS = [
+    "SpeedI1", "SpeedI2", "SpeedFL", "SpeedST",
+    "LapTimeSeconds", "StintAvgPaceSeconds", "DeltaToStintAvgSeconds",
+]
+BOOLEAN_COLUMNS = ["IsPersonalBest", "FreshTyre", "Deleted", "FastF1Generated", "IsAccurate"]
+DATETIME_COLUMNS = ["LapStartDate"]
+# Display strings derived from a numeric column: name → source column (seconds)
+DISPLAY_COLUMNS = {"StintAvgPace": "StintAvgPaceSeconds"}
+
+
+# Function: Convert a lap DataFrame to the compact schema (new DataFrame, column order kept)
+# Display-only columns are dropped; already-compact columns are left as they are; malformed
+# timedelta/datetime cells become NaT instead of failing the whole load
+def compact_laps(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.drop(columns=[c for c in DISPLAY_COLUMNS if c in df.columns])
+    columns = {}
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            columns[column] = df[column].astype("category")
+    for column in TIMEDELTA_COLUMNS:
+        if column in df.columns and not pd.api.types.is_timedelta64_dtype(df[column]):
+            columns[column] = pd.to_timedelta(df[column], errors="coerce")
+    for column, dtype in INTEGER_COLUMNS.items():
+        if column in df.columns and df[column].dtype != dtype:
+            values = df[column]
+            columns[column] = values.astype(dtype if values.notna().all() else dtype.capitalize())
+    for column in FLOAT32_COLUMNS:
+        if column in df.columns:
+            columns[column] = df[column].astype("float32")
+    for column in BOOLEAN_COLUMNS:
+        if column in df.columns and df[column].dtype != bool:
+            values = df[column]
+            columns[column] = values.astype(bool if values.notna().all() else "boolean")
+    for column in DATETIME_COLUMNS:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            columns[column] = pd.to_datetime(df[column], errors="coerce")
+    return df.assign(**columns)
+
+
+# Function: Add the display strings back (e.g. for CSV export or a table preview)
+# StintAvgPace is placed right after StintAvgPaceSeconds, as in the original processed CSV
+def with_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for column, source in DISPLAY_COLUMNS.items():
+        if source in df.columns and column not in df.columns:
+            df.insert(df.columns.get_loc(source) + 1, column, convert_series_to_minutes(df[source].astype(float)))
+    return df
+
+
+# Function: Memory footprint in MB (deep: includes the Python strings of object columns)
+def memory_mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 2**20
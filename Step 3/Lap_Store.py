@@ -0,0 +1,125 @@
+"""
+Optional typed columnar store for raw and processed laps: Parquet files partitioned by
+year/GP/session (Hive layout, e.g. data/store/processed/year=2025/gp=Bahrain/session=R/laps.parquet).
+Timedelta and categorical dtypes survive the round-trip, and reads support column projection and
+driver/compound filter pushdown, so callers only load what they need. Requires pyarrow.
+"""
+import importlib.util
+from pathlib import Path
+from urllib.parse import quote
+
+import pandas as pd
+
+# Block: Store location and availability (pyarrow is an optional dependency)
+DATA_STORE      = Path("data/store")
+STORE_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+PARTITIONS      = ["year", "gp", "session"]
+
+
+def _require_pyarrow():
+    if not STORE_AVAILABLE:
+        raise ImportError("The Parquet lap store needs pyarrow: pip install pyarrow")
+
+
+# Function: Path of one session partition ('stage' is "raw" or "processed")
+def partition_path(stage: str, year: int, gp: str, sess: str, root: str | Path = DATA_STORE):
+    return Path(root) / stage / f"year={year}" / f"gp={quote(gp)}" / f"session={quote(sess)}" / "laps.parquet"
+
+
+# Function: Check whether a session partition exists
+def has_laps(stage: str, year: int, gp: str, sess: str, root: str | Path = DATA_STORE):
+    return partition_path(stage, year, gp, sess, root).exists()
+
+
+# Function: Write the laps of one session (replaces the partition if it exists)
+def write_laps(df: pd.DataFrame, stage: str, year: int, gp: str, sess: str, root: str | Path = DATA_STORE):
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    out = partition_path(stage, year, gp, sess, root)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(pd.DataFrame(df), preserve_index=False)
+    pq.write_table(table, out, compression="zstd")
+    return out
+
+
+# Function: Schema shared by several partitions: columns whose type differs between sessions
+# (e.g. DeletedReason all-NaN → double in one session, strings in another) get a common type,
+# falling back to string when the types cannot be promoted
+def _unified_schema(dataset):
+    schemas = [fragment.physical_schema for fragment in dataset.get_fragments()]
+    if not schemas:
+        return dataset.schema
+    import pyarrow as pa
+
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            fields.setdefault(field.name, []).append(field)
+    unified = []
+    for name, variants in fields.items():
+        try:
+            unified.append(pa.unify_schemas([pa.schema([f]) for f in variants], promote_options="permissive").field(name))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            unified.append(pa.field(name, pa.string()))
+    partition_fields = [field for field in dataset.partitioning.schema if field.name not in fields]
+    return pa.schema(unified + partition_fields)
+
+
+# Function: Row filter expression for the driver/compound filters (None = no filter)
+def _row_filter(drivers, compounds):
+    import pyarrow.dataset as ds
+
+    expression = None
+    for column, values in (("Driver", drivers), ("Compound", compounds)):
+        if values is not None:
+            condition = ds.field(column).isin(list(values))
+            expression = condition if expression is None else expression & condition
+    return expression
+
+
+# Function: Read laps from the store
+# year/gp/sess    → partition filters (None = all); only matching partitions are opened
+#                   (one session: its partition file is read directly, with its own schema)
+# columns         → column projection (None = all columns, including year/gp/session)
+# drivers/compounds → row filters pushed down to the Parquet reader
+def read_laps(
+    stage: str,
+    year: int | None = None,
+    gp: str | None = None,
+    sess: str | None = None,
+    columns: list[str] | None = None,
+    drivers: list[str] | None = None,
+    compounds: list[str] | None = None,
+    root: str | Path = DATA_STORE,
+):
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    row_filter = _row_filter(drivers, compounds)
+
+    if year is not None and gp is not None and sess is not None:
+        values = {"year": year, "gp": gp, "session": sess}
+        file_columns = None if columns is None else [c for c in columns if c not in PARTITIONS]
+        table = pq.read_table(partition_path(stage, year, gp, sess, root), columns=file_columns, filters=row_filter)
+        # Same partition columns as a dataset read (year int32, gp/session strings)
+        for name in PARTITIONS:
+            if columns is None or name in columns:
+                kind = pa.int32() if name == "year" else pa.string()
+                table = table.append_column(pa.field(name, kind), pa.array([values[name]] * table.num_rows, kind))
+        return table.to_pandas()[columns] if columns is not None else table.to_pandas()
+
+    dataset = ds.dataset(Path(root) / stage, format="parquet", partitioning="hive")
+    dataset = ds.dataset(Path(root) / stage, schema=_unified_schema(dataset), format="parquet", partitioning="hive")
+
+    expression = row_filter
+    for name, value in (("year", year), ("gp", gp), ("session", sess)):
+        if value is not None:
+            condition = ds.field(name) == value
+            expression = condition if expression is None else expression & condition
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table.to_pandas()
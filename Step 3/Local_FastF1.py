@@ -0,0 +1,60 @@
+"""
+Offline stand-in for FastF1: serves previously saved session laps (CSV files named like the raw
+exports, "{gp}_{year}_{sess}_laps.csv", or raw partitions of the Parquet lap store) through the same
+get_session(...).load() / .laps interface, so the pipeline and the dashboard services can run and
+be tested with no network access.
+"""
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+import pandas as pd
+
+from Lap_Store import STORE_AVAILABLE, has_laps, read_laps
+
+FIXTURE_DIR = Path("data/fixtures")
+
+
+# Class: One cached session, loaded on demand like fastf1.core.Session
+class LocalSession:
+    def __init__(self, source: "LocalFastF1", year: int, gp: str, sess: str):
+        self.source = source
+        self.year, self.gp, self.name = year, gp, sess
+        self.laps = None
+
+    def load(self, *args, **kwargs):
+        if self.source.delay:
+            time.sleep(self.source.delay)   # simulated download/parse latency
+        csv_file = self.source.root / f"{self.gp}_{self.year}_{self.name}_laps.csv"
+        if csv_file.exists():
+            self.laps = pd.read_csv(csv_file)
+        elif STORE_AVAILABLE and has_laps("raw", self.year, self.gp, self.name, self.source.root):
+            self.laps = read_laps("raw", self.year, self.gp, self.name, root=self.source.root)
+            self.laps = self.laps.drop(columns=["year", "gp", "session"])
+        else:
+            raise FileNotFoundError(f"No cached laps for {self.gp} {self.year} {self.name} in {self.source.root}")
+        return self
+
+
+# Class: Drop-in for the fastf1 module in load_session(..., source=...)
+# root  → fixture directory (CSV files and/or a lap-store tree)
+# delay → seconds each load() sleeps, to exercise background loading
+class LocalFastF1:
+    def __init__(self, root: str | Path = FIXTURE_DIR, delay: float = 0.0):
+        self.root = Path(root)
+        self.delay = delay
+
+    def get_session(self, year: int, gp: str, sess: str):
+        return LocalSession(self, year, gp, sess)
+
+    # Method: Sessions available in the fixture directory → sorted list of (year, gp, sess)
+    def sessions(self):
+        found = set()
+        for file in self.root.glob("*_laps.csv"):
+            gp, year, sess, _ = file.name.rsplit("_", 3)
+            if year.isdigit():
+                found.add((int(year), gp, sess))
+        for part in self.root.glob("raw/year=*/gp=*/session=*/laps.parquet"):
+            year, gp, sess = (unquote(p.name.split("=", 1)[1]) for p in part.parents[2::-1])
+            found.add((int(year), gp, sess))
+        return sorted(found)
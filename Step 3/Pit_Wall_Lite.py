@@ -1,27 +1,43 @@
 """
 This script implements a Streamlit app that caches FastF1 data, lets you select Year/GP/Session, 
-loads or reopens processed laps, and shows three Plotly views (stint pace, tyre degradation, 
-fuel burn) filtered by driver.
+loads or reopens processed laps (from the Parquet lap store when pyarrow is installed), and shows
+three Plotly views (stint pace, tyre degradation, fuel burn) filtered by driver.
+FastF1 and Plotly are imported only when a session is loaded or a chart is drawn, so the app
+shell renders first (cold-start budget checked by Startup_Benchmark.py). An optional debug panel
+shows the timing/memory spans of every pipeline stage for the current run (JSON/trace export).
 """
 import streamlit as st
-import pandas as pd
-from pathlib import Path
-from data_loader import load_session, prepare_lap_features
-from plotting_prototypes import stint_pace, tire_degradation, fuel_burn
+from Data_Loader import load_processed_laps
+from Lap_Schema import with_display_columns
+from Processing_Cache import prepared_session
+from Plotting_Prototypes import stint_pace, tire_degradation, fuel_burn
+from Session_Index import FigureCache, SessionIndex
+from Session_Prefetch import SessionPrefetcher
+from Stage_Timing import begin, span
+
+# Block: Stage spans of this script run (shown in the debug panel at the bottom)
+timeline = begin("Pit-Wall Lite run")
+debug = st.sidebar.checkbox("Debug: stage timings")
 
 # Block: Cache get_prepared's output to avoid re-downloading, for 1 hour
+# On disk, Processing_Cache keeps a manifest (raw-input hash + feature-code version) so a cold
+# restart reopens unchanged sessions without FastF1 and without rewriting any file
 @st.cache_data(show_spinner="Loading session…", ttl=3600)
 def get_prepared(year: int, gp: str, sess: str):
-    laps, _ = load_session(year, gp, sess)         # load a FastF1 session
-    tmp = Path(f"data/raw/{gp}_{year}_{sess}_laps.csv")   # ensure dynamic name
-    tmp.parent.mkdir(parents=True, exist_ok=True)
-    laps.to_csv(tmp, index=False)                   # persist raw laps to CSV
-    df, _ = prepare_lap_features(tmp, "data/processed", year=year, gp=gp, sess=sess)
-    return df                                       # return the processed DataFrame
+    return prepared_session(year, gp, sess)         # return the processed DataFrame
+
+# Function: Show df in the tabs: build its session index (once per session) and drop the figures
+# of the previous data, which may be the same session before a reprocess or re-download
+def open_session(df, key: tuple):
+    st.session_state["data"] = df
+    with span("features.session_index"):
+        st.session_state["index"] = SessionIndex(df, key)
+    st.session_state.setdefault("figures", FigureCache()).clear()
 
 # Block: Manual cache invalidation (Refresh button)
 if st.button("Refresh"):
     get_prepared.clear()
+    st.session_state.setdefault("figures", FigureCache()).clear()
 
 # Block: App header
 st.title("Test Streamlit App")
@@ -37,39 +53,84 @@ session_type = st.selectbox("Session", ["R", "Q", "FP1", "FP2", "FP3"], index=0)
 if st.button("Load session"):
     with st.spinner("Loading and processing…"):
         # Use the cached pipeline; also store df for plotting tabs
-        df = get_prepared(year, gp, session_type)
-        st.session_state["data"] = df
+        with span("cache.get_prepared", session=f"{gp} {year} {session_type}"):
+            df = get_prepared(year, gp, session_type)
+        open_session(df, (year, gp, session_type))
         st.success("Data loaded successfully!")
-        st.dataframe(df)   # quick preview table
+        st.dataframe(with_display_columns(df))   # quick preview table
 
-# Block: Load data: re-open the already processed CSV for this Year/GP/Session ---
+# Block: Load data: re-open the already processed laps for this Year/GP/Session ---
+# (typed Parquet partition from the lap store if present, processed CSV otherwise)
 if st.button("Load data"):
-    processed_path = Path(f"data/processed/{gp}_{year}_{session_type}_processed.csv")
-    if processed_path.exists():
-        df = pd.read_csv(processed_path)
-        st.session_state["data"] = df
-        st.success(f"Loaded: {processed_path.name}")
+    with span("io.load_processed", session=f"{gp} {year} {session_type}"):
+        df = load_processed_laps(year, gp, session_type)
+    if df is not None:
+        open_session(df, (year, gp, session_type))
+        st.success(f"Loaded: {gp} {year} {session_type}")
     else:
         st.error("File not found. Press 'Load session' first for this GP/Session.")
 
+# Block: Background prefetch: load every session of the weekend on a bounded worker pool
+# (one prefetcher per app process); sessions can be opened as soon as they are ready, and an
+# opened session is released by the prefetcher (the session index holds it from then on)
+@st.cache_resource
+def get_prefetcher():
+    return SessionPrefetcher()
+
+prefetcher = get_prefetcher()
+if st.button("Prefetch weekend"):
+    prefetcher.prefetch_weekend(year, gp)
+
+status = prefetcher.status()
+if status:
+    st.progress(prefetcher.progress(), text="Prefetched sessions (rerun to update)")
+    st.dataframe([{"Session": f"{g} {y} {s}", **info} for (y, g, s), info in status.items()])
+    ready = prefetcher.ready()
+    if ready:
+        key = st.selectbox("Prefetched session", ready, format_func=lambda k: f"{k[1]} {k[0]} {k[2]}")
+        if st.button("Open prefetched session"):
+            open_session(prefetcher.get(key), key)
+            st.success(f"Opened: {key[1]} {key[0]} {key[2]}")
+
 # Block: Tabs: show visuals only if we have data in memory
+# Driver list and per-driver slices come from the session index; built figures are kept in a
+# bounded LRU cache keyed by (session, driver, chart, parameters), so switching drivers is instant
 if "data" in st.session_state:
-    df = st.session_state["data"]
+    index = st.session_state["index"]
+    figures = st.session_state.setdefault("figures", FigureCache())
     tab1, tab2, tab3 = st.tabs(["Stint pace", "Tyre degradation", "Fuel burn"])
 
     with tab1:
         # Single-driver render pace by compound
-        drv = st.selectbox("Driver", sorted(df.Driver.unique()), key="p_drv")
-        st.plotly_chart(stint_pace(df, drv), use_container_width=True)
+        drv = st.selectbox("Driver", index.drivers, key="p_drv")
+        fig = figures.get((index.key, drv, "stint_pace"), lambda: stint_pace(index.driver_laps(drv), drv))
+        with span("figure.render"):
+            st.plotly_chart(fig, use_container_width=True)
 
     with tab2:
         # Single-driver degradation view
-        drv = st.selectbox("Driver", sorted(df.Driver.unique()), key="d_drv")
-        st.plotly_chart(tire_degradation(df, drv), use_container_width=True)
+        drv = st.selectbox("Driver", index.drivers, key="d_drv")
+        fig = figures.get((index.key, drv, "tire_degradation"), lambda: tire_degradation(index.driver_laps(drv), drv, index.degradation))
+        with span("figure.render"):
+            st.plotly_chart(fig, use_container_width=True)
 
     with tab3:
         # Single-driver fuel-burn trend
-        drv = st.selectbox("Driver", sorted(df.Driver.unique()), key="f_drv")
+        drv = st.selectbox("Driver", index.drivers, key="f_drv")
         fuel = 100 
-        st.plotly_chart(fuel_burn(df, drv, fuel), use_container_width=True)
-   
+        fig = figures.get((index.key, drv, "fuel_burn", fuel), lambda: fuel_burn(index.driver_laps(drv), drv, fuel, index.lap_trends))
+        with span("figure.render"):
+            st.plotly_chart(fig, use_container_width=True)
+
+# Block: Debug panel: stage spans of this run, totals per category and JSON / trace downloads
+# (open the trace in chrome://tracing or ui.perfetto.dev)
+if debug:
+    with st.expander("Stage timings (this run)", expanded=True):
+        report = timeline.to_dict()
+        if report["spans"]:
+            st.write({category: f"{seconds * 1000:.1f} ms" for category, seconds in report["totals"].items()})
+            st.dataframe(report["spans"])
+        else:
+            st.info("No pipeline stage ran in this run (cached session and figures).")
+        st.download_button("Download JSON", timeline.to_json(), "stage_timings.json", "application/json")
+        st.download_button("Download trace", timeline.to_trace(), "stage_timings.trace.json", "application/json")
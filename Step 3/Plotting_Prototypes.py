@@ -1,11 +1,14 @@
 """
 This script builds three Plotly visualizations for race analysis: stint pace (lap vs time, colored by compound), 
-tyre degradation (lap-in-stint vs time with OLS trendline), and fuel burn (mean lap time vs lap number with linear fit), 
-filtered by driver.
+tyre degradation (lap-in-stint vs time with per-stint least-squares lines), and fuel burn (mean lap time vs lap number
+with linear fit), filtered by driver. Fit lines come from the precomputed tables in Degradation_Fits
+(no statsmodels fit at render time). Plotly is imported by each figure builder on first use,
+so importing this module does not slow down the dashboard's start.
 """
 import numpy as np
 import pandas as pd
-import plotly.express as px
+from Degradation_Fits import corrected_fits, degradation_fits, fit_line, lap_trend_fits
+from Stage_Timing import timed
 
 # Color legend for different tyre compounds
 TYRE_COLORS = {
@@ -17,7 +20,10 @@ TYRE_COLORS = {
 }
 
 # Function: Scatter plot – LapNumber vs LapTimeSeconds (colored by tyre compound)
+@timed("figure.stint_pace")
 def stint_pace(df: pd.DataFrame, driver: str | None = None):
+    import plotly.express as px
+
     # Filter laps only for the selected driver
     df = df[df.Driver.isin([driver])]
     fig = px.scatter(
@@ -35,15 +41,20 @@ def stint_pace(df: pd.DataFrame, driver: str | None = None):
     return fig
 
 # Function: Scatter plot – LapInStint vs LapTimeSeconds (with regression trendline)
-def tire_degradation(df: pd.DataFrame, driver: str | None = None):
+# fits → degradation_fits table (per Driver, Stint, Compound); computed from df if not given
+@timed("figure.tire_degradation")
+def tire_degradation(df: pd.DataFrame, driver: str | None = None, fits: pd.DataFrame | None = None):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     # Filter laps only for the selected driver
     df = df[df.Driver.isin([driver])]
+    fits = degradation_fits(df) if fits is None else fits[fits.Driver == driver]
     fig = px.scatter(
         df,
         x="LapInStint",              # x-axis: race lap index in that stint
         y="LapTimeSeconds",          # y-axis: lap time (seconds)
         color="Compound",
-        trendline="ols",             # fit a regression line
         color_discrete_map=TYRE_COLORS,
         facet_col="Driver",          # one subplot per driver
         # Detailed info on hover
@@ -54,11 +65,28 @@ def tire_degradation(df: pd.DataFrame, driver: str | None = None):
         ],
         title=f"Tire Degradation – {driver}",
     )
+    # One least-squares line per stint, in the compound colour
+    for _, fit in fits.dropna(subset=["Slope"]).iterrows():
+        x, y = fit_line(fit)
+        fig.add_trace(
+            go.Scatter(
+                x=x, y=y, mode="lines",
+                line=dict(color=TYRE_COLORS.get(fit["Compound"], "black")),
+                name=f"Stint {fit['Stint']:g} fit (R²={fit['R2']:.2f})",
+                hovertext=f"{fit['Slope']:+.3f} s/lap",
+            ),
+            row=1, col=1,
+        )
     return fig
 
 
 # Function: Scatter plot – LapNumber vs FuelCorrectedLapTime (with regression trendline)
-def fuel_burn(df: pd.DataFrame, driver: str | None = None, initial_fuel: float = 100.0):
+# fits → lap_trend_fits table (per Driver); computed from df if not given
+@timed("figure.fuel_burn")
+def fuel_burn(df: pd.DataFrame, driver: str | None = None, initial_fuel: float = 100.0, fits: pd.DataFrame | None = None):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     # Filter laps only for the selected driver
     df = df[df.Driver.isin([driver])]
 
@@ -84,7 +112,13 @@ def fuel_burn(df: pd.DataFrame, driver: str | None = None, initial_fuel: float =
         x="LapNumber",
         y="FuelCorrectedLapTime",
         color="Driver",
-        trendline="ols",  # adds an OLS regression line to highlight residual performance trends
         title=f"Fuel Burn - {driver}"
     )
+
+    # Linear fit of the fuel-corrected lap time, derived from the stored lap-time trend fit
+    # (highlights residual performance trends)
+    fits = lap_trend_fits(df) if fits is None else fits[fits.Driver == driver]
+    for _, fit in corrected_fits(fits, fuel_per_lap * 0.03).dropna(subset=["Slope"]).iterrows():
+        x, y = fit_line(fit)
+        fig.add_trace(go.Scatter(x=x, y=y, mode="lines", name=f"{fit['Driver']} fit (R²={fit['R2']:.2f})"))
     return fig
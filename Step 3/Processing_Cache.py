@@ -0,0 +1,146 @@
+"""
+Persistent, content-addressed cache for the Step 3 pipeline: a JSON manifest records, for every
+session (year, GP, session), the SHA-256 of its raw laps CSV, the version of the feature code
+and the processed output. An unchanged session is reopened from disk without loading FastF1,
+and features are recomputed only when the raw input or the feature code changed.
+"""
+import hashlib
+import inspect
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from Data_Loader import (
+    DATA_PROCESSED,
+    DATA_RAW,
+    STORE_AVAILABLE,
+    file_sha256,
+    load_processed_laps,
+    load_session,
+    prepare_lap_features,
+)
+import Lap_Schema
+import Time_Conversions
+from Degradation_Fits import DEGRADATION_GROUPS, add_fit_columns, degradation_fits, group_fits
+from Stage_Timing import span
+
+MANIFEST_FILE = DATA_PROCESSED / "manifest.json"
+_MANIFEST_LOCK = threading.Lock()
+
+# Block: Feature code version = hash of the source of everything that shapes the processed outputs
+# (laps, their compact schema and display columns, degradation fits); Lap_Schema and Time_Conversions
+# are hashed whole because they also hold module constants (column groups, the timedelta template)
+FEATURE_SOURCES = [
+    prepare_lap_features,
+    Time_Conversions,
+    group_fits,
+    add_fit_columns,
+    degradation_fits,
+    Lap_Schema,
+]
+FEATURE_VERSION = hashlib.sha256(
+    ("".join(inspect.getsource(source) for source in FEATURE_SOURCES) + repr(DEGRADATION_GROUPS)).encode()
+).hexdigest()[:16]
+
+
+# Function: Manifest key of a session
+def session_key(year: int, gp: str, sess: str) -> str:
+    return f"{year}/{gp}/{sess}"
+
+
+# Function: Read the manifest (empty if missing or unreadable)
+def load_manifest(path: str | Path = MANIFEST_FILE) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+# Function: Write the manifest atomically (temporary file + rename)
+def save_manifest(manifest: dict, path: str | Path = MANIFEST_FILE):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# Function: Is a manifest entry still valid for a raw file with this hash?
+def is_up_to_date(entry: dict, raw_sha256: str) -> bool:
+    return (
+        entry.get("raw_sha256") == raw_sha256
+        and entry.get("feature_version") == FEATURE_VERSION
+        and "processed_file" in entry
+        and Path(entry["processed_file"]).exists()
+    )
+
+
+# Function: Is a session already processed (raw CSV on disk unchanged since its manifest entry)?
+def is_processed(year: int, gp: str, sess: str, manifest: dict | None = None) -> bool:
+    entry = (load_manifest() if manifest is None else manifest).get(session_key(year, gp, sess), {})
+    raw_file = DATA_RAW / f"{gp}_{year}_{sess}_laps.csv"
+    return raw_file.exists() and is_up_to_date(entry, file_sha256(raw_file))
+
+
+# Function: Store one session's record in the manifest
+# Re-read under the lock so concurrent sessions do not overwrite each other's entries
+# (one writer process: worker processes return their records instead of writing them)
+def record_session(year: int, gp: str, sess: str, record: dict):
+    with _MANIFEST_LOCK:
+        manifest = load_manifest()
+        manifest[session_key(year, gp, sess)] = record
+        save_manifest(manifest)
+
+
+# Function: Processed laps for a session and the manifest record to store (None if the
+# manifest entry is still valid), without writing the manifest
+# 1) raw CSV on disk matches the manifest and the feature code is unchanged → reopen processed laps
+# 2) otherwise load the session (FastF1 cache), and rerun the features only if the raw hash or
+#    the feature version differ from the manifest entry
+def build_session(year: int, gp: str, sess: str, refresh: bool = False, source=None):
+    entry = load_manifest().get(session_key(year, gp, sess), {})
+    raw_file = DATA_RAW / f"{gp}_{year}_{sess}_laps.csv"
+
+    # Cold start: nothing to download if the raw input on disk is the one we processed
+    if not refresh and raw_file.exists():
+        with span("cache.hash_raw"):
+            valid = is_up_to_date(entry, file_sha256(raw_file))
+        if valid:
+            with span("io.read_processed"):
+                df = load_processed_laps(year, gp, sess)
+            if df is not None:
+                return df, None
+
+    load_session(year, gp, sess, store=STORE_AVAILABLE, source=source)   # raw CSV rewritten only if it changed
+    with span("cache.hash_raw"):
+        raw_sha256 = file_sha256(raw_file)
+    if is_up_to_date(entry, raw_sha256):
+        with span("io.read_processed"):
+            df = load_processed_laps(year, gp, sess)
+        if df is not None:
+            return df, None
+
+    df, out_file = prepare_lap_features(raw_file, DATA_PROCESSED, year=year, gp=gp, sess=sess, store=STORE_AVAILABLE)
+    record = {
+        "raw_file": str(raw_file),
+        "raw_sha256": raw_sha256,
+        "feature_version": FEATURE_VERSION,
+        "processed_file": str(out_file),
+        "processed_sha256": file_sha256(out_file),
+        "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    return df, record
+
+
+# Function: Processed laps for a session, reusing everything that is still valid (see build_session)
+# refresh=True always reloads the session from FastF1 (features still rerun only if needed);
+# source is passed on to load_session (e.g. a Local_FastF1 stand-in)
+def prepared_session(year: int, gp: str, sess: str, refresh: bool = False, source=None):
+    df, record = build_session(year, gp, sess, refresh=refresh, source=source)
+    if record is not None:
+        record_session(year, gp, sess, record)
+    return df
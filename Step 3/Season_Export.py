@@ -0,0 +1,143 @@
+"""
+Bulk export of whole seasons: every (year, GP, session) is loaded, turned into processed lap
+features and exported (raw/processed CSVs, lap store, manifest) across a process pool.
+Sessions already processed are skipped, so an interrupted backfill resumes where it stopped;
+throughput is reported as sessions complete. Runs offline against the local FastF1 cache or a
+Local_FastF1 fixture directory.
+
+Usage:
+    python Season_Export.py --years 2024 2025 --sessions FP1 FP2 FP3 Q R --workers 8 --offline
+    python Season_Export.py --fixtures data/fixtures
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Data_Loader import fastf1_module
+from Local_FastF1 import LocalFastF1
+from Processing_Cache import build_session, is_processed, load_manifest, record_session
+
+# FastF1 schedule session names → short session identifiers used in file names
+SESSION_CODES = {
+    "Practice 1": "FP1",
+    "Practice 2": "FP2",
+    "Practice 3": "FP3",
+    "Sprint Qualifying": "SQ",
+    "Sprint Shootout": "SS",
+    "Sprint": "S",
+    "Qualifying": "Q",
+    "Race": "R",
+}
+EXPORT_WORKERS = os.cpu_count() or 1
+
+
+# Function: Every (year, gp, session) of the given seasons from the FastF1 event schedule
+# sessions → session codes to keep (e.g. ["Q", "R"]); None keeps all; events → GP names to keep
+def season_sessions(years, sessions=None, events=None):
+    keys = []
+    for year in years:
+        schedule = fastf1_module().get_event_schedule(year, include_testing=False)
+        for _, event in schedule.iterrows():
+            gp = event["EventName"].removesuffix(" Grand Prix")
+            if events is not None and gp not in events:
+                continue
+            for i in range(1, 6):
+                code = SESSION_CODES.get(event.get(f"Session{i}"))
+                if code is not None and (sessions is None or code in sessions):
+                    keys.append((year, gp, code))
+    return keys
+
+
+# Function: Worker – load, prepare and export one session → (key, manifest record, laps, error)
+def _export_session(key, source, refresh):
+    try:
+        df, record = build_session(*key, refresh=refresh, source=source)
+        return key, record, len(df), None
+    except Exception as exc:
+        return key, None, 0, f"{type(exc).__name__}: {exc}"
+
+
+def _init_worker(offline: bool):
+    if offline:
+        fastf1_module().Cache.offline_mode(True)
+
+
+# Function: Export many sessions in parallel
+# source   → FastF1 stand-in (e.g. LocalFastF1("data/fixtures")); None uses FastF1 and its cache
+# offline  → FastF1 reads only its local cache (no network)
+# refresh  → reprocess sessions that are already up to date
+# Returns a report: done/skipped/failed sessions, laps, elapsed seconds and throughput
+def export_sessions(keys, workers: int = EXPORT_WORKERS, source=None, offline: bool = False,
+                    refresh: bool = False, verbose: bool = True) -> dict:
+    start = time.perf_counter()
+    manifest = load_manifest()
+    keys = list(dict.fromkeys(tuple(k) for k in keys))
+    todo = keys if refresh else [k for k in keys if not is_processed(*k, manifest=manifest)]
+    report = {"sessions": len(keys), "skipped": len(keys) - len(todo), "done": 0, "laps": 0, "failed": {}}
+    if verbose:
+        print(f"{len(todo)} sessions to export, {report['skipped']} already processed")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(offline,)) as pool:
+        futures = [pool.submit(_export_session, key, source, refresh) for key in todo]
+        for i, future in enumerate(as_completed(futures), start=1):
+            key, record, laps, error = future.result()
+            if error is not None:
+                report["failed"][key] = error
+            else:
+                # The parent is the only manifest writer: a finished session is never redone
+                if record is not None:
+                    record_session(*key, record)
+                report["done"] += 1
+                report["laps"] += laps
+            if verbose:
+                elapsed = time.perf_counter() - start
+                state = "failed: " + error if error else f"{laps} laps"
+                print(f"[{i}/{len(todo)}] {key[0]} {key[1]} {key[2]} – {state} ({i / elapsed:.2f} sessions/s)")
+
+    elapsed = time.perf_counter() - start
+    report["seconds"] = round(elapsed, 2)
+    report["sessions_per_s"] = round(report["done"] / elapsed, 3) if elapsed else 0.0
+    report["laps_per_s"] = round(report["laps"] / elapsed, 1) if elapsed else 0.0
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk export of FastF1 sessions to processed lap features")
+    parser.add_argument("--years", type=int, nargs="+", help="seasons to export (from the FastF1 schedule)")
+    parser.add_argument("--sessions", nargs="+", help="session codes to keep, e.g. Q R (default: all)")
+    parser.add_argument("--events", nargs="+", help="GP names to keep, e.g. Bahrain Monaco")
+    parser.add_argument("--fixtures", help="export every session of a Local_FastF1 fixture directory instead")
+    parser.add_argument("--workers", type=int, default=EXPORT_WORKERS)
+    parser.add_argument("--offline", action="store_true", help="use only the local FastF1 cache")
+    parser.add_argument("--refresh", action="store_true", help="reprocess sessions already up to date")
+    args = parser.parse_args(argv)
+
+    source = None
+    if args.fixtures:
+        source = LocalFastF1(args.fixtures)
+        keys = [
+            k for k in source.sessions()
+            if (args.years is None or k[0] in args.years)
+            and (args.events is None or k[1] in args.events)
+            and (args.sessions is None or k[2] in args.sessions)
+        ]
+    elif args.years:
+        if args.offline:
+            fastf1_module().Cache.offline_mode(True)
+        keys = season_sessions(args.years, args.sessions, args.events)
+    else:
+        parser.error("give --years or --fixtures")
+
+    report = export_sessions(keys, workers=args.workers, source=source, offline=args.offline, refresh=args.refresh)
+    print(
+        f"Exported {report['done']} sessions ({report['laps']} laps) in {report['seconds']} s – "
+        f"{report['sessions_per_s']} sessions/s, {report['laps_per_s']} laps/s; "
+        f"{report['skipped']} skipped, {len(report['failed'])} failed"
+    )
+    for key, error in report["failed"].items():
+        print("  failed:", *key, error)
+
+
+if __name__ == "__main__":
+    main()
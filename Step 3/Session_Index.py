@@ -0,0 +1,64 @@
+"""
+Per-session lookup structures for the dashboard: a SessionIndex built once per loaded session
+(sorted driver list, per-driver row slices, per-driver/compound groupings, degradation and
+lap-trend fits) and a bounded LRU
+cache of built Plotly figures keyed by (session, driver, chart, parameters).
+"""
+from collections import OrderedDict
+
+import pandas as pd
+
+from Degradation_Fits import degradation_fits, lap_trend_fits
+
+# Maximum number of figures kept in memory
+FIGURE_CACHE_SIZE = 64
+
+
+# Class: Index of one session's processed laps (built once, reused on every rerun)
+class SessionIndex:
+    def __init__(self, df: pd.DataFrame, key: tuple):
+        self.key = key
+        self.df = df
+        # One groupby pass: per-driver slices and per-(driver, compound) row positions
+        self.by_driver = {driver: rows for driver, rows in df.groupby("Driver", sort=True, observed=True)}
+        self.drivers = list(self.by_driver)
+        self.by_compound = (
+            df.groupby(["Driver", "Compound"], observed=True).indices if "Compound" in df.columns else {}
+        )
+        # Regression lines for the whole field, fitted once instead of on every chart render
+        self.degradation = degradation_fits(df)
+        self.lap_trends = lap_trend_fits(df)
+
+    # Method: Laps of one driver (a copy, so figure builders can add columns freely)
+    def driver_laps(self, driver: str) -> pd.DataFrame:
+        laps = self.by_driver.get(driver)
+        return laps.copy() if laps is not None else self.df.iloc[0:0].copy()
+
+    # Method: Laps of one driver on one compound
+    def compound_laps(self, driver: str, compound: str) -> pd.DataFrame:
+        rows = self.by_compound.get((driver, compound), [])
+        return self.df.iloc[rows].copy()
+
+
+# Class: Bounded LRU cache of built figures
+class FigureCache:
+    def __init__(self, maxsize: int = FIGURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._figures = OrderedDict()
+
+    # Method: Return the cached figure for key, building (and storing) it on a miss
+    def get(self, key: tuple, build):
+        if key in self._figures:
+            self._figures.move_to_end(key)
+            return self._figures[key]
+        figure = build()
+        self._figures[key] = figure
+        if len(self._figures) > self.maxsize:
+            self._figures.popitem(last=False)  # evict the least recently used figure
+        return figure
+
+    def clear(self):
+        self._figures.clear()
+
+    def __len__(self):
+        return len(self._figures)
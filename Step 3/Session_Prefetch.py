@@ -0,0 +1,125 @@
+"""
+Background session loading for the dashboard: a bounded thread pool loads and prepares several
+(year, GP, session) tuples concurrently (e.g. every session of a race weekend), reports the state
+of each one and hands out the sessions that are already ready, while the UI keeps running.
+A session handed out with get() is released from the prefetcher (the caller now owns it), so
+finished jobs do not keep every loaded DataFrame alive.
+"""
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from functools import partial
+
+from Processing_Cache import prepared_session
+from Stage_Timing import run_in_context
+
+# Sessions of a standard race weekend, in running order
+WEEKEND_SESSIONS = ["FP1", "FP2", "FP3", "Q", "R"]
+PREFETCH_WORKERS = 3
+
+
+# Class: Prefetch service
+# loader → function (year, gp, sess) -> processed DataFrame (default: the cached Step 3 pipeline);
+# source → optional FastF1 stand-in passed to the default loader (e.g. Local_FastF1.LocalFastF1())
+class SessionPrefetcher:
+    def __init__(self, max_workers: int = PREFETCH_WORKERS, loader=None, source=None):
+        self.loader = loader or partial(prepared_session, source=source)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        # key → {"state", "submitted", "started", "finished", "error", "future"}; state is one of
+        # queued, loading, ready, failed, cancelled, opened (handed out by get, result released)
+        self._jobs = {}
+
+    # Method: Queue sessions for background loading (queued/loading/ready ones are skipped;
+    # failed, cancelled and already opened ones are queued again)
+    def prefetch(self, sessions):
+        for key in sessions:
+            key = tuple(key)
+            with self._lock:
+                job = self._jobs.get(key)
+                if job is not None and job["state"] not in ("failed", "cancelled", "opened"):
+                    continue
+                self._jobs[key] = {"state": "queued", "submitted": time.time(), "started": None,
+                                   "finished": None, "error": None, "future": None}
+                # Run in the caller's context so the stage spans of the load reach its Timeline
+                self._jobs[key]["future"] = self._pool.submit(run_in_context(self._run), key)
+
+    # Method: Queue every session of a race weekend
+    def prefetch_weekend(self, year: int, gp: str, sessions=WEEKEND_SESSIONS):
+        self.prefetch((year, gp, sess) for sess in sessions)
+
+    def _run(self, key):
+        self._set(key, state="loading", started=time.time())
+        try:
+            df = self.loader(*key)
+        except Exception as exc:
+            self._set(key, state="failed", finished=time.time(), error=f"{type(exc).__name__}: {exc}")
+            raise
+        self._set(key, state="ready", finished=time.time())
+        return df
+
+    def _set(self, key, **fields):
+        with self._lock:
+            self._jobs[key].update(fields)
+
+    # Method: Per-session progress → {key: {"state", "seconds", "error"}}
+    def status(self):
+        now = time.time()
+        with self._lock:
+            return {
+                key: {
+                    "state": job["state"],
+                    "seconds": round((job["finished"] or now) - (job["started"] or now), 2),
+                    "error": job["error"],
+                }
+                for key, job in self._jobs.items()
+            }
+
+    # Method: Fraction of queued sessions that finished (ready, failed, cancelled or opened)
+    def progress(self):
+        states = [s["state"] for s in self.status().values()]
+        return sum(s not in ("queued", "loading") for s in states) / len(states) if states else 1.0
+
+    # Method: Keys of the sessions that are ready to use
+    def ready(self):
+        return [key for key, s in self.status().items() if s["state"] == "ready"]
+
+    # Method: Processed DataFrame of a session; None if unknown, failed or cancelled (see status()),
+    # already opened, or not ready yet with wait=False. The result is released once handed out
+    # (state "opened"); keep=True leaves it in the prefetcher for another get()
+    def get(self, key, wait: bool = False, timeout: float | None = None, keep: bool = False):
+        key = tuple(key)
+        with self._lock:
+            job = self._jobs.get(key)
+            future = None if job is None else job["future"]
+        if future is None or future.cancelled() or (not wait and not future.done()):
+            return None
+        try:
+            if future.exception(timeout=timeout) is not None:
+                return None
+        except CancelledError:
+            return None
+        df = future.result()
+        if not keep:
+            with self._lock:
+                if job["future"] is future:
+                    job.update(state="opened", future=None)
+        return df
+
+    # Method: Cancel sessions that have not started loading yet (all of them by default)
+    # Sessions already loading finish normally; returns the keys that were cancelled
+    def cancel(self, sessions=None):
+        cancelled = []
+        with self._lock:
+            keys = self._jobs if sessions is None else [tuple(key) for key in sessions]
+            for key in keys:
+                job = self._jobs.get(key)
+                if job is not None and job["state"] == "queued" and job["future"].cancel():
+                    job.update(state="cancelled", finished=time.time())
+                    cancelled.append(key)
+        return cancelled
+
+    # Method: Stop the pool; queued sessions are cancelled (and reported as such by status())
+    def shutdown(self, wait: bool = True):
+        self.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
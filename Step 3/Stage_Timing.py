@@ -0,0 +1,170 @@
+"""
+Lightweight timing and memory spans for the Step 3 pipeline stages (FastF1 load, CSV I/O,
+lap-time parsing, feature engineering, figure building). Spans are recorded into the Timeline
+of the current request (one per dashboard script run) and cost almost nothing when no Timeline
+is active. Nesting depth is tracked per context (so per thread), and work submitted to a thread
+pool through run_in_context keeps recording into the same Timeline. A Timeline can be shown as a table, exported as JSON, or saved as a Chrome/Perfetto
+trace file (chrome://tracing, ui.perfetto.dev).
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial, wraps
+from pathlib import Path
+
+# Stage categories (first part of a span name, e.g. "io.write_raw_csv")
+CATEGORIES = {
+    "fastf1": "FastF1 load",
+    "io": "I/O",
+    "parse": "Parsing",
+    "features": "Feature engineering",
+    "figure": "Rendering",
+    "cache": "Cache",
+}
+
+_CURRENT = contextvars.ContextVar("stage_timeline", default=None)
+# Nesting depth of the open spans in this context; a context variable, not a Timeline attribute,
+# so spans running concurrently in other threads do not shift each other's depth
+_DEPTH = contextvars.ContextVar("stage_depth", default=0)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+# Function: Resident memory of this process in bytes (None where /proc is not available)
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Class: Spans recorded during one request
+class Timeline:
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    # Method: Record one finished span (times in seconds from the timeline start)
+    def add(self, name: str, start: float, duration: float, depth: int, rss_delta, attrs: dict):
+        with self._lock:
+            self.spans.append({
+                "name": name,
+                "category": CATEGORIES.get(name.split(".", 1)[0], "Other"),
+                "start": round(start - self.origin, 6),
+                "seconds": round(duration, 6),
+                "depth": depth,
+                "rss_delta_mb": None if rss_delta is None else round(rss_delta / 2**20, 3),
+                "thread": threading.current_thread().name,
+                **attrs,
+            })
+
+    # Method: Total seconds per category, counting top-level spans of each category only
+    def totals(self) -> dict:
+        totals = {}
+        for span in self.spans:
+            parent_same = any(
+                other is not span and other["category"] == span["category"] and other["depth"] < span["depth"]
+                and other["start"] <= span["start"] <= other["start"] + other["seconds"]
+                for other in self.spans
+            )
+            if not parent_same:
+                totals[span["category"]] = round(totals.get(span["category"], 0.0) + span["seconds"], 6)
+        return totals
+
+    # Method: JSON-serialisable summary of the request
+    def to_dict(self) -> dict:
+        return {"label": self.label, "spans": sorted(self.spans, key=lambda s: s["start"]), "totals": self.totals()}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, default=str)
+
+    # Method: Chrome trace event format (complete "X" events, microseconds)
+    def to_trace(self) -> str:
+        pid = os.getpid()
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6, 1),
+                "dur": round(span["seconds"] * 1e6, 1),
+                "pid": pid,
+                "tid": span["thread"],
+                "args": {k: v for k, v in span.items() if k not in ("name", "category", "start", "seconds", "thread")},
+            }
+            for span in self.spans
+        ]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"label": self.label}}, default=str)
+
+    # Method: Write the JSON summary, or the Chrome trace with trace=True
+    def save(self, path: str | Path, trace: bool = False):
+        Path(path).write_text(self.to_trace() if trace else self.to_json())
+
+
+# Function: Start a new Timeline for the current request (e.g. at the top of a dashboard run)
+def begin(label: str = "") -> Timeline:
+    timeline = Timeline(label)
+    _CURRENT.set(timeline)
+    _DEPTH.set(0)
+    return timeline
+
+
+# Function: Collect the spans of a block into a fresh Timeline (restores the previous one after)
+@contextmanager
+def collect(label: str = ""):
+    timeline = Timeline(label)
+    token, depth_token = _CURRENT.set(timeline), _DEPTH.set(0)
+    try:
+        yield timeline
+    finally:
+        _CURRENT.reset(token)
+        _DEPTH.reset(depth_token)
+
+
+def current() -> Timeline | None:
+    return _CURRENT.get()
+
+
+# Function: Time a stage: with span("io.write_raw_csv", rows=len(df)): ...
+# Extra keyword arguments are stored with the span; no-op when no Timeline is active
+@contextmanager
+def span(name: str, **attrs):
+    timeline = _CURRENT.get()
+    if timeline is None:
+        yield
+        return
+    depth = _DEPTH.get()
+    depth_token = _DEPTH.set(depth + 1)
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        rss_after = rss_bytes()
+        _DEPTH.reset(depth_token)
+        delta = None if rss_before is None or rss_after is None else rss_after - rss_before
+        timeline.add(name, start, duration, depth, delta, attrs)
+
+
+# Function: Callable running func in a copy of the caller's context, for executor.submit:
+# pool.submit(run_in_context(func), *args). Spans opened in the worker thread are recorded into
+# the caller's Timeline, nested under the spans open at submission time
+def run_in_context(func):
+    return partial(contextvars.copy_context().run, func)
+
+
+# Function: Decorator form of span for whole functions
+def timed(name: str):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,109 @@
+"""
+Cold-start benchmark for the Pit-Wall Lite dashboard: imports the modules the app loads at startup
+in fresh Python processes, records the import time of each one (in import order, so shared
+dependencies are charged to the first module that needs them) and the slowest individual imports,
+checks that heavy libraries (FastF1, plotly.express, statsmodels, Matplotlib) stay deferred, and
+fails when the median cold start exceeds the budget.
+
+Usage:
+    python Startup_Benchmark.py --budget 2.0 --runs 5 --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules imported by Pit_Wall_Lite before the first render, in import order
+APP_MODULES = ["streamlit", "Data_Loader", "Processing_Cache", "Plotting_Prototypes", "Session_Index", "Session_Prefetch"]
+# Libraries that must only be imported on first use (session load, chart build)
+DEFERRED_MODULES = ["fastf1", "plotly.express", "statsmodels", "matplotlib"]
+# Cold-start budget (seconds) for importing all APP_MODULES
+STARTUP_BUDGET = 2.0
+STEP3_DIR = Path(__file__).resolve().parent
+
+# Child process: time each import and report which deferred modules got loaded
+_CHILD = """
+import json, sys, time
+timings = {}
+start = time.perf_counter()
+for name in sys.argv[1].split(","):
+    t = time.perf_counter()
+    __import__(name)
+    timings[name] = time.perf_counter() - t
+total = time.perf_counter() - start
+loaded = [m for m in sys.argv[2].split(",") if m in sys.modules]
+print(json.dumps({"modules": timings, "total": total, "deferred_loaded": loaded}))
+"""
+
+
+# Function: Parse "python -X importtime" output → [(module, self seconds, cumulative seconds)]
+def parse_importtime(stderr: str):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return rows
+
+
+# Function: One cold start in a fresh interpreter → dict with per-module times, total,
+# deferred modules that were loaded and the slowest single imports (self time)
+def measure_startup(modules=APP_MODULES, deferred=DEFERRED_MODULES, cwd: str | Path | None = None, top: int = 10):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(STEP3_DIR), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, ",".join(modules), ",".join(deferred)],
+        capture_output=True, text=True, cwd=cwd, env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup import failed:\n{result.stderr[-2000:]}")
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    slowest = sorted(parse_importtime(result.stderr), key=lambda row: row[1], reverse=True)[:top]
+    run["slowest"] = [{"module": m, "self": round(s, 4), "cumulative": round(c, 4)} for m, s, c in slowest]
+    return run
+
+
+# Function: Median over several cold starts, checked against the budget
+# Returns the report (also written to json_file if given); report["passed"] is the verdict
+def run_benchmark(runs: int = 5, budget: float = STARTUP_BUDGET, modules=APP_MODULES,
+                  deferred=DEFERRED_MODULES, cwd=None, json_file: str | Path | None = None) -> dict:
+    results = [measure_startup(modules, deferred, cwd) for _ in range(runs)]
+    total = statistics.median(r["total"] for r in results)
+    report = {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "budget": budget,
+        "total": round(total, 4),
+        "modules": {m: round(statistics.median(r["modules"][m] for r in results), 4) for m in modules},
+        "deferred_loaded": sorted({m for r in results for m in r["deferred_loaded"]}),
+        "slowest": results[len(results) // 2]["slowest"],
+    }
+    report["passed"] = total <= budget and not report["deferred_loaded"]
+    if json_file is not None:
+        with open(json_file, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pit-Wall Lite cold-start import benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET, help="seconds")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.runs, args.budget, json_file=args.json)
+    for module, seconds in report["modules"].items():
+        print(f"{module:<20} {seconds * 1000:8.1f} ms")
+    print(f"{'total':<20} {report['total'] * 1000:8.1f} ms (budget {report['budget'] * 1000:.0f} ms)")
+    if report["deferred_loaded"]:
+        print("Imported at startup but should be deferred:", ", ".join(report["deferred_loaded"]))
+    print("PASS" if report["passed"] else "FAIL")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
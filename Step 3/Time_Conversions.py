@@ -0,0 +1,97 @@
+"""
+Lap-time conversions shared by the loader and the lap schema: FastF1 timedelta strings
+('0 days 00:01:38.693000') or timedeltas to seconds, and seconds to 'M:SS.mmm' display strings,
+one value at a time or for a whole Series in bulk.
+"""
+import numpy as np
+import pandas as pd
+
+
+# Block: Time conversions
+# Function: Convert a time string like '0 days 00:01:38.693000' to seconds
+def convert_to_seconds(time_str):
+    # Treat missing values up front
+    if pd.isna(time_str):
+        return np.nan
+    try:
+        # Expected shape: "0 days 00:01:38.693000"
+        # Split into days and the HH:MM:SS.uuuuuu part
+        days, time = str(time_str).split(" days ")
+
+        # Split time into hours, minutes, seconds.decimals
+        h, m, s = time.split(":")
+
+        # Compute total seconds
+        # 1 day = 86400 s, 1 hour = 3600 s, 1 minute = 60 s
+        return int(days) * 86400 + int(h) * 3600 + int(m) * 60 + float(s)
+
+    except (ValueError, AttributeError):
+        # Any parsing issue falls back to NaN
+        return np.nan
+
+# Function: Convert seconds to a 'M:SS.mmm' string
+def convert_to_minutes(seconds):
+    if pd.isna(seconds):
+        return np.nan
+    minutes = int(seconds // 60)
+    rem     = float(seconds % 60)
+    return f"{minutes}:{rem:06.3f}"
+
+# Block: Vectorized time conversions (same output as the row-by-row functions above)
+# Fast path for the fixed-width FastF1 format "D days HH:MM:SS.ffffff" (22 characters)
+TIMEDELTA_TEMPLATE = "0 days 00:00:00.000000"
+_TEMPLATE_CODES = np.array([ord(c) for c in TIMEDELTA_TEMPLATE], dtype=np.uint32)
+_DIGIT_SLOTS = _TEMPLATE_CODES == ord("0")
+
+# Function: Integer value of the digit columns 'cols' of a (rows × characters) digit matrix
+def _digits_value(digits: np.ndarray, cols: list[int]) -> np.ndarray:
+    return digits[:, cols] @ (10 ** np.arange(len(cols) - 1, -1, -1))
+
+# Function: Convert a whole Series of time strings (or timedeltas) to seconds in bulk
+def convert_series_to_seconds(times: pd.Series) -> pd.Series:
+    times = pd.Series(times)
+    if pd.api.types.is_timedelta64_dtype(times):
+        # Same split as the string form "D days HH:MM:SS.fffffffff": whole minutes + seconds within the minute
+        ns = times.to_numpy(dtype="timedelta64[ns]").astype(np.int64)
+        minutes = ns // 60_000_000_000
+        seconds = (minutes * 60).astype(float) + (ns - minutes * 60_000_000_000) / 1e9
+        return pd.Series(np.where(times.isna(), np.nan, seconds), index=times.index, name=times.name)
+    width = len(TIMEDELTA_TEMPLATE)
+    seconds = np.full(len(times), np.nan)
+    present = times.notna().to_numpy()
+
+    # Strings as a (rows × characters) matrix of code points, padded with 0
+    text = times.to_numpy(dtype=str)
+    chars = text.view(np.uint32).reshape(len(text), text.itemsize // 4)
+    fast = present & (chars.shape[1] >= width)
+    if fast.any():
+        if chars.shape[1] > width:
+            fast &= chars[:, width] == 0  # exactly 22 characters
+        head = chars[:, :width]
+        is_digit = (head >= ord("0")) & (head <= ord("9"))
+        fast &= np.where(_DIGIT_SLOTS, is_digit, head == _TEMPLATE_CODES).all(axis=1)
+
+        digits = head[fast].astype(np.int64) - ord("0")
+        whole = (
+            _digits_value(digits, [0]) * 86400
+            + _digits_value(digits, [7, 8]) * 3600
+            + _digits_value(digits, [10, 11]) * 60
+        )
+        # Seconds as exact microseconds / 1e6: correctly rounded, identical to float("SS.ffffff")
+        micros = _digits_value(digits, [13, 14]) * 1_000_000 + _digits_value(digits, list(range(16, 22)))
+        seconds[fast] = whole.astype(float) + micros / 1e6
+
+    # Rows outside the fast format (other widths, signs, malformed) go through the scalar parser;
+    # missing values stay NaN
+    slow = present & ~fast
+    if slow.any():
+        seconds[slow] = times[slow].map(convert_to_seconds).to_numpy(dtype=float)
+    return pd.Series(seconds, index=times.index, name=times.name)
+
+# Function: Convert a whole Series of seconds to 'M:SS.mmm' strings in bulk
+# Each distinct value is formatted once (stint averages repeat on every lap of the stint)
+def convert_series_to_minutes(seconds: pd.Series) -> pd.Series:
+    seconds = pd.Series(seconds)
+    codes, uniques = pd.factorize(seconds)
+    formatted = np.array([convert_to_minutes(u) for u in uniques] + [np.nan], dtype=object)
+    return pd.Series(formatted[codes], index=seconds.index, name=seconds.name)
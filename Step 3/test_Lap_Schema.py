@@ -0,0 +1,45 @@
+"""
+Tests for the compact lap schema: column types after compact_laps, malformed time cells and the
+display strings added back for export.
+"""
+import numpy as np
+import pandas as pd
+
+from Lap_Schema import compact_laps, with_display_columns
+
+
+def raw_laps() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Driver": ["VER", "LEC", "HAM"],
+        "LapNumber": [1.0, 2.0, 3.0],
+        "TyreLife": [1.0, np.nan, 3.0],
+        "LapTime": ["0 days 00:01:32.500000", "not a time", np.nan],
+        "LapStartDate": ["2025-04-13 15:03:00", "garbage", None],
+        "StintAvgPaceSeconds": [92.5, 93.0, 93.5],
+        "StintAvgPace": ["1:32.500", "1:33.000", "1:33.500"],
+    })
+
+
+def test_compact_types():
+    df = compact_laps(raw_laps())
+    assert isinstance(df["Driver"].dtype, pd.CategoricalDtype)
+    assert df["LapNumber"].dtype == "int16"
+    assert df["TyreLife"].dtype == "Int16"
+    assert df["StintAvgPaceSeconds"].dtype == "float32"
+    assert "StintAvgPace" not in df.columns
+
+
+def test_malformed_times_become_nat():
+    df = compact_laps(raw_laps())
+    assert pd.api.types.is_timedelta64_dtype(df["LapTime"])
+    assert df["LapTime"].iloc[0] == pd.Timedelta(seconds=92.5)
+    assert df["LapTime"].iloc[1:].isna().all()
+    assert pd.api.types.is_datetime64_any_dtype(df["LapStartDate"])
+    assert df["LapStartDate"].iloc[1:].isna().all()
+
+
+def test_display_columns_restored_after_source():
+    df = with_display_columns(compact_laps(raw_laps()))
+    columns = list(df.columns)
+    assert columns.index("StintAvgPace") == columns.index("StintAvgPaceSeconds") + 1
+    assert df["StintAvgPace"].iloc[0] == raw_laps()["StintAvgPace"].iloc[0]
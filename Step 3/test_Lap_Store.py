@@ -0,0 +1,58 @@
+"""
+Tests for the Parquet lap store: round trip of typed columns, projection/filters, and sessions whose
+columns have different types (one all-NaN, one with strings).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from Lap_Store import has_laps, read_laps, write_laps
+
+
+def laps(drivers, deleted_reason):
+    return pd.DataFrame({
+        "Driver": drivers,
+        "Compound": ["SOFT", "HARD"],
+        "LapTime": pd.to_timedelta([90.5, 91.25], unit="s"),
+        "DeletedReason": deleted_reason,
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    write_laps(laps(["VER", "LEC"], [np.nan, np.nan]), "raw", 2025, "Bahrain", "FP1", tmp_path)  # double column
+    write_laps(laps(["VER", "HAM"], ["track limits", None]), "raw", 2025, "Bahrain", "R", tmp_path)  # string column
+    return tmp_path
+
+
+def test_round_trip_keeps_types(store):
+    df = read_laps("raw", 2025, "Bahrain", "FP1", root=store)
+    assert has_laps("raw", 2025, "Bahrain", "FP1", store)
+    assert pd.api.types.is_timedelta64_dtype(df["LapTime"])
+    assert df["LapTime"].tolist() == laps(["VER", "LEC"], [np.nan, np.nan])["LapTime"].tolist()
+    assert df[["year", "gp", "session"]].iloc[0].tolist() == [2025, "Bahrain", "FP1"]
+
+
+def test_single_session_with_different_column_type(store):
+    df = read_laps("raw", 2025, "Bahrain", "R", root=store)
+    assert df["DeletedReason"].tolist()[0] == "track limits"
+    assert df["Driver"].tolist() == ["VER", "HAM"]
+
+
+def test_projection_and_filters(store):
+    df = read_laps("raw", 2025, "Bahrain", "R", columns=["LapTime", "gp"], drivers=["HAM"], root=store)
+    assert list(df.columns) == ["LapTime", "gp"]
+    assert df["LapTime"].tolist() == [pd.Timedelta(seconds=91.25)]
+
+
+def test_multi_session_read_with_mixed_schemas(store):
+    df = read_laps("raw", 2025, root=store)
+    assert len(df) == 4
+    assert sorted(df["session"].unique()) == ["FP1", "R"]
+    assert df.loc[df["session"] == "R", "DeletedReason"].iloc[0] == "track limits"
+    assert df.loc[df["session"] == "FP1", "DeletedReason"].isna().all()
+
+    ver = read_laps("raw", drivers=["VER"], root=store)
+    assert len(ver) == 2
@@ -0,0 +1,77 @@
+"""
+Tests for the processing cache: unchanged sessions are reopened without loading FastF1, and a new
+raw input or feature version makes the features rerun. Runs offline on Local_FastF1 fixtures.
+"""
+import pandas as pd
+import pytest
+
+import Lap_Schema
+import Processing_Cache
+from Degradation_Fits import degradation_fits
+from Local_FastF1 import LocalFastF1
+from Processing_Cache import build_session, load_manifest, prepared_session, session_key
+
+SESSION = (2025, "Bahrain", "R")
+
+
+# Class: FastF1 stand-in that fails if the cache tries to load a session
+class NoDownload:
+    def get_session(self, *args):
+        raise AssertionError("session loaded although the cached one is still valid")
+
+
+def fixture_laps(last_lap: str = "0 days 00:01:33.100000") -> pd.DataFrame:
+    return pd.DataFrame({
+        "Driver": ["VER", "VER", "VER", "LEC", "LEC", "LEC"],
+        "Stint": [1.0, 1.0, 2.0, 1.0, 1.0, 1.0],
+        "Compound": ["SOFT", "SOFT", "HARD", "MEDIUM", "MEDIUM", "MEDIUM"],
+        "LapNumber": [1.0, 2.0, 3.0, 1.0, 2.0, 3.0],
+        "TyreLife": [1.0, 2.0, 1.0, 1.0, 2.0, 3.0],
+        "Team": ["Red Bull"] * 3 + ["Ferrari"] * 3,
+        "LapTime": [
+            "0 days 00:01:32.500000", "0 days 00:01:32.800000", "0 days 00:01:34.000000",
+            "0 days 00:01:33.000000", "0 days 00:01:32.900000", last_lap,
+        ],
+    })
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # All pipeline paths (data/raw, data/processed, data/store, data/fixtures) are relative
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data" / "fixtures").mkdir(parents=True)
+    fixture_laps().to_csv(tmp_path / "data" / "fixtures" / "Bahrain_2025_R_laps.csv", index=False)
+    return tmp_path
+
+
+def test_first_build_is_recorded_and_then_reused(workdir):
+    df = prepared_session(*SESSION, source=LocalFastF1())
+    entry = load_manifest()[session_key(*SESSION)]
+    assert entry["feature_version"] == Processing_Cache.FEATURE_VERSION
+    assert len(df) == 6
+
+    cached, record = build_session(*SESSION, source=NoDownload())
+    assert record is None
+    pd.testing.assert_frame_equal(cached, df)
+
+
+def test_feature_version_change_reprocesses(workdir, monkeypatch):
+    prepared_session(*SESSION, source=LocalFastF1())
+    monkeypatch.setattr(Processing_Cache, "FEATURE_VERSION", "changed")
+    _, record = build_session(*SESSION, source=LocalFastF1())
+    assert record is not None and record["feature_version"] == "changed"
+
+
+def test_raw_change_reprocesses_on_refresh(workdir):
+    prepared_session(*SESSION, source=LocalFastF1())
+    before = load_manifest()[session_key(*SESSION)]["raw_sha256"]
+
+    fixture_laps("0 days 00:01:35.000000").to_csv(workdir / "data" / "fixtures" / "Bahrain_2025_R_laps.csv", index=False)
+    df = prepared_session(*SESSION, refresh=True, source=LocalFastF1())
+    assert load_manifest()[session_key(*SESSION)]["raw_sha256"] != before
+    assert df["LapTimeSeconds"].iloc[-1] == pytest.approx(95.0)
+
+
+def test_feature_version_covers_schema_and_fits():
+    assert Lap_Schema in Processing_Cache.FEATURE_SOURCES
+    assert degradation_fits in Processing_Cache.FEATURE_SOURCES
@@ -0,0 +1,124 @@
+"""
+Tests for the background prefetcher on the offline FastF1 stand-in (with a simulated load delay):
+sessions load concurrently with visible progress, a failed session can be retried, queued sessions
+can be cancelled, a session handed out with get() is released by the prefetcher, and the stage
+spans of background loads reach the caller's Timeline.
+"""
+import time
+
+import pandas as pd
+import pytest
+
+from Local_FastF1 import LocalFastF1
+from Session_Prefetch import SessionPrefetcher
+from Stage_Timing import collect
+
+DELAY = 0.3
+
+
+def write_fixture(root, gp: str, sess: str):
+    pd.DataFrame({
+        "Driver": ["VER", "VER", "LEC"],
+        "Stint": [1.0, 1.0, 1.0],
+        "Compound": ["SOFT", "SOFT", "MEDIUM"],
+        "LapNumber": [1.0, 2.0, 1.0],
+        "TyreLife": [1.0, 2.0, 1.0],
+        "Team": ["Red Bull", "Red Bull", "Ferrari"],
+        "LapTime": ["0 days 00:01:32.500000", "0 days 00:01:32.800000", "0 days 00:01:33.000000"],
+    }).to_csv(root / "data" / "fixtures" / f"{gp}_2025_{sess}_laps.csv", index=False)
+
+
+# Function: Poll until condition() is true (fails the test after 'timeout' seconds)
+def wait_for(condition, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)   # pipeline paths (data/raw, data/processed, data/fixtures) are relative
+    (tmp_path / "data" / "fixtures").mkdir(parents=True)
+    for sess in ("FP1", "FP2", "Q"):
+        write_fixture(tmp_path, "Bahrain", sess)
+    return tmp_path
+
+
+@pytest.fixture
+def prefetcher_factory():
+    prefetchers = []
+
+    def make(**kwargs):
+        prefetchers.append(SessionPrefetcher(source=LocalFastF1(delay=DELAY), **kwargs))
+        return prefetchers[-1]
+
+    yield make
+    for prefetcher in prefetchers:
+        prefetcher.shutdown()
+
+
+def test_sessions_load_concurrently_with_progress(workdir, prefetcher_factory):
+    prefetcher = prefetcher_factory(max_workers=3)
+    keys = [(2025, "Bahrain", sess) for sess in ("FP1", "FP2", "Q")]
+    start = time.monotonic()
+    prefetcher.prefetch(keys)
+
+    wait_for(lambda: [s["state"] for s in prefetcher.status().values()] == ["loading"] * 3)
+    assert prefetcher.progress() == 0.0
+    wait_for(lambda: prefetcher.progress() == 1.0)
+    assert time.monotonic() - start < 3 * DELAY   # the three delays overlapped
+    assert sorted(prefetcher.ready()) == sorted(keys)
+
+
+def test_failed_session_is_retried(workdir, prefetcher_factory):
+    prefetcher = prefetcher_factory(max_workers=1)
+    key = (2025, "Bahrain", "R")
+    prefetcher.prefetch([key])
+    assert prefetcher.get(key, wait=True) is None
+    assert prefetcher.status()[key]["state"] == "failed"
+    assert "FileNotFoundError" in prefetcher.status()[key]["error"]
+
+    write_fixture(workdir, "Bahrain", "R")
+    prefetcher.prefetch([key])
+    assert len(prefetcher.get(key, wait=True)) == 3
+    assert prefetcher.status()[key]["error"] is None
+
+
+def test_queued_sessions_can_be_cancelled(workdir, prefetcher_factory):
+    prefetcher = prefetcher_factory(max_workers=1)
+    prefetcher.prefetch_weekend(2025, "Bahrain", ["FP1", "FP2", "Q"])
+    wait_for(lambda: prefetcher.status()[(2025, "Bahrain", "FP1")]["state"] == "loading")
+
+    assert prefetcher.cancel() == [(2025, "Bahrain", "FP2"), (2025, "Bahrain", "Q")]
+    assert prefetcher.get((2025, "Bahrain", "FP1"), wait=True) is not None   # the running load finishes
+    assert prefetcher.get((2025, "Bahrain", "Q"), wait=True) is None
+    assert prefetcher.progress() == 1.0
+
+    prefetcher.prefetch([(2025, "Bahrain", "Q")])   # cancelled sessions can be queued again
+    assert prefetcher.get((2025, "Bahrain", "Q"), wait=True) is not None
+
+
+def test_get_releases_the_result(workdir, prefetcher_factory):
+    prefetcher = prefetcher_factory(max_workers=1)
+    key = (2025, "Bahrain", "FP1")
+    prefetcher.prefetch([key])
+    assert prefetcher.get(key, wait=True, keep=True) is not None
+    assert prefetcher.ready() == [key]
+
+    assert prefetcher.get(key) is not None
+    assert prefetcher.status()[key]["state"] == "opened"
+    assert prefetcher.get(key) is None and prefetcher.ready() == []
+    assert prefetcher._jobs[key]["future"] is None   # no reference to the DataFrame is kept
+
+
+def test_load_spans_reach_the_callers_timeline(workdir, prefetcher_factory):
+    prefetcher = prefetcher_factory(max_workers=2)
+    with collect() as timeline:
+        prefetcher.prefetch([(2025, "Bahrain", "FP1"), (2025, "Bahrain", "FP2")])
+        prefetcher.get((2025, "Bahrain", "FP1"), wait=True)
+        prefetcher.get((2025, "Bahrain", "FP2"), wait=True)
+    loads = [s for s in timeline.spans if s["name"] == "fastf1.load"]
+    assert len(loads) == 2 and all(s["thread"].startswith("prefetch") for s in loads)
+    assert {s["depth"] for s in loads} == {0}
@@ -0,0 +1,51 @@
+"""
+Tests for the stage spans: nesting depth in one thread, concurrent spans in a thread pool (each
+thread keeps its own depth) and spans of pool work submitted with run_in_context reaching the
+caller's Timeline.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Stage_Timing import collect, run_in_context, span
+
+
+def test_nested_depth():
+    with collect() as timeline:
+        with span("io.outer"):
+            with span("parse.inner"):
+                pass
+        with span("io.after"):
+            pass
+    depths = {s["name"]: s["depth"] for s in timeline.spans}
+    assert depths == {"io.outer": 0, "parse.inner": 1, "io.after": 0}
+    assert set(timeline.totals()) == {"I/O", "Parsing"}
+
+
+def work(i):
+    with span("io.load", job=i):
+        time.sleep(0.02)
+        with span("parse.lap_times", job=i):
+            time.sleep(0.02)
+
+
+def test_concurrent_pool_spans_keep_their_depth():
+    with collect() as timeline:
+        with span("features.prefetch"):
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="pool") as pool:
+                for future in [pool.submit(run_in_context(work), i) for i in range(8)]:
+                    future.result()
+
+    loads = [s for s in timeline.spans if s["name"] == "io.load"]
+    parses = [s for s in timeline.spans if s["name"] == "parse.lap_times"]
+    assert len(loads) == len(parses) == 8   # spans from the worker threads are not lost
+    assert {s["depth"] for s in loads} == {1}   # nested under the span open at submission
+    assert {s["depth"] for s in parses} == {2}
+    assert all(s["thread"].startswith("pool") for s in loads)
+    assert [s["depth"] for s in timeline.spans if s["name"] == "features.prefetch"] == [0]
+
+
+def test_plain_submit_records_nothing():
+    with collect() as timeline:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(work, 0).result()
+    assert timeline.spans == []
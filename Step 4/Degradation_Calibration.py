@@ -0,0 +1,208 @@
+"""
+Calibration of the tyre degradation model lap_time = base + a*sqrt(k) + b*k from the processed
+laps of Step 3 (one or many sessions at once). Laps are fuel corrected, in/out laps and slow
+(Safety Car / traffic) laps are rejected, and a, b are fitted per compound (optionally per circuit)
+with one fixed intercept per stint, in a single vectorized solve over grouped sums.
+The result (a, b and the fitted base lap time) is written to deg_params.yaml together with
+per-compound fit diagnostics.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from Stint_Cost_Table import DEG_PARAMS_FILE
+
+PROCESSED_DIR = Path("data/processed")
+COLUMNS = ["Driver", "Stint", "Compound", "LapNumber", "LapInStint", "LapTimeSeconds"]
+OPTIONAL_COLUMNS = ["TrackStatus", "PitInTime", "PitOutTime"]
+COMPOUNDS = ["Soft", "Medium", "Hard"]
+
+# Fuel model (same assumptions as fuel_burn in Step 3): 100 kg burned over the race, 0.03 s/kg
+INITIAL_FUEL = 100.0
+FUEL_EFFECT = 0.03
+
+# Outlier rejection
+SLOW_LAP_FACTOR = 1.07      # laps slower than 107% of the session median (SC/VSC, traffic, damage)
+RESIDUAL_SIGMAS = 3.0       # second pass: drop laps whose residual exceeds 3 robust sigmas
+MIN_STINT_LAPS = 4          # stints shorter than this (after rejection) carry no slope information
+
+
+# Function: Read processed session CSVs into one frame with Year, GP and Session columns
+# files → paths named "{gp}_{year}_{sess}_processed.csv" (default: every race in PROCESSED_DIR)
+def load_processed_sessions(files=None) -> pd.DataFrame:
+    files = sorted(PROCESSED_DIR.glob("*_R_processed.csv")) if files is None else [Path(f) for f in files]
+    frames = []
+    for file in files:
+        gp, year, sess, _ = file.name.rsplit("_", 3)
+        df = pd.read_csv(file, usecols=lambda c: c in COLUMNS + OPTIONAL_COLUMNS)
+        frames.append(df.assign(Year=int(year), GP=gp, Session=sess))
+    if not frames:
+        raise FileNotFoundError("No processed sessions to calibrate from")
+    return pd.concat(frames, ignore_index=True)
+
+
+# Function: Keep the laps that describe tyre wear, with the model inputs k (0-based lap in stint)
+# and the fuel-corrected lap time; returns (laps, counts of rejected laps per reason)
+def clean_laps(df: pd.DataFrame, initial_fuel: float = INITIAL_FUEL):
+    sessions = ["Year", "GP", "Session"]
+    stints = sessions + ["Driver", "Stint"]
+    df = df.assign(Compound=df["Compound"].astype(str).str.title())
+    masks = {
+        "missing": df["LapTimeSeconds"].isna() | df["Stint"].isna() | ~df["Compound"].isin(COMPOUNDS),
+        # First lap of a stint is an out lap (or the standing start), the last one an in lap
+        "in_out": (df["LapInStint"] == 1)
+        | (df["LapInStint"] == df.groupby(stints)["LapInStint"].transform("max")),
+        "slow": df["LapTimeSeconds"]
+        > SLOW_LAP_FACTOR * df.groupby(sessions)["LapTimeSeconds"].transform("median"),
+    }
+    if "TrackStatus" in df.columns:
+        # Codes read from CSV may be int, float (1.0 once a cell is NaN) or str; missing = clear track
+        status = pd.to_numeric(df["TrackStatus"], errors="coerce").fillna(1)
+        masks["track_status"] = status != 1   # any flag, SC or VSC
+    for column in ("PitInTime", "PitOutTime"):
+        if column in df.columns:
+            masks["in_out"] |= df[column].notna()
+
+    rejected = pd.Series(False, index=df.index)
+    counts = {}
+    for reason, mask in masks.items():
+        counts[reason] = int((mask & ~rejected).sum())
+        rejected |= mask
+    laps = df[~rejected].copy()
+
+    # The car gets lighter every lap: add the fuel gain back so only tyre wear is left
+    fuel_per_lap = initial_fuel / laps.groupby(sessions)["LapNumber"].transform("max")
+    laps["FuelCorrected"] = laps["LapTimeSeconds"] + (laps["LapNumber"] - 1) * fuel_per_lap * FUEL_EFFECT
+    laps["k"] = laps["LapInStint"] - 1.0
+    return laps, counts
+
+
+# Function: Within-stint least squares of y on (sqrt(k), k), one solve for every model group
+# Per-stint means are removed (one free intercept per stint), the centred sums are added up per
+# group into 2×2 normal equations and all groups are solved at once.
+# Returns (group index, coefficients [a, b], normal matrices, centred Syy, per-lap residuals, per-lap stint means)
+def _fit(laps: pd.DataFrame, stints: list[str], groups: list[str]):
+    data = pd.DataFrame({"x1": np.sqrt(laps["k"]), "x2": laps["k"], "y": laps["FuelCorrected"]})
+    means = data.groupby([laps[c] for c in stints]).transform("mean")
+    d = data - means
+    sums = pd.DataFrame({
+        "s11": d.x1 * d.x1, "s12": d.x1 * d.x2, "s22": d.x2 * d.x2,
+        "s1y": d.x1 * d.y, "s2y": d.x2 * d.y, "syy": d.y * d.y,
+    })
+    totals = sums.groupby([laps[c] for c in groups]).sum()
+    xx = totals[["s11", "s12", "s12", "s22"]].to_numpy().reshape(-1, 2, 2)
+    xy = totals[["s1y", "s2y"]].to_numpy()
+
+    beta = np.full((len(totals), 2), np.nan)
+    solvable = np.abs(np.linalg.det(xx)) > 1e-9
+    beta[solvable] = np.linalg.solve(xx[solvable], xy[solvable][..., None])[..., 0]
+
+    rows = totals.index.get_indexer(pd.MultiIndex.from_frame(laps[groups]) if len(groups) > 1 else laps[groups[0]])
+    residual = d.y - beta[rows, 0] * d.x1 - beta[rows, 1] * d.x2
+    return totals.index, beta, xx, totals["syy"].to_numpy(), residual, means
+
+
+# Function: Fit a, b (and base) per compound, or per (circuit, compound) with by_circuit=True
+# df → processed laps of one or many sessions (see load_processed_sessions)
+# Returns a DataFrame with one row per group: a, b, base, standard errors, RMSE, within-stint R²,
+# number of laps/stints/sessions and laps rejected as residual outliers; the counts of laps
+# rejected before fitting are in fits.attrs["rejected"]
+def calibrate(df: pd.DataFrame, by_circuit: bool = False, initial_fuel: float = INITIAL_FUEL,
+              min_stint_laps: int = MIN_STINT_LAPS) -> pd.DataFrame:
+    for column, value in (("Year", 0), ("GP", "unknown"), ("Session", "R")):
+        if column not in df.columns:
+            df = df.assign(**{column: value})
+    laps, rejected = clean_laps(df, initial_fuel)
+    stints = ["Year", "GP", "Session", "Driver", "Stint"]
+    groups = (["GP"] if by_circuit else []) + ["Compound"]
+
+    def long_stints(laps):
+        return laps[laps.groupby(stints)["k"].transform("size") >= min_stint_laps]
+
+    # First pass, then drop laps beyond RESIDUAL_SIGMAS robust sigmas (scaled MAD) and refit
+    laps = long_stints(laps)
+    residual = _fit(laps, stints, groups)[4]
+    sigma = 1.4826 * residual.abs().groupby([laps[c] for c in groups]).transform("median")
+    keep = residual.abs() <= RESIDUAL_SIGMAS * sigma
+    outliers = (~keep).groupby([laps[c] for c in groups]).sum().rename("outliers")
+    laps = long_stints(laps[keep])
+    index, beta, xx, syy, residual, means = _fit(laps, stints, groups)
+
+    # Per-stint intercept at k = 0 (stint means minus the fitted wear) → base
+    stint_means = means.groupby([laps[c] for c in stints]).first()
+    per_stint = laps.groupby(stints)["Compound"].first().reset_index()
+    rows = index.get_indexer(pd.MultiIndex.from_frame(per_stint[groups]) if len(groups) > 1 else per_stint[groups[0]])
+    per_stint["Intercept"] = (
+        stint_means["y"] - beta[rows, 0] * stint_means["x1"] - beta[rows, 1] * stint_means["x2"]
+    ).to_numpy()
+    per_group = per_stint.groupby(groups)
+
+    fits = pd.DataFrame(index=index)
+    fits["a"] = beta[:, 0]
+    fits["b"] = beta[:, 1]
+    fits["base"] = per_group["Intercept"].median()
+    fits["laps"] = laps.groupby(groups).size()
+    fits["stints"] = per_group.size()
+    fits["sessions"] = per_stint.drop_duplicates(groups + ["Year", "GP", "Session"]).groupby(groups).size()
+    fits["outliers"] = outliers.reindex(index, fill_value=0)
+
+    # Diagnostics: residual variance with one dof per stint intercept and two for (a, b)
+    ssr = (residual * residual).groupby([laps[c] for c in groups]).sum().reindex(index).to_numpy()
+    dof = np.maximum(fits["laps"].to_numpy() - fits["stints"].to_numpy() - 2, 1)
+    sigma2 = ssr / dof
+    cov = np.full_like(xx, np.nan)
+    solvable = ~np.isnan(beta[:, 0])
+    cov[solvable] = np.linalg.inv(xx[solvable])
+    fits["se_a"] = np.sqrt(sigma2 * cov[:, 0, 0])
+    fits["se_b"] = np.sqrt(sigma2 * cov[:, 1, 1])
+    fits["rmse"] = np.sqrt(sigma2)
+    fits["r2"] = 1 - ssr / np.where(syy > 0, syy, np.nan)   # within-stint R²
+    fits = fits.reset_index()
+    fits.attrs["rejected"] = rejected
+    return fits
+
+
+# Function: deg_params dictionary {compound: {"a", "b", "base", diagnostics}} from a calibrate() table
+# base is the fitted fresh-tyre lap time of the compound, used by the stint-cost tables in place of
+# BASE_LAP_TIME; diagnostics are ignored by them, so the file stays a valid deg_params input
+def fits_to_deg_params(fits: pd.DataFrame) -> dict:
+    params = {}
+    for _, fit in fits.dropna(subset=["a", "b", "base"]).iterrows():
+        entry = {"a": round(float(fit["a"]), 6), "b": round(float(fit["b"]), 6), "base": round(float(fit["base"]), 3)}
+        entry["diagnostics"] = {
+            "se_a": round(float(fit["se_a"]), 6),
+            "se_b": round(float(fit["se_b"]), 6),
+            "rmse": round(float(fit["rmse"]), 4),
+            "r2": round(float(fit["r2"]), 4),
+            "laps": int(fit["laps"]),
+            "stints": int(fit["stints"]),
+            "sessions": int(fit["sessions"]),
+        }
+        params[fit["Compound"]] = entry
+    return params
+
+
+# Function: Calibrate from processed sessions and write deg_params.yaml
+# (per circuit: one "deg_params_{gp}.yaml" per GP next to output_file)
+# Returns the fit table; the simulator picks up the new file through stint_cost_table_from_file.
+# Raises ValueError (and writes nothing) if a file would get no fitted compound
+def write_deg_params(df: pd.DataFrame | None = None, output_file: str | Path = DEG_PARAMS_FILE,
+                     by_circuit: bool = False, **kwargs) -> pd.DataFrame:
+    df = load_processed_sessions() if df is None else df
+    fits = calibrate(df, by_circuit=by_circuit, **kwargs)
+    output_file = Path(output_file)
+    output_file.parent.mkdir(exist_ok=True, parents=True)
+    targets = (
+        [(output_file.with_name(f"{output_file.stem}_{gp}{output_file.suffix}"), group) for gp, group in fits.groupby("GP")]
+        if by_circuit else [(output_file, fits)]
+    )
+    params = [(path, fits_to_deg_params(group)) for path, group in targets]
+    if not params or not all(entry for _, entry in params):
+        raise ValueError(f"No compound could be fitted, {output_file} left unchanged "
+                         f"(laps rejected before fitting: {fits.attrs['rejected']})")
+    for path, entry in params:
+        with open(path, "w") as f:
+            yaml.safe_dump(entry, f, sort_keys=True, indent=2, default_flow_style=False)
+    return fits
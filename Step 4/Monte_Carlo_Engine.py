@@ -0,0 +1,158 @@
+"""
+Vectorized Monte Carlo engine for race strategies: a strategy is described by its compound
+sequence, the pit-lap window of each stop and the race length, and all N simulated races
+are computed at once as NumPy arrays of shape (simulations × laps).
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from Stint_Cost_Table import BASE_LAP_TIME, stint_cost_table
+
+# Tire degradation model: lap_time = base + a*sqrt(lap_in_stint) + b*lap_in_stint
+# Default degradation parameters (same values written to deg_params.yaml in the notebook)
+DEG_PARAMS = {
+    "Soft": {"a": 0.05, "b": 0.01},
+    "Medium": {"a": 0.03, "b": 0.008},
+    "Hard": {"a": 0.02, "b": 0.005},
+}
+
+# Number of races simulated per block, keeps the (block × laps) matrices small in memory
+CHUNK_SIZE = 100_000
+
+
+# Class: Strategy specification
+# compounds   → tyre sequence, e.g. ("Soft", "Medium")
+# pit_windows → one inclusive (first, last) lap window per stop; the pit lap is uniform inside it
+# race_laps   → full race length
+# pit_loss    → seconds added on each pit lap (0 reproduces the notebook's plain strategies)
+@dataclass(frozen=True)
+class StrategySpec:
+    compounds: tuple[str, ...]
+    pit_windows: tuple[tuple[int, int], ...]
+    race_laps: int = 57
+    pit_loss: float = 0.0
+
+    def __post_init__(self):
+        if len(self.compounds) != len(self.pit_windows) + 1:
+            raise ValueError("A strategy needs exactly one pit window per compound change")
+        previous_last = 0
+        for first, last in self.pit_windows:
+            if not (previous_last < first <= last < self.race_laps):
+                raise ValueError(
+                    f"Pit windows must be increasing, non-overlapping and inside the race: {self.pit_windows}"
+                )
+            previous_last = last
+
+    @property
+    def label(self):
+        return " → ".join(self.compounds)
+
+
+# Block: The three 1-stop strategies analysed in the notebook (57-lap race)
+SOFT_MEDIUM = StrategySpec(("Soft", "Medium"), ((12, 15),))
+SOFT_HARD   = StrategySpec(("Soft", "Hard"), ((10, 11),))
+MEDIUM_HARD = StrategySpec(("Medium", "Hard"), ((15, 19),))
+
+
+# Function: Stint-cost table for deg_params and the table rows of spec.compounds
+def compound_rows(spec: StrategySpec, deg_params: dict | None = None, base: float = BASE_LAP_TIME):
+    table = stint_cost_table(DEG_PARAMS if deg_params is None else deg_params, base)
+    return table, np.array([table.index[c] for c in spec.compounds])
+
+
+# Function: Stint lengths of each race from its pit laps → int array (n × compounds)
+def stint_lengths(spec: StrategySpec, pit_laps: np.ndarray):
+    n = len(pit_laps)
+    bounds = np.concatenate(
+        [np.zeros((n, 1), dtype=np.int64), pit_laps, np.full((n, 1), spec.race_laps)], axis=1
+    )
+    return np.diff(bounds, axis=1)
+
+
+# Function: Draw the pit laps of n races → int array (n × stops)
+def sample_pit_laps(spec: StrategySpec, n: int, rng: np.random.Generator):
+    pits = np.empty((n, len(spec.pit_windows)), dtype=np.int64)
+    for s, (first, last) in enumerate(spec.pit_windows):
+        pits[:, s] = rng.integers(first, last + 1, size=n)
+    return pits
+
+
+# Function: Map uniforms in [0, 1] (n × stops) to pit laps inside each window
+# Used to share pit-timing draws between strategies with different windows
+def pit_laps_from_uniforms(spec: StrategySpec, u: np.ndarray):
+    pits = np.empty((len(u), len(spec.pit_windows)), dtype=np.int64)
+    for s, (first, last) in enumerate(spec.pit_windows):
+        width = last - first + 1
+        pits[:, s] = first + np.minimum((u[:, s] * width).astype(np.int64), width - 1)
+    return pits
+
+
+# Function: Lap-time matrix (n × race_laps) for given pit laps
+# Stint k covers laps (pit[k-1], pit[k]]; the lap index inside a stint starts at 0,
+# exactly like simulate_stint in the notebook.
+def lap_time_matrix(
+    spec: StrategySpec,
+    pit_laps: np.ndarray,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+):
+    table, rows = compound_rows(spec, deg_params, base)
+    laps = np.arange(1, spec.race_laps + 1)
+
+    # Stint index of each lap: how many pit stops happened strictly before it
+    stint = (laps[None, :, None] > pit_laps[:, None, :]).sum(axis=2)
+
+    # First lap of each stint (lap 1 for the opening stint, pit + 1 afterwards)
+    stint_start = np.concatenate([np.ones((len(pit_laps), 1), dtype=np.int64), pit_laps + 1], axis=1)
+    lap_in_stint = laps[None, :] - np.take_along_axis(stint_start, stint, axis=1)
+
+    table.reserve(lap_in_stint + 1)  # grow the table if a stint is longer than it
+    times = table.lap_times[rows[stint], lap_in_stint]
+
+    # Pit-stop penalty on each pit lap
+    if spec.pit_loss:
+        race = np.arange(len(pit_laps))[:, None]
+        times[race, pit_laps - 1] += spec.pit_loss
+    return times
+
+
+# Function: Simulate n races and return the full (n × race_laps) lap-time matrix
+def simulate_lap_times(
+    spec: StrategySpec,
+    n: int,
+    rng: np.random.Generator | None = None,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+):
+    rng = np.random.default_rng() if rng is None else rng
+    pit_laps = sample_pit_laps(spec, n, rng)
+    return lap_time_matrix(spec, pit_laps, deg_params, base), pit_laps
+
+
+# Function: Simulate n races and return only the total race times (seconds), block by block
+# Each race total is the sum of its stint costs, read from the cumulative stint-cost table.
+# With a StreamingSummary in 'summary', each block is fed to it and the summary is returned
+# instead of the n race times, so memory stays constant whatever n is.
+def simulate_race_times(
+    spec: StrategySpec,
+    n: int = 10000,
+    rng: np.random.Generator | None = None,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+    chunk_size: int = CHUNK_SIZE,
+    summary=None,
+):
+    rng = np.random.default_rng() if rng is None else rng
+    table, rows = compound_rows(spec, deg_params, base)
+    pit_penalty = spec.pit_loss * len(spec.pit_windows)
+    totals = None if summary is not None else np.empty(n)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        lengths = stint_lengths(spec, sample_pit_laps(spec, stop - start, rng))
+        block = table.stint_cost(rows[None, :], lengths).sum(axis=1) + pit_penalty
+        if summary is not None:
+            summary.update(block)
+        else:
+            totals[start:stop] = block
+    return summary if summary is not None else totals
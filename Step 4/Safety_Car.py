@@ -0,0 +1,120 @@
+"""
+Batched Safety Car scenarios: generates the Safety Car laps of N races at once as a boolean
+(or bit-packed) races × laps mask, and applies the pit-stop penalty and the Safety Car
+slowdown to whole lap-time matrices with array operations.
+"""
+import numpy as np
+
+from Monte_Carlo_Engine import BASE_LAP_TIME, CHUNK_SIZE, StrategySpec, lap_time_matrix, sample_pit_laps
+
+# Safety Car model (same values as Safety_Car_Probability in the notebook)
+SC_PROBABILITY = 0.05     # probability of SC deployment on each checked lap
+SC_WINDOW      = (10, 40) # first and last lap where an SC can be running
+SC_MAX_LAPS    = 5        # SC lasts 1 to SC_MAX_LAPS laps
+SC_SLOWDOWN    = 1.3      # lap time multiplier under SC
+PIT_LOSS       = 22.0     # pit-stop penalty (s) on the pit lap
+
+# 1-stop Soft → Medium strategy with pit-stop penalty (notebook's simulate_race_SC)
+SOFT_MEDIUM_SC = StrategySpec(("Soft", "Medium"), ((12, 15),), pit_loss=PIT_LOSS)
+
+
+# Function: Safety Car masks for n races → bool array (n × race_laps), column j is lap j+1
+# Laps of the window are scanned in order for all races together: a race that is not already
+# under SC triggers one with probability p, lasting 1–max_laps laps and clipped at the window end;
+# the next check happens on the lap after the SC ends. packed=True returns np.packbits rows.
+def safety_car_masks(
+    n: int,
+    rng: np.random.Generator | None = None,
+    race_laps: int = 57,
+    p: float = SC_PROBABILITY,
+    window: tuple[int, int] = SC_WINDOW,
+    max_laps: int = SC_MAX_LAPS,
+    packed: bool = False,
+):
+    rng = np.random.default_rng() if rng is None else rng
+    first, last = window
+    mask = np.zeros((n, race_laps), dtype=bool)
+    sc_until = np.zeros(n, dtype=np.int64)  # last lap of the current SC period (0 = none yet)
+
+    for lap in range(first, last + 1):
+        trigger = (sc_until < lap) & (rng.random(n) < p)
+        duration = rng.integers(1, max_laps + 1, size=n)
+        sc_until = np.where(trigger, np.minimum(lap + duration - 1, last), sc_until)
+        mask[:, lap - 1] = sc_until >= lap
+
+    return np.packbits(mask, axis=1) if packed else mask
+
+
+# Function: Safety Car masks from pre-drawn uniforms (n × window laps) → bool (n × race_laps)
+# Same scan as safety_car_masks, but the trigger and duration draws of each window lap are given,
+# so several strategies can share one scenario (common random numbers) and 1 - u gives its
+# antithetic twin.
+def safety_car_masks_from_uniforms(
+    trigger_u: np.ndarray,
+    duration_u: np.ndarray,
+    race_laps: int = 57,
+    p: float = SC_PROBABILITY,
+    window: tuple[int, int] = SC_WINDOW,
+    max_laps: int = SC_MAX_LAPS,
+):
+    first, last = window
+    n = len(trigger_u)
+    mask = np.zeros((n, race_laps), dtype=bool)
+    sc_until = np.zeros(n, dtype=np.int64)
+    durations = np.minimum((duration_u * max_laps).astype(np.int64), max_laps - 1) + 1
+
+    for j, lap in enumerate(range(first, last + 1)):
+        trigger = (sc_until < lap) & (trigger_u[:, j] < p)
+        sc_until = np.where(trigger, np.minimum(lap + durations[:, j] - 1, last), sc_until)
+        mask[:, lap - 1] = sc_until >= lap
+    return mask
+
+
+# Function: Expand bit-packed masks back to bool (n × race_laps)
+def unpack_safety_car_masks(packed: np.ndarray, race_laps: int = 57):
+    return np.unpackbits(packed, axis=1, count=race_laps).astype(bool)
+
+
+# Function: List of SC laps (1-based) of a single race mask, like Safety_Car_Probability()
+def safety_car_laps(mask_row: np.ndarray):
+    return (np.flatnonzero(mask_row) + 1).tolist()
+
+
+# Function: Total race times for given pit laps and SC masks
+# The pit penalty is added on the pit lap first, then SC laps are slowed down by SC_SLOWDOWN
+def race_times_with_safety_car(
+    spec: StrategySpec,
+    pit_laps: np.ndarray,
+    sc_mask: np.ndarray,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+    slowdown: float = SC_SLOWDOWN,
+):
+    times = lap_time_matrix(spec, pit_laps, deg_params, base)
+    times[sc_mask] *= slowdown
+    return times.sum(axis=1)
+
+
+# Function: Monte Carlo race times with Safety Car, n races computed block by block
+# With a StreamingSummary in 'summary', blocks are fed to it and the summary is returned
+def simulate_race_times_sc(
+    spec: StrategySpec = SOFT_MEDIUM_SC,
+    n: int = 10000,
+    rng: np.random.Generator | None = None,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+    chunk_size: int = CHUNK_SIZE,
+    summary=None,
+):
+    rng = np.random.default_rng() if rng is None else rng
+    totals = None if summary is not None else np.empty(n)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        pit_laps = sample_pit_laps(spec, stop - start, rng)
+        sc_mask = safety_car_masks(stop - start, rng, spec.race_laps)
+        block = race_times_with_safety_car(spec, pit_laps, sc_mask, deg_params, base)
+        if summary is not None:
+            summary.update(block)
+        else:
+            totals[start:stop] = block
+    return summary if summary is not None else totals
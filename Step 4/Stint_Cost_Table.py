@@ -0,0 +1,110 @@
+"""
+Precomputed stint-cost tables for the tyre degradation model: for every compound the lap times
+base + a*sqrt(k) + b*k are stored once together with their cumulative sum, so the cost of a
+stint of any length (or of a whole array of stint lengths) is a single array lookup. A calibrated
+deg_params.yaml carries its own base per compound; otherwise BASE_LAP_TIME is used.
+The last few tables are cached per deg_params set and rebuilt automatically when deg_params.yaml changes.
+"""
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+BASE_LAP_TIME = 90.0
+DEG_PARAMS_FILE = Path("fastf1-toolbox/inputs/deg_params.yaml")
+
+# Default table length (laps per stint); grows on demand for longer stints
+MAX_STINT_LAPS = 100
+# Tables kept in memory (least recently used evicted): calibrations and optimizer sweeps create a
+# new parameter set each time, only the last few are ever reused
+TABLE_CACHE_SIZE = 8
+
+
+# Function: Base lap time of one compound entry: its calibrated "base", else the default
+def compound_base(params: dict, base: float = BASE_LAP_TIME) -> float:
+    return float(params.get("base", base))
+
+
+# Class: Cumulative stint-cost table for one deg_params set
+# base → lap time of compounds without their own "base" entry (calibrated files have one each)
+class StintCostTable:
+    def __init__(self, deg_params: dict, base: float = BASE_LAP_TIME, max_laps: int = MAX_STINT_LAPS):
+        self.deg_params = deg_params
+        self.compounds = list(deg_params)
+        self.index = {c: i for i, c in enumerate(self.compounds)}
+        self.base = np.array([compound_base(deg_params[c], base) for c in self.compounds], dtype=float)
+        self.a = np.array([deg_params[c]["a"] for c in self.compounds], dtype=float)
+        self.b = np.array([deg_params[c]["b"] for c in self.compounds], dtype=float)
+        self._build(max_laps)
+
+    # Method: Fill lap_times (compounds × max_laps) and cumulative (compounds × max_laps + 1)
+    # cumulative[c, n] is the total time of an n-lap stint (lap index 0..n-1), cumulative[c, 0] = 0
+    def _build(self, max_laps: int):
+        k = np.arange(max_laps)
+        self.max_laps = max_laps
+        self.lap_times = self.base[:, None] + self.a[:, None] * np.sqrt(k) + self.b[:, None] * k
+        self.cumulative = np.zeros((len(self.compounds), max_laps + 1))
+        np.cumsum(self.lap_times, axis=1, out=self.cumulative[:, 1:])
+
+    # Method: Make sure stints of the given length(s) fit in the table
+    def reserve(self, laps):
+        longest = int(np.max(laps, initial=0))
+        if longest > self.max_laps:
+            self._build(max(longest, 2 * self.max_laps))
+
+    # Method: Row indices for a compound name or an array of compound indices
+    def rows(self, compound):
+        return self.index[compound] if isinstance(compound, str) else np.asarray(compound)
+
+    # Method: Total time of a stint → scalar for a scalar length, array for an array of lengths
+    def stint_cost(self, compound, laps):
+        self.reserve(laps)
+        cost = self.cumulative[self.rows(compound), laps]
+        return float(cost) if np.ndim(cost) == 0 else cost
+
+    # Method: Lap time at a given (0-based) lap index inside the stint, scalar or array
+    def lap_time(self, compound, lap_in_stint):
+        self.reserve(np.asarray(lap_in_stint) + 1)
+        time = self.lap_times[self.rows(compound), lap_in_stint]
+        return float(time) if np.ndim(time) == 0 else time
+
+
+# Block: Table cache, one table per (deg_params, base) set, least recently used first
+_TABLES = OrderedDict()
+_FILE_TABLES = {}
+
+
+def _params_key(deg_params: dict, base: float):
+    return tuple((c, compound_base(p, base), float(p["a"]), float(p["b"])) for c, p in sorted(deg_params.items()))
+
+
+# Function: Cached table for a deg_params dictionary (built once per parameter set, at most
+# TABLE_CACHE_SIZE sets kept)
+def stint_cost_table(deg_params: dict, base: float = BASE_LAP_TIME):
+    key = _params_key(deg_params, base)
+    if key in _TABLES:
+        _TABLES.move_to_end(key)
+        return _TABLES[key]
+    table = _TABLES[key] = StintCostTable(deg_params, base)
+    if len(_TABLES) > TABLE_CACHE_SIZE:
+        _TABLES.popitem(last=False)  # evict the least recently used table
+    return table
+
+
+# Function: Read deg_params.yaml
+def load_deg_params(path: str | Path = DEG_PARAMS_FILE):
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+# Function: Cached table for deg_params.yaml, rebuilt whenever the file changes on disk
+def stint_cost_table_from_file(path: str | Path = DEG_PARAMS_FILE, base: float = BASE_LAP_TIME):
+    path = Path(path)
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size, base)
+    cached = _FILE_TABLES.get(path.resolve())
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, stint_cost_table(load_deg_params(path), base))
+        _FILE_TABLES[path.resolve()] = cached
+    return cached[1]
@@ -0,0 +1,114 @@
+"""
+Variance-reduced strategy comparison: all candidate strategies run on the same random Safety Car
+and pit-timing scenarios (common random numbers), optionally with antithetic draws, and the paired
+difference of each strategy to a reference is reported with a confidence interval. Batches are
+simulated until every interval reaches the target precision.
+"""
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from Monte_Carlo_Engine import BASE_LAP_TIME, StrategySpec, lap_time_matrix, pit_laps_from_uniforms
+from Safety_Car import SC_WINDOW, safety_car_masks_from_uniforms, race_times_with_safety_car
+from Streaming_Stats import StreamingSummary
+
+# Fewest independent samples per difference before its interval can count as converged
+MIN_SAMPLES = 30
+
+
+# Function: Draw n shared scenarios as uniforms; antithetic=True appends the 1 - u twin of each
+# → dict of arrays with 2n rows, where row i and row n + i form an antithetic pair
+def draw_scenarios(n: int, rng: np.random.Generator, stops: int, antithetic: bool = True):
+    window_laps = SC_WINDOW[1] - SC_WINDOW[0] + 1
+    scenario = {
+        "pit": rng.random((n, stops)),
+        "sc_trigger": rng.random((n, window_laps)),
+        "sc_duration": rng.random((n, window_laps)),
+    }
+    if antithetic:
+        scenario = {key: np.concatenate([u, 1.0 - u]) for key, u in scenario.items()}
+    return scenario
+
+
+# Function: Race times of one strategy on shared scenarios
+def scenario_race_times(
+    spec: StrategySpec,
+    scenario: dict,
+    safety_car: bool = True,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+):
+    pit_laps = pit_laps_from_uniforms(spec, scenario["pit"])
+    if not safety_car:
+        return lap_time_matrix(spec, pit_laps, deg_params, base).sum(axis=1)
+    sc_mask = safety_car_masks_from_uniforms(scenario["sc_trigger"], scenario["sc_duration"], spec.race_laps)
+    return race_times_with_safety_car(spec, pit_laps, sc_mask, deg_params, base)
+
+
+# Function: CI half-width of a summary's mean; inf while the std is undefined (fewer than 2 samples)
+def half_width(summary: StreamingSummary, z: float) -> float:
+    if np.isnan(summary.std):
+        return np.inf
+    return float(z * summary.std / np.sqrt(summary.n))
+
+
+# Function: Compare strategies on common random numbers until the paired differences are precise
+# reference        → index of the strategy every other one is compared to
+# target_half_width → stop once every CI half-width (seconds) is below it
+# batch_size       → scenarios per batch (doubled when antithetic)
+# max_sims         → hard cap on simulated races per strategy
+# min_samples      → independent samples (antithetic pair means) needed before checking the target
+def compare_strategies(
+    specs: list[StrategySpec],
+    reference: int = 0,
+    target_half_width: float = 0.5,
+    confidence: float = 0.95,
+    batch_size: int = 10000,
+    max_sims: int = 1_000_000,
+    min_samples: int = MIN_SAMPLES,
+    antithetic: bool = True,
+    safety_car: bool = True,
+    rng: np.random.Generator | None = None,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+):
+    if len({spec.race_laps for spec in specs}) != 1:
+        raise ValueError("All strategies must have the same race length")
+    rng = np.random.default_rng() if rng is None else rng
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    stops = max(len(spec.pit_windows) for spec in specs)
+
+    times = [StreamingSummary(resolution=64) for _ in specs]
+    diffs = [StreamingSummary(resolution=64) for _ in specs]
+    sims = 0
+    while True:
+        scenario = draw_scenarios(batch_size, rng, stops, antithetic)
+        results = [scenario_race_times(spec, scenario, safety_car, deg_params, base) for spec in specs]
+        for i, result in enumerate(results):
+            diff = result - results[reference]
+            # Antithetic pairs are averaged first: the pair means are the independent samples
+            if antithetic:
+                result = (result[:batch_size] + result[batch_size:]) / 2
+                diff = (diff[:batch_size] + diff[batch_size:]) / 2
+            times[i].update(result)
+            diffs[i].update(diff)
+        sims += len(results[0])
+
+        half_widths = np.array([half_width(d, z) for d in diffs])
+        half_widths[reference] = 0.0   # the reference against itself is exactly 0
+        enough = all(d.n >= min_samples for d in diffs)
+        converged = enough and bool((half_widths <= target_half_width).all())
+        if converged or sims >= max_sims:
+            break
+
+    return pd.DataFrame({
+        "Strategy": [spec.label for spec in specs],
+        "MeanRaceTime": [t.mean for t in times],
+        "DiffToReference": [d.mean for d in diffs],
+        "CILow": [d.mean - h for d, h in zip(diffs, half_widths)],
+        "CIHigh": [d.mean + h for d, h in zip(diffs, half_widths)],
+        "HalfWidth": half_widths,
+        "Sims": sims,
+        "Converged": converged,
+    })
@@ -0,0 +1,92 @@
+"""
+Pit-strategy optimizer: searches every 1-, 2- and 3-stop compound sequence and every pit lap with
+dynamic programming over the cumulative stint-cost table (tyre degradation model + pit-loss
+penalty), and returns the strategies ranked by expected race time.
+"""
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from Monte_Carlo_Engine import DEG_PARAMS, StrategySpec
+from Safety_Car import PIT_LOSS
+from Stint_Cost_Table import BASE_LAP_TIME, stint_cost_table
+
+
+# Function: Min-plus step of the DP
+# best[m] is the best time to cover m laps with the stints so far; adding one stint of
+# 'compound' gives new_best[m] = min over l of best[m - l] + cost(compound, l), l in [min_laps, max_laps]
+def _add_stint(best: np.ndarray, cost: np.ndarray, min_laps: int, max_laps: int):
+    race_laps = len(best) - 1
+    m = np.arange(race_laps + 1)[:, None]
+    l = np.arange(race_laps + 1)[None, :]
+    valid = (l >= min_laps) & (l <= max_laps) & (l <= m)
+    total = np.where(valid, best[np.clip(m - l, 0, None)] + cost[l], np.inf)
+    choice = total.argmin(axis=1)
+    return total[np.arange(race_laps + 1), choice], choice
+
+
+# Function: Rank every compound sequence with 1..max_stops stops by its optimal race time
+# min_stint_laps  → shortest allowed stint (at least 1 lap)
+# max_stint_laps  → optional {compound: longest stint} (tyre life limits)
+# two_compounds   → a dry race must use at least two different compounds
+def optimize_strategies(
+    race_laps: int = 57,
+    max_stops: int = 3,
+    deg_params: dict | None = None,
+    base: float = BASE_LAP_TIME,
+    pit_loss: float = PIT_LOSS,
+    min_stint_laps: int = 1,
+    max_stint_laps: dict | None = None,
+    two_compounds: bool = True,
+):
+    deg_params = DEG_PARAMS if deg_params is None else deg_params
+    table = stint_cost_table(deg_params, base)
+    table.reserve(race_laps)
+    compounds = list(deg_params)
+    max_stint_laps = max_stint_laps or {}
+
+    # best time/back-pointers per compound prefix, shared by all sequences with that prefix
+    start = np.full(race_laps + 1, np.inf)
+    start[0] = 0.0
+    prefixes = {(): (start, [])}
+
+    def solve(sequence):
+        if sequence not in prefixes:
+            best, choices = solve(sequence[:-1])
+            c = sequence[-1]
+            cost = table.cumulative[table.index[c], : race_laps + 1]
+            new_best, choice = _add_stint(best, cost, min_stint_laps, max_stint_laps.get(c, race_laps))
+            prefixes[sequence] = (new_best, choices + [choice])
+        return prefixes[sequence]
+
+    rows = []
+    for stops in range(1, max_stops + 1):
+        for sequence in product(compounds, repeat=stops + 1):
+            if two_compounds and len(set(sequence)) < 2:
+                continue
+            best, choices = solve(sequence)
+            if not np.isfinite(best[race_laps]):
+                continue
+
+            # Walk the back-pointers from the full race length to recover the stint lengths
+            lengths, m = [], race_laps
+            for choice in reversed(choices):
+                lengths.append(int(choice[m]))
+                m -= lengths[-1]
+            lengths.reverse()
+            pit_laps = tuple(int(p) for p in np.cumsum(lengths)[:-1])
+
+            rows.append({
+                "Strategy": " → ".join(sequence),
+                "Stops": stops,
+                "PitLaps": pit_laps,
+                "StintLaps": tuple(lengths),
+                "RaceTime": best[race_laps] + stops * pit_loss,
+                "Spec": StrategySpec(sequence, tuple((p, p) for p in pit_laps), race_laps, pit_loss),
+            })
+
+    columns = ["Strategy", "Stops", "PitLaps", "StintLaps", "RaceTime", "Spec"]
+    ranking = pd.DataFrame(rows, columns=columns).sort_values("RaceTime", ignore_index=True)
+    ranking["GapToBest"] = ranking["RaceTime"] - ranking["RaceTime"].min()
+    return ranking
@@ -0,0 +1,145 @@
+"""
+Constant-memory streaming summary of Monte Carlo outputs: running mean and variance, a fixed-bin
+histogram and approximate quantiles (P5/P50/P95 by default), updated batch by batch and mergeable
+across workers, so race times never have to be held as one big list.
+"""
+import numpy as np
+
+# Internal histogram resolution; quantiles are accurate to about (range / RESOLUTION)
+RESOLUTION = 4096
+
+
+# Class: Streaming summary of a stream of values
+# value_range → (low, high) of the histogram; None fixes it from the first batch (with margin).
+# Values outside the range are still counted in mean/variance/min/max and in under/overflow.
+class StreamingSummary:
+    def __init__(self, value_range: tuple[float, float] | None = None, resolution: int = RESOLUTION):
+        self.resolution = resolution
+        self.edges = None if value_range is None else np.linspace(*value_range, resolution + 1)
+        self.counts = np.zeros(resolution, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0   # sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+    # Method: Empty summary with the same histogram layout (used for per-worker partial results)
+    def empty_copy(self):
+        other = StreamingSummary(resolution=self.resolution)
+        other.edges = self.edges
+        return other
+
+    # Method: Add a batch of values
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        if self.edges is None:
+            low, high = values.min(), values.max()
+            margin = max(high - low, 1.0) * 0.5
+            self.edges = np.linspace(low - margin, high + margin, self.resolution + 1)
+
+        # Running mean/variance: combine the batch moments with the current ones (Chan et al.)
+        n_b = values.size
+        mean_b = values.mean()
+        m2_b = np.square(values - mean_b).sum()
+        self._combine(n_b, mean_b, m2_b)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        # Fixed-bin histogram
+        low, high = self.edges[0], self.edges[-1]
+        self.underflow += int((values < low).sum())
+        self.overflow += int((values > high).sum())
+        inside = values[(values >= low) & (values <= high)]
+        bins = ((inside - low) / (high - low) * self.resolution).astype(np.int64)
+        self.counts += np.bincount(np.minimum(bins, self.resolution - 1), minlength=self.resolution)
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b):
+        total = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / total
+        self.m2 += m2_b + delta**2 * self.n * n_b / total
+        self.n = total
+
+    # Method: Merge another summary with the same histogram layout into this one
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        if self.edges is None:
+            self.edges = other.edges
+        elif not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge summaries with different histogram ranges")
+        self._combine(other.n, other.mean, other.m2)
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    # Method: Approximate quantiles (q in [0, 1]) by inverting the histogram CDF
+    # The quantile is placed in the bin where the CDF reaches q * n, interpolating only inside
+    # that bin, so empty bins (gaps between discrete race times) never pull it off by more than a bin
+    def quantiles(self, q=(0.05, 0.5, 0.95)):
+        q = np.asarray(q, dtype=float)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        cdf = self.underflow + np.cumsum(self.counts)   # count up to the right edge of each bin
+        target = q * self.n
+        bins = np.minimum(np.searchsorted(cdf, target, side="left"), self.resolution - 1)
+        counts = self.counts[bins]
+        inside = np.divide(target - (cdf[bins] - counts), counts, out=np.zeros(q.shape), where=counts > 0)
+        width = self.edges[1] - self.edges[0]
+        result = self.edges[bins] + np.clip(inside, 0.0, 1.0) * width
+        # Targets in the under/overflow fall outside the histogram: clip to the observed extremes
+        result = np.where(target <= self.underflow, self.min, result)
+        result = np.where(target > cdf[-1], self.max, result)
+        return np.clip(result, self.min, self.max)
+
+    # Method: Histogram rebinned to 'bins' equal-width bins → (counts, edges)
+    # An empty summary gives zero counts over value_range (or its own fixed range); without any
+    # range there is nothing to bin yet and ValueError is raised
+    def histogram(self, bins: int = 70, value_range: tuple[float, float] | None = None):
+        if self.n == 0:
+            if value_range is None and self.edges is None:
+                raise ValueError("Empty StreamingSummary without a value_range: no histogram to draw yet")
+            low, high = (self.edges[0], self.edges[-1]) if value_range is None else value_range
+            return np.zeros(bins), np.linspace(low, high, bins + 1)
+        low, high = (self.min, self.max) if value_range is None else value_range
+        edges = np.linspace(low, high, bins + 1)
+        # Each internal bin goes whole to the display bin containing its centre
+        width = self.edges[1] - self.edges[0]
+        centres = self.edges[:-1] + width / 2
+        target = np.clip(np.searchsorted(edges, centres, side="right") - 1, 0, bins - 1)
+        inside = (centres >= low - width) & (centres <= high + width)
+        return np.bincount(target[inside], weights=self.counts[inside], minlength=bins), edges
+
+    # Method: Draw the histogram on a Matplotlib axis (like sns.histplot on the raw values)
+    def plot(self, ax=None, bins: int = 70, color: str | None = None):
+        counts, edges = self.histogram(bins)
+        import matplotlib.pyplot as plt
+
+        ax = plt.gca() if ax is None else ax
+        ax.stairs(counts, edges, fill=True, color=color, alpha=0.6, edgecolor="black")
+        ax.set_ylabel("Count")
+        return ax
+
+    def summary(self):
+        p5, p50, p95 = self.quantiles()
+        return {"n": self.n, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max,
+                "p5": p5, "p50": p50, "p95": p95}
+
+    def __repr__(self):
+        return f"StreamingSummary({self.summary()})"
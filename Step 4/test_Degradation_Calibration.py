@@ -0,0 +1,89 @@
+"""
+Tests for the degradation calibration: a, b and base are recovered from synthetic processed laps
+with known parameters (TrackStatus read back from CSV as float), and a calibration that fits
+nothing raises instead of writing an empty deg_params.yaml.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from Degradation_Calibration import FUEL_EFFECT, INITIAL_FUEL, calibrate, load_processed_sessions, write_deg_params
+from Stint_Cost_Table import load_deg_params, stint_cost_table_from_file
+
+TRUE_PARAMS = {
+    "Soft": {"a": 0.5, "b": 0.05, "base": 92.0},
+    "Medium": {"a": 0.3, "b": 0.04, "base": 92.5},
+    "Hard": {"a": 0.2, "b": 0.03, "base": 93.0},
+}
+RACE_LAPS = 50
+
+
+# Function: One synthetic race: 10 drivers, Soft or Medium → Hard, fuel burn, noise and some
+# VSC laps (TrackStatus "6", 3 s slower); TrackStatus is missing on a few clear laps
+def synthetic_race(rng: np.random.Generator) -> pd.DataFrame:
+    rows = []
+    for driver in range(10):
+        pit = int(rng.integers(15, 25))
+        first = "Soft" if driver % 2 else "Medium"
+        offset = rng.normal(0, 0.2)
+        for lap in range(1, RACE_LAPS + 1):
+            stint, compound, lap_in_stint = (1, first, lap) if lap <= pit else (2, "Hard", lap - pit)
+            p = TRUE_PARAMS[compound]
+            k = lap_in_stint - 1
+            time = p["base"] + offset + p["a"] * np.sqrt(k) + p["b"] * k
+            time -= (lap - 1) * INITIAL_FUEL / RACE_LAPS * FUEL_EFFECT
+            status = "1"
+            if rng.random() < 0.05:
+                status, time = "6", time + 3.0
+            elif rng.random() < 0.05:
+                status = None
+            rows.append({
+                "Driver": f"D{driver:02d}", "Stint": stint, "Compound": compound.upper(), "LapNumber": lap,
+                "LapInStint": lap_in_stint, "LapTimeSeconds": time + rng.normal(0, 0.05), "TrackStatus": status,
+            })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def processed_files(tmp_path):
+    rng = np.random.default_rng(14)
+    files = []
+    for gp in ("Bahrain", "Jeddah", "Melbourne", "Suzuka"):
+        path = tmp_path / f"{gp}_2025_R_processed.csv"
+        synthetic_race(rng).to_csv(path, index=False)
+        files.append(path)
+    return files
+
+
+def test_recovers_known_parameters(processed_files):
+    df = load_processed_sessions(processed_files)
+    assert df["TrackStatus"].dtype == float   # "1.0" / NaN once read back, the case that used to reject everything
+
+    fits = calibrate(df).set_index("Compound")
+    assert set(fits.index) == set(TRUE_PARAMS)
+    for compound, p in TRUE_PARAMS.items():
+        assert fits.loc[compound, "a"] == pytest.approx(p["a"], abs=0.05)
+        assert fits.loc[compound, "b"] == pytest.approx(p["b"], abs=0.005)
+        assert fits.loc[compound, "base"] == pytest.approx(p["base"], abs=0.15)
+    assert 0 < fits.attrs["rejected"]["track_status"] < 0.1 * len(df)
+
+
+def test_written_base_is_used_by_the_stint_cost_table(processed_files, tmp_path):
+    output_file = tmp_path / "deg_params.yaml"
+    write_deg_params(load_processed_sessions(processed_files), output_file)
+    params = load_deg_params(output_file)
+    table = stint_cost_table_from_file(output_file)
+    assert set(params) == set(TRUE_PARAMS)
+    for compound, entry in params.items():
+        assert entry["base"] == pytest.approx(TRUE_PARAMS[compound]["base"], abs=0.15)
+        assert table.lap_time(compound, 0) == pytest.approx(entry["base"])
+
+
+def test_nothing_fitted_raises_and_keeps_the_file(processed_files, tmp_path):
+    output_file = tmp_path / "deg_params.yaml"
+    output_file.write_text("Soft: {a: 0.05, b: 0.01}\n")
+    df = load_processed_sessions(processed_files).assign(TrackStatus=4)   # Safety Car all race
+
+    with pytest.raises(ValueError, match="No compound could be fitted"):
+        write_deg_params(df, output_file)
+    assert load_deg_params(output_file) == {"Soft": {"a": 0.05, "b": 0.01}}
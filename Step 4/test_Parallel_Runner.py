@@ -0,0 +1,20 @@
+"""
+Tests for the multi-core runner: the result depends only on the seed and the block layout, never
+on the number of worker processes, and the default block size leaves work for many cores.
+"""
+import numpy as np
+
+from Monte_Carlo_Engine import SOFT_MEDIUM, simulate_race_times
+from Parallel_Runner import BLOCK_SIZE, run_parallel
+
+
+def test_default_blocks_spread_a_million_races():
+    assert 1_000_000 // BLOCK_SIZE >= 16
+
+
+def test_result_independent_of_worker_count():
+    n = 4 * BLOCK_SIZE + 123
+    serial = run_parallel(simulate_race_times, n, SOFT_MEDIUM, seed=7, workers=1)
+    parallel = run_parallel(simulate_race_times, n, SOFT_MEDIUM, seed=7, workers=3)
+    assert len(serial) == n
+    np.testing.assert_array_equal(serial, parallel)
@@ -0,0 +1,43 @@
+"""
+Tests for the stint-cost tables: costs match the degradation formula, the table cache stays bounded
+over a parameter sweep, and tables read from deg_params.yaml follow changes to the file.
+"""
+import os
+
+import numpy as np
+import pytest
+import yaml
+
+import Stint_Cost_Table
+from Monte_Carlo_Engine import DEG_PARAMS
+from Stint_Cost_Table import TABLE_CACHE_SIZE, stint_cost_table, stint_cost_table_from_file
+
+
+def test_stint_cost_matches_formula():
+    table = stint_cost_table(DEG_PARAMS)
+    k = np.arange(150)   # longer than the default table: it grows on demand
+    soft = DEG_PARAMS["Soft"]
+    expected = (90.0 + soft["a"] * np.sqrt(k) + soft["b"] * k).sum()
+    assert table.stint_cost("Soft", 150) == pytest.approx(expected)
+    assert table.lap_time("Soft", 149) == pytest.approx(90.0 + soft["a"] * np.sqrt(149) + soft["b"] * 149)
+
+
+def test_cache_is_bounded_over_a_sweep():
+    Stint_Cost_Table._TABLES.clear()
+    kept = stint_cost_table(DEG_PARAMS)
+    for a in np.linspace(0.01, 0.1, 3 * TABLE_CACHE_SIZE):
+        stint_cost_table({"Soft": {"a": a, "b": 0.01}})
+        assert stint_cost_table(DEG_PARAMS) is kept   # recently used tables stay cached
+    assert len(Stint_Cost_Table._TABLES) == TABLE_CACHE_SIZE
+
+
+def test_file_table_follows_the_file(tmp_path):
+    path = tmp_path / "deg_params.yaml"
+    path.write_text(yaml.safe_dump({"Soft": {"a": 0.05, "b": 0.01}}))
+    first = stint_cost_table_from_file(path)
+    assert stint_cost_table_from_file(path) is first
+
+    path.write_text(yaml.safe_dump({"Soft": {"a": 0.05, "b": 0.01, "base": 95.0}}))
+    later = path.stat().st_mtime_ns + 1_000_000   # same size and timestamp granularity must not hide the change
+    os.utime(path, ns=(later, later))
+    assert stint_cost_table_from_file(path).lap_time("Soft", 0) == pytest.approx(95.0)
@@ -0,0 +1,41 @@
+"""
+Tests for compare_strategies convergence: undefined or too few-sample intervals never count as
+converged, the reference interval is exactly 0, and ordinary runs reach the target.
+"""
+import numpy as np
+import pytest
+
+from Monte_Carlo_Engine import MEDIUM_HARD, SOFT_HARD, SOFT_MEDIUM
+from Strategy_Comparison import compare_strategies, half_width
+from Streaming_Stats import StreamingSummary
+
+SPECS = [SOFT_MEDIUM, SOFT_HARD, MEDIUM_HARD]
+
+
+def test_half_width_undefined_below_two_samples():
+    assert half_width(StreamingSummary(), 1.96) == np.inf
+    assert half_width(StreamingSummary().update(np.array([3.0])), 1.96) == np.inf
+    assert half_width(StreamingSummary().update(np.array([1.0, 3.0])), 1.0) == pytest.approx(1.0)  # std √2 over √2 samples
+
+
+def test_single_sample_batches_are_not_converged():
+    result = compare_strategies(SPECS, batch_size=1, max_sims=2, target_half_width=1e9,
+                                rng=np.random.default_rng(0))
+    assert not result["Converged"].any()
+    assert np.isinf(result["HalfWidth"].iloc[1:]).all()
+
+
+def test_min_samples_required_before_target():
+    # A huge target is met by any finite interval, so only min_samples keeps the loop going
+    result = compare_strategies(SPECS, batch_size=5, target_half_width=1e9, min_samples=30,
+                                rng=np.random.default_rng(1))
+    assert result["Converged"].all()
+    assert result["Sims"].iloc[0] == 2 * 30
+
+
+def test_converges_to_target_with_reference_at_zero():
+    result = compare_strategies(SPECS, reference=0, batch_size=500, target_half_width=0.5,
+                                rng=np.random.default_rng(2))
+    assert result["Converged"].all()
+    assert (result["HalfWidth"] <= 0.5).all()
+    assert result.loc[0, ["DiffToReference", "HalfWidth"]].tolist() == [0.0, 0.0]
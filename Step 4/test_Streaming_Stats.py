@@ -0,0 +1,82 @@
+"""
+Tests for StreamingSummary (batch updates, merging partial summaries, quantiles against np.quantile,
+empty histograms) and its use in run_parallel.
+"""
+import numpy as np
+import pytest
+
+from Monte_Carlo_Engine import SOFT_HARD, SOFT_MEDIUM, simulate_race_times
+from Parallel_Runner import run_parallel
+from Streaming_Stats import StreamingSummary
+
+
+def test_merge_matches_single_pass():
+    values = np.random.default_rng(0).normal(5300, 20, 10_000)
+    whole = StreamingSummary(value_range=(5200, 5400)).update(values)
+    left = StreamingSummary(value_range=(5200, 5400)).update(values[:3000])
+    right = left.empty_copy().update(values[3000:])
+    merged = left.merge(right)
+
+    assert merged.n == whole.n
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.std == pytest.approx(values.std(ddof=1))
+    assert (merged.min, merged.max) == (values.min(), values.max())
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    np.testing.assert_allclose(merged.quantiles(), np.quantile(values, [0.05, 0.5, 0.95]), atol=0.2)
+
+
+def test_merge_into_empty_and_from_empty():
+    values = np.arange(10.0)
+    summary = StreamingSummary().merge(StreamingSummary(value_range=(0, 10)).update(values))
+    assert summary.n == 10 and summary.mean == pytest.approx(4.5)
+    assert summary.merge(StreamingSummary()).n == 10
+
+
+@pytest.mark.parametrize("spec", [SOFT_HARD, SOFT_MEDIUM])
+def test_quantiles_of_discrete_race_times_within_one_bin(spec):
+    # Only a handful of distinct race times (one per pit lap), with wide empty gaps between them
+    values = simulate_race_times(spec, 50_000, np.random.default_rng(5))
+    summary = StreamingSummary().update(values[:500]).update(values[500:])
+    width = summary.edges[1] - summary.edges[0]
+    q = [0.0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0]
+    np.testing.assert_allclose(summary.quantiles(q), np.quantile(values, q), atol=width)
+
+
+def test_quantiles_of_continuous_values_within_one_bin():
+    values = np.random.default_rng(6).normal(5300, 20, 100_000)
+    summary = StreamingSummary(value_range=(5250, 5350)).update(values)   # tails in under/overflow
+    width = summary.edges[1] - summary.edges[0]
+    np.testing.assert_allclose(summary.quantiles([0.05, 0.5, 0.95]), np.quantile(values, [0.05, 0.5, 0.95]),
+                               atol=2 * width)
+    assert summary.quantiles([0.0, 1.0]).tolist() == [values.min(), values.max()]
+
+
+def test_empty_histogram():
+    with pytest.raises(ValueError, match="value_range"):
+        StreamingSummary().histogram()
+    counts, edges = StreamingSummary().histogram(bins=10, value_range=(0, 1))
+    assert counts.sum() == 0 and len(edges) == 11
+    counts, edges = StreamingSummary(value_range=(5100, 5800)).histogram(bins=7)
+    assert counts.sum() == 0 and (edges[0], edges[-1]) == (5100, 5800)
+
+
+def test_merge_rejects_different_ranges():
+    a = StreamingSummary().update([1.0, 2.0])
+    b = StreamingSummary().update([100.0, 200.0])
+    with pytest.raises(ValueError, match="different histogram ranges"):
+        a.merge(b)
+
+
+def test_run_parallel_requires_value_range():
+    with pytest.raises(ValueError, match="value_range"):
+        run_parallel(simulate_race_times, 1000, SOFT_MEDIUM, seed=1, workers=1, block_size=250,
+                     summary=StreamingSummary())
+
+
+def test_run_parallel_summary_matches_values():
+    values = run_parallel(simulate_race_times, 1000, SOFT_MEDIUM, seed=1, workers=1, block_size=250)
+    summary = run_parallel(simulate_race_times, 1000, SOFT_MEDIUM, seed=1, workers=2, block_size=250,
+                           summary=StreamingSummary(value_range=(5100, 5800)))
+    assert summary.n == len(values) == 1000
+    assert summary.mean == pytest.approx(values.mean())
+    assert (summary.min, summary.max) == (values.min(), values.max())